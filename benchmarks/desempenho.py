@@ -0,0 +1,344 @@
+"""
+Medidas de desempenho das classes centrais do truco.
+
+Mede o tempo por chamada de `Baralho.distribui_cartas`, `Jogada.quem_ganhou`,
+`Mao.mao_acabou` e `Ponto.proximo`, a vazão de jogos completos entre máquinas
+com `InterfaceSilenciosa` e a memória alocada por jogo. Cada medida é
+repetida em várias rodadas independentes; guarda-se a mediana e o ruído
+(o desvio absoluto mediano das rodadas, relativo à mediana, que uma rodada
+discrepante não infla). Os resultados são gravados em JSON e comparados com
+uma referência guardada, apontando as medidas que pioraram além da
+tolerância somada ao ruído medido, limitado a RUIDO_MAXIMO. O script termina
+com código 1 quando alguma medida regrediu, a não ser com `--so-informa`.
+
+Uso:
+    python benchmarks/desempenho.py [--saida resultado.json]
+                                    [--referencia benchmarks/referencia.json]
+                                    [--tolerancia 0.2] [--rodadas 5]
+                                    [--so-informa] [--atualiza-referencia]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from truco.baralho import Baralho
+from truco.interface import InterfaceSilenciosa
+from truco.jogada import Jogada, Vencedor
+from truco.jogador import Jogador, TipoJogador
+from truco.jogo import Jogo
+from truco.mao import Mao
+from truco.ponto import Ponto, TipoPontos
+
+REFERENCIA = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          "referencia.json")
+
+# Maior ruído somado à tolerância: acima disso, uma medida instável ainda
+# aponta pioras grandes
+RUIDO_MAXIMO = 0.1
+
+# Converte o desvio absoluto mediano no desvio padrão, para dados normais
+_ESCALA_DAM = 1.4826
+
+
+def _tempo_por_chamada(funcao, repeticoes: int = 7) -> float:
+    """
+    Mede o tempo de uma chamada, o menor entre várias repetições.
+
+    Args:
+        funcao (callable): Função sem argumentos a medir.
+        repeticoes (int, opcional): Número de repetições. Padrão é 7.
+
+    Returns:
+        float: Nanossegundos por chamada.
+    """
+    temporizador = timeit.Timer(funcao)
+    numero, _ = temporizador.autorange()
+    return min(temporizador.repeat(repeticoes, numero)) / numero * 1e9
+
+
+def mede_distribui_cartas() -> float:
+    """
+    Mede `Baralho.distribui_cartas`.
+
+    Returns:
+        float: Nanossegundos por distribuição.
+    """
+    baralho = Baralho(rng=np.random.default_rng(0))
+    return _tempo_por_chamada(baralho.distribui_cartas)
+
+
+def mede_quem_ganhou() -> float:
+    """
+    Mede `Jogada.quem_ganhou` sobre um par fixo de cartas.
+
+    Returns:
+        float: Nanossegundos por jogada.
+    """
+    cartas = Baralho().cartas_por_id
+    jogada = Jogada()
+    carta_A, carta_B = cartas[0], cartas[1]
+    return _tempo_por_chamada(lambda: jogada.quem_ganhou(carta_A, carta_B))
+
+
+def mede_mao_acabou() -> float:
+    """
+    Mede `Mao.mao_acabou` após duas jogadas divididas, o caso mais longo.
+
+    Returns:
+        float: Nanossegundos por verificação.
+    """
+    mao = Mao()
+    mao.vencedor_jogadas = [Vencedor.A, Vencedor.B]
+    return _tempo_por_chamada(mao.mao_acabou)
+
+
+def mede_ponto_proximo() -> float:
+    """
+    Mede `Ponto.proximo`.
+
+    Returns:
+        float: Nanossegundos por chamada.
+    """
+    return _tempo_por_chamada(Ponto(TipoPontos.Truco).proximo)
+
+
+def _prepara_jogos(semente: int) -> tuple:
+    """
+    Cria o jogo, o baralho e os jogadores usados nas medidas de jogos.
+
+    Args:
+        semente (int): Semente do gerador aleatório.
+
+    Returns:
+        tuple: (jogo, jogador_A, jogador_B, baralho).
+    """
+    rng = np.random.default_rng(semente)
+    jogo = Jogo(InterfaceSilenciosa(rng), rng)
+    return (jogo, Jogador("A", TipoJogador.MAQUINA),
+            Jogador("B", TipoJogador.MAQUINA), Baralho(rng=rng))
+
+
+def mede_jogos_por_segundo(num_jogos: int = 1000,
+                           repeticoes: int = 3) -> float:
+    """
+    Mede a vazão de jogos completos entre máquinas, sem entrada nem saída.
+
+    Args:
+        num_jogos (int, opcional): Jogos por repetição. Padrão é 1000.
+        repeticoes (int, opcional): Número de repetições. Padrão é 3.
+
+    Returns:
+        float: Jogos por segundo, na repetição mais rápida.
+    """
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        jogo, jogador_A, jogador_B, baralho = _prepara_jogos(0)
+        inicio = time.perf_counter()
+        for _ in range(num_jogos):
+            jogo.comecar(jogador_A, jogador_B, baralho)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return num_jogos / melhor
+
+
+def mede_memoria_por_jogo(num_jogos: int = 200) -> float:
+    """
+    Mede o pico médio de memória alocada durante um jogo completo.
+
+    Args:
+        num_jogos (int, opcional): Número de jogos. Padrão é 200.
+
+    Returns:
+        float: Bytes alocados no pico de cada jogo, em média.
+    """
+    jogo, jogador_A, jogador_B, baralho = _prepara_jogos(0)
+    jogo.comecar(jogador_A, jogador_B, baralho)
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(num_jogos):
+            tracemalloc.reset_peak()
+            antes, _ = tracemalloc.get_traced_memory()
+            jogo.comecar(jogador_A, jogador_B, baralho)
+            total += tracemalloc.get_traced_memory()[1] - antes
+    finally:
+        tracemalloc.stop()
+    return total / num_jogos
+
+
+# Medidas: nome -> (função, unidade, se valores maiores são melhores)
+MEDIDAS = {
+    "distribui_cartas": (mede_distribui_cartas, "ns", False),
+    "jogada_quem_ganhou": (mede_quem_ganhou, "ns", False),
+    "mao_acabou": (mede_mao_acabou, "ns", False),
+    "ponto_proximo": (mede_ponto_proximo, "ns", False),
+    "jogos_por_segundo": (mede_jogos_por_segundo, "jogos/s", True),
+    "memoria_por_jogo": (mede_memoria_por_jogo, "bytes", False),
+}
+
+
+def ruido(amostras: list) -> float:
+    """
+    Calcula o ruído de uma medida a partir das suas rodadas.
+
+    O ruído é o desvio absoluto mediano, escalado para estimar o desvio
+    padrão e dividido pela mediana. Ao contrário da amplitude, ele não é
+    inflado por uma única rodada discrepante.
+
+    Args:
+        amostras (list[float]): Valor de cada rodada.
+
+    Returns:
+        float: Ruído relativo à mediana.
+    """
+    mediana = statistics.median(amostras)
+    if not mediana:
+        return 0.
+    desvios = [abs(amostra - mediana) for amostra in amostras]
+    return _ESCALA_DAM * statistics.median(desvios) / abs(mediana)
+
+
+def executa(nomes=None, rodadas: int = 5) -> dict:
+    """
+    Executa as medidas, cada uma em várias rodadas.
+
+    Args:
+        nomes (list[str], opcional): Medidas a executar. Padrão é todas.
+        rodadas (int, opcional): Rodadas de cada medida. Padrão é 5.
+
+    Returns:
+        dict: Resultado em formato JSON, com a plataforma e, para cada
+            medida, a mediana das rodadas ("valor"), o ruído (veja
+            `ruido`) e as amostras.
+    """
+    medidas = {}
+    for nome in nomes or MEDIDAS:
+        funcao, unidade, maior_melhor = MEDIDAS[nome]
+        amostras = [funcao() for _ in range(rodadas)]
+        medidas[nome] = {"valor": round(statistics.median(amostras), 2),
+                         "unidade": unidade,
+                         "maior_melhor": maior_melhor,
+                         "ruido": round(ruido(amostras), 4),
+                         "amostras": [round(amostra, 2)
+                                      for amostra in amostras]}
+    return {
+        "plataforma": {"python": platform.python_version(),
+                       "numpy": np.__version__,
+                       "maquina": platform.machine(),
+                       "sistema": platform.system()},
+        "medidas": medidas,
+    }
+
+
+def compara(resultado: dict, referencia: dict, tolerancia: float) -> list:
+    """
+    Compara um resultado com a referência.
+
+    A variação é a mudança relativa do custo da medida (tempo ou memória
+    por operação, ou o inverso da vazão), com sinal negativo quando ela
+    piorou: uma medida duas vezes mais lenta tem variação de -100%. Uma
+    medida regride quando piora mais que a tolerância somada ao maior ruído,
+    do resultado ou da referência, limitado a RUIDO_MAXIMO. O ruído é
+    recalculado das amostras, quando guardadas.
+
+    Args:
+        resultado (dict): Resultado de `executa`.
+        referencia (dict): Resultado guardado como referência.
+        tolerancia (float): Piora relativa aceita além do ruído.
+
+    Returns:
+        list: Tuplas (nome, valor, referência, variação, limiar, regrediu),
+            onde o limiar é a piora relativa aceita.
+    """
+    linhas = []
+    for nome, medida in resultado["medidas"].items():
+        anterior = referencia["medidas"].get(nome)
+        if anterior is None:
+            continue
+        variacao = 1 - medida["valor"] / anterior["valor"]
+        if medida["maior_melhor"]:
+            variacao = 1 - anterior["valor"] / medida["valor"]
+        ruidos = [ruido(m["amostras"]) if "amostras" in m
+                  else m.get("ruido", 0.) for m in (medida, anterior)]
+        limiar = tolerancia + min(max(ruidos), RUIDO_MAXIMO)
+        linhas.append((nome, medida["valor"], anterior["valor"], variacao,
+                       limiar, variacao < -limiar))
+    return linhas
+
+
+def main(argumentos=None) -> int:
+    """
+    Executa as medidas pela linha de comando.
+
+    Args:
+        argumentos (list[str], opcional): Argumentos da linha de comando.
+
+    Returns:
+        int: 1 se alguma medida regrediu em relação à referência e
+            `--so-informa` não foi pedido, 0 caso contrário.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--saida", help="arquivo JSON onde gravar o resultado")
+    parser.add_argument("--referencia", default=REFERENCIA,
+                        help="arquivo JSON de referência")
+    parser.add_argument("--tolerancia", type=float, default=0.2,
+                        help="piora relativa aceita além do ruído "
+                             "(padrão 0.2)")
+    parser.add_argument("--rodadas", type=int, default=5,
+                        help="rodadas de cada medida (padrão 5)")
+    parser.add_argument("--so-informa", action="store_true",
+                        help="não termina com código 1 quando alguma medida "
+                             "regrediu")
+    parser.add_argument("--atualiza-referencia", action="store_true",
+                        help="grava o resultado como nova referência")
+    parser.add_argument("medidas", nargs="*",
+                        help=f"medidas a executar, entre {', '.join(MEDIDAS)} "
+                             "(padrão: todas)")
+    args = parser.parse_args(argumentos)
+    desconhecidas = set(args.medidas) - set(MEDIDAS)
+    if desconhecidas:
+        parser.error(f"medidas desconhecidas: {', '.join(sorted(desconhecidas))}")
+
+    resultado = executa(args.medidas, args.rodadas)
+    if args.saida:
+        with open(args.saida, "w") as arquivo:
+            json.dump(resultado, arquivo, indent=2)
+    if args.atualiza_referencia:
+        with open(args.referencia, "w") as arquivo:
+            json.dump(resultado, arquivo, indent=2)
+            arquivo.write("\n")
+
+    referencia = None
+    if os.path.exists(args.referencia) and not args.atualiza_referencia:
+        with open(args.referencia) as arquivo:
+            referencia = json.load(arquivo)
+
+    regrediu = False
+    if referencia is None:
+        for nome, medida in resultado["medidas"].items():
+            print(f"{nome:20s} {medida['valor']:>14,.2f} {medida['unidade']:8s} "
+                  f"(ruído {medida['ruido']:.1%})")
+    else:
+        if referencia["plataforma"] != resultado["plataforma"]:
+            print("Aviso: a referência foi medida em outra plataforma.")
+        for nome, valor, anterior, variacao, limiar, piorou in compara(
+                resultado, referencia, args.tolerancia):
+            unidade = resultado["medidas"][nome]["unidade"]
+            marca = "  REGRESSÃO" if piorou else ""
+            print(f"{nome:20s} {valor:>14,.2f} {unidade:8s} "
+                  f"(referência {anterior:,.2f}, {variacao:+.1%}, "
+                  f"limiar -{limiar:.1%}){marca}")
+            regrediu = regrediu or piorou
+    return 1 if regrediu and not args.so_informa else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
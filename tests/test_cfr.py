@@ -0,0 +1,32 @@
+import numpy as np
+from truco.cfr import PoliticaCFR, TreinadorCFR
+
+
+def test_checkpoint_continua_com_semente_padrao(tmp_path):
+    """Um treino sem semente grava um checkpoint que pode ser retomado."""
+    caminho = str(tmp_path / "cfr.npz")
+    treinador = TreinadorCFR(caminho=caminho, num_processos=1)
+    treinador.treina(50)
+
+    retomado = TreinadorCFR(caminho=caminho, num_processos=1)
+    assert retomado.semente == treinador.semente
+    assert retomado.iteracoes == 50
+    assert np.array_equal(retomado.soma_estrategias,
+                          treinador.soma_estrategias)
+    retomado.treina(50)
+    assert retomado.iteracoes == 100
+    PoliticaCFR.carrega(caminho)
+
+
+def test_checkpoint_retomado_repete_o_treino(tmp_path):
+    """Retomar um checkpoint dá o mesmo resultado que treinar de uma vez."""
+    caminho = str(tmp_path / "cfr.npz")
+    direto = TreinadorCFR(num_processos=1, semente=7,
+                          iteracoes_por_rodada=30)
+    direto.treina(60)
+    TreinadorCFR(caminho=caminho, num_processos=1, semente=7,
+                 iteracoes_por_rodada=30).treina(30)
+    retomado = TreinadorCFR(caminho=caminho, num_processos=1,
+                            iteracoes_por_rodada=30)
+    retomado.treina(30)
+    assert np.array_equal(retomado.arrependimento, direto.arrependimento)
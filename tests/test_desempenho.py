@@ -0,0 +1,51 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "benchmarks"))
+
+import desempenho
+
+
+def _medida(amostras, maior_melhor=False):
+    return {"valor": sorted(amostras)[len(amostras) // 2], "unidade": "ns",
+            "maior_melhor": maior_melhor, "amostras": amostras}
+
+
+def test_ruido_ignora_rodada_discrepante():
+    """Uma única rodada discrepante não infla o ruído."""
+    assert desempenho.ruido([30., 32., 33., 35., 57.]) < 0.1
+
+
+def test_compara_aponta_piora_alem_do_limiar():
+    """Uma piora de 32% é apontada mesmo com a referência ruidosa."""
+    referencia = {"medidas": {"a": _medida([3800., 3808., 3810., 9000., 3000.])}}
+    resultado = {"medidas": {"a": _medida([5020., 5027., 5030., 5031., 5040.])}}
+    (_, _, _, variacao, limiar, regrediu), = desempenho.compara(
+        resultado, referencia, 0.2)
+    assert round(variacao, 2) == -0.32
+    assert limiar <= 0.2 + desempenho.RUIDO_MAXIMO
+    assert regrediu
+
+
+def test_compara_tolera_variacao_pequena():
+    """Uma diferença dentro da tolerância não é apontada."""
+    referencia = {"medidas": {"a": _medida([100., 101., 99.], True)}}
+    resultado = {"medidas": {"a": _medida([90., 91., 89.], True)}}
+    (*_, regrediu), = desempenho.compara(resultado, referencia, 0.2)
+    assert not regrediu
+
+
+def test_regressao_termina_com_erro(tmp_path, monkeypatch):
+    """O script termina com código 1 quando há regressão, salvo se só informa."""
+    caminho = str(tmp_path / "referencia.json")
+    monkeypatch.setitem(desempenho.MEDIDAS, "memoria_por_jogo",
+                        (lambda: 1000., "bytes", False))
+    desempenho.main(["--referencia", caminho, "--rodadas", "1",
+                     "--atualiza-referencia", "memoria_por_jogo"])
+    monkeypatch.setitem(desempenho.MEDIDAS, "memoria_por_jogo",
+                        (lambda: 2000., "bytes", False))
+    argumentos = ["--referencia", caminho, "--rodadas", "1",
+                  "memoria_por_jogo"]
+    assert desempenho.main(argumentos) == 1
+    assert desempenho.main(argumentos + ["--so-informa"]) == 0
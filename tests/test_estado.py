@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from truco.baralho import Baralho
+from truco.estado import EstadoCompacto
+from truco.jogada import Vencedor
+from truco.jogador import Jogador
+from truco.mao import Mao
+
+
+def _ordenadas(cartas) -> list:
+    return sorted(cartas, key=lambda carta: carta.indice)
+
+
+def test_estado_ida_e_volta():
+    """Codificar e reconstruir uma mão preserva o estado e o placar."""
+    rng = np.random.default_rng(0)
+    baralho = Baralho(rng=rng)
+    for _ in range(300):
+        mao = Mao()
+        mao.coleta_cartas(baralho)
+        for _ in range(int(rng.integers(3))):
+            if mao.mao_acabou():
+                break
+            mao.quem_ganhou_jogada(int(rng.integers(len(mao.cartas_A))),
+                                   int(rng.integers(len(mao.cartas_B))))
+        for _ in range(int(rng.integers(5))):
+            mao.aumenta_pontos()
+        mao.vez = (Vencedor.A, Vencedor.B)[int(rng.integers(2))]
+        if rng.random() < 0.5:
+            mao.carta_na_mesa = mao.cartas_A[0] if mao.cartas_A else None
+        jogador_A, jogador_B = Jogador("A"), Jogador("B")
+        jogador_A.pontos, jogador_B.pontos = map(int, rng.integers(0, 32, 2))
+
+        estado = EstadoCompacto.de_mao(mao, jogador_A, jogador_B)
+        refeita = estado.para_mao(baralho)
+        assert refeita.cartas_A == _ordenadas(mao.cartas_A)
+        assert refeita.cartas_B == _ordenadas(mao.cartas_B)
+        assert refeita.vencedor_jogadas == mao.vencedor_jogadas
+        assert refeita.conta_vitorias() == mao.conta_vitorias()
+        assert refeita.pontos is mao.pontos
+        assert refeita.vez is mao.vez
+        assert refeita.carta_na_mesa is mao.carta_na_mesa
+        outro_A, outro_B = Jogador("A"), Jogador("B")
+        estado.aplica_placar(outro_A, outro_B)
+        assert (outro_A.pontos, outro_B.pontos) == (jogador_A.pontos,
+                                                    jogador_B.pontos)
+        assert EstadoCompacto.de_mao(refeita, outro_A, outro_B).bits == \
+            estado.bits
+
+
+@pytest.mark.parametrize("pontos", [-1, 32])
+def test_placar_fora_do_campo(pontos):
+    """Um placar que não cabe em 5 bits é recusado."""
+    mao = Mao()
+    mao.coleta_cartas(Baralho(rng=np.random.default_rng(1)))
+    jogador = Jogador("A")
+    jogador.pontos = pontos
+    with pytest.raises(ValueError):
+        EstadoCompacto.de_mao(mao, jogador, Jogador("B"))
+    with pytest.raises(ValueError):
+        EstadoCompacto.de_mao(mao, Jogador("B"), jogador)
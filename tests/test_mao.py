@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from truco.baralho import Baralho
+from truco.jogada import Vencedor
+from truco.mao import Mao
+from truco.ponto import Ponto, TipoPontos
+
+
+def _estado(mao: Mao) -> tuple:
+    return (list(mao.cartas_A), list(mao.cartas_B), mao.vencedor_jogadas,
+            mao.conta_vitorias(), mao.quem_ganhou_a_mao(), mao.mao_acabou(),
+            mao.pontos, mao.carta_na_mesa, list(mao.cartas_jogadas))
+
+
+def test_lances_desfeitos_restauram_a_mao():
+    """Uma sequência aleatória de lances desfeita volta ao estado original."""
+    rng = np.random.default_rng(0)
+    baralho = Baralho(rng=rng)
+    for _ in range(300):
+        mao = Mao()
+        mao.coleta_cartas(baralho)
+        # Estado antes de cada lance e a carta posta na mesa antes dele
+        lances = []
+        while not mao.mao_acabou():
+            antes = _estado(mao)
+            if rng.random() < 0.3 and not mao.mao_vale_queda():
+                lances.append((antes, None))
+                mao.aumenta_pontos()
+            else:
+                # Quem abre põe a carta na mesa antes do lance, como em Jogo
+                mao.carta_na_mesa = mao.cartas_A[0]
+                lances.append((antes, mao.carta_na_mesa))
+                mao.quem_ganhou_jogada(int(rng.integers(len(mao.cartas_A))),
+                                       int(rng.integers(len(mao.cartas_B))))
+        while lances:
+            mao.desfaz()
+            antes, carta_na_mesa = lances.pop()
+            if carta_na_mesa is not None:
+                assert mao.carta_na_mesa is carta_na_mesa
+                mao.carta_na_mesa = None
+            assert _estado(mao) == antes
+        with pytest.raises(IndexError):
+            mao.desfaz()
+
+
+def test_contagem_segue_vencedores_atribuidos():
+    """Atribuir os vencedores recontabiliza as vitórias."""
+    mao = Mao()
+    mao.vencedor_jogadas = [Vencedor.A, Vencedor.Nenhum]
+    assert mao.conta_vitorias() == (1, 0)
+    assert mao.mao_acabou()
+    mao.adiciona_vencedor(Vencedor.B)
+    assert mao.vencedor_jogadas == (Vencedor.A, Vencedor.Nenhum, Vencedor.B)
+    assert mao.quem_ganhou_a_mao() is Vencedor.Nenhum
+
+
+def test_vencedores_somente_leitura():
+    """Os vencedores não podem ser alterados por fora dos lances."""
+    mao = Mao()
+    with pytest.raises(AttributeError):
+        mao.vencedor_jogadas.append(Vencedor.A)
+    assert mao.conta_vitorias() == (0, 0)
+    mao.aumenta_pontos(Ponto(TipoPontos.Seis))
+    mao.desfaz()
+    assert mao.pontos is Ponto(TipoPontos.Comum)
@@ -0,0 +1,16 @@
+import pytest
+from truco.ponto import Ponto, TipoPontos
+
+
+def test_proximo_nao_altera_o_ponto():
+    """`proximo` retorna o nível seguinte sem alterar o atual."""
+    ponto = Ponto(TipoPontos.Comum)
+    assert ponto.proximo() is Ponto(TipoPontos.Truco)
+    assert ponto is Ponto(TipoPontos.Comum)
+    assert Ponto(TipoPontos.Queda).proximo() is None
+
+
+def test_aumenta_nao_e_ignorado_em_silencio():
+    """O antigo `aumenta` levanta um erro que aponta para `proximo`."""
+    with pytest.raises(AttributeError, match="proximo"):
+        Ponto(TipoPontos.Comum).aumenta()
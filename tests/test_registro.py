@@ -0,0 +1,74 @@
+import os
+import numpy as np
+from truco.baralho import Baralho
+from truco.interface import InterfaceSilenciosa
+from truco.jogada import Vencedor
+from truco.jogador import Jogador, TipoJogador
+from truco.jogo import Jogo
+from truco.registro import (ACEITE, CORRIDA, PEDIDO, TAMANHO_CABECALHO,
+                            TAMANHO_REGISTRO, GravadorPartidas,
+                            ReprodutorPartidas, codifica_aposta,
+                            decodifica_aposta, le_registros)
+
+
+def _joga(gravador: GravadorPartidas, num_jogos: int, semente: int):
+    rng = np.random.default_rng(semente)
+    baralho = Baralho(rng=rng)
+    jogo = Jogo(InterfaceSilenciosa(rng), rng, gravador)
+    for _ in range(num_jogos):
+        jogo.comecar(Jogador("A", TipoJogador.MAQUINA),
+                     Jogador("B", TipoJogador.MAQUINA), baralho)
+
+
+def test_aposta_codificada_em_um_byte():
+    """Os eventos de aposta ocupam um byte e voltam iguais."""
+    for tipo in (PEDIDO, ACEITE, CORRIDA):
+        for jogador in (Vencedor.A, Vencedor.B):
+            for nivel in range(5):
+                for rodada in range(3):
+                    byte = codifica_aposta(tipo, jogador, nivel, rodada)
+                    assert 0 < byte < 256
+                    assert decodifica_aposta(byte) == (tipo, jogador, nivel,
+                                                       rodada)
+
+
+def test_gravacao_leitura_e_auditoria(tmp_path):
+    """As mãos gravadas são lidas de volta e a auditoria não acusa nada."""
+    caminho = str(tmp_path / "partidas.trlog")
+    with GravadorPartidas(caminho, tamanho_buffer=256) as gravador:
+        _joga(gravador, 50, 0)
+    assert TAMANHO_REGISTRO == 33
+    registros = le_registros(caminho)
+    assert len(registros) == gravador.num_registros > 50
+    assert os.path.getsize(caminho) == (TAMANHO_CABECALHO
+                                        + len(registros) * TAMANHO_REGISTRO)
+    assert registros["jogo"].tolist() == sorted(registros["jogo"].tolist())
+    assert len(set(registros["jogo"].tolist())) == 50
+    assert ReprodutorPartidas().audita(caminho) == []
+
+    # Um placar adulterado é acusado
+    with open(caminho, "r+b") as arquivo:
+        arquivo.seek(TAMANHO_CABECALHO + TAMANHO_REGISTRO - 1)
+        arquivo.write(bytes([int(registros["pontos"][0, 1]) + 5]))
+    assert ReprodutorPartidas().audita(caminho)
+
+
+def test_reabre_descartando_registro_incompleto(tmp_path):
+    """Um registro pela metade no final é descartado ao reabrir o arquivo."""
+    caminho = str(tmp_path / "partidas.trlog")
+    with GravadorPartidas(caminho) as gravador:
+        _joga(gravador, 10, 1)
+    num_registros = gravador.num_registros
+    with open(caminho, "ab") as arquivo:
+        arquivo.write(b"\x07" * (TAMANHO_REGISTRO // 2))
+    assert len(le_registros(caminho)) == num_registros
+
+    with GravadorPartidas(caminho) as gravador:
+        assert gravador.num_registros == num_registros
+        assert os.path.getsize(caminho) == (TAMANHO_CABECALHO
+                                            + num_registros * TAMANHO_REGISTRO)
+        _joga(gravador, 10, 2)
+    registros = le_registros(caminho)
+    assert len(registros) == gravador.num_registros > num_registros
+    assert sorted(set(registros["jogo"].tolist())) == list(range(20))
+    assert ReprodutorPartidas().audita(caminho) == []
@@ -0,0 +1,38 @@
+import numpy as np
+from truco.baralho import Baralho
+from truco.cfr import NUM_ACOES, AbstracaoCFR, PoliticaCFR, _normaliza
+from truco.interface import InterfaceSilenciosa
+from truco.jogador import Jogador, TipoJogador
+from truco.jogo import Jogo
+from truco.mcts import EstrategiaMCTS
+from truco.regras import PAULISTA
+
+
+def test_estrategias_jogam_com_manilha_variavel():
+    """CFR e MCTS jogam partidas completas com as regras paulistas."""
+    rng = np.random.default_rng(0)
+    baralho = Baralho(rng=rng)
+    abstracao = AbstracaoCFR()
+    politica = PoliticaCFR(
+        _normaliza(np.zeros((abstracao.num_conjuntos, NUM_ACOES)), abstracao),
+        abstracao, rng)
+    for _ in range(5):
+        jogador_cfr = Jogador("CFR", TipoJogador.CFR, politica)
+        jogador_mcts = Jogador("MCTS", TipoJogador.MCTS,
+                               EstrategiaMCTS(iteracoes=20, rng=rng))
+        jogo = Jogo(InterfaceSilenciosa(rng), rng, regras=PAULISTA)
+        vencedor = jogo.comecar(jogador_cfr, jogador_mcts, baralho)
+        assert vencedor.pontos >= 12
+
+
+def test_valores_seguem_a_vira():
+    """Os valores do baralho e das estratégias são os da vira da mão."""
+    rng = np.random.default_rng(1)
+    baralho = Baralho(rng=rng, regras=PAULISTA)
+    avulso = Baralho()
+    for _ in range(20):
+        baralho.distribui_cartas()
+        valores = [carta.valor for carta in baralho.cartas_por_id]
+        assert baralho.valores.tolist() == valores
+        assert [carta.valor for carta
+                in avulso.cartas_da_vira(baralho.vira)] == valores
@@ -0,0 +1,63 @@
+import asyncio
+import json
+from truco.servidor import LIMITE_LINHA, ServidorTruco, cliente_robo
+
+PERGUNTAS = ("escolhe_carta", "pergunta_truco", "responde_truco")
+
+
+async def _conecta(servidor: ServidorTruco, nome: str):
+    leitor, escritor = await asyncio.open_connection(
+        servidor.host, servidor.porta, limit=LIMITE_LINHA)
+    escritor.write(json.dumps({"tipo": "entrar", "nome": nome,
+                               "adversario": "humano"}).encode() + b"\n")
+    return leitor, escritor
+
+
+async def _espera_pergunta(leitor: asyncio.StreamReader) -> dict:
+    while True:
+        mensagem = json.loads(await leitor.readline())
+        if mensagem["tipo"] in PERGUNTAS + ("abandono", "fim"):
+            return mensagem
+
+
+async def _linha_longa_abandona():
+    servidor = ServidorTruco(tempo_resposta=5)
+    await servidor.inicia()
+    try:
+        conexoes = [await _conecta(servidor, "um")]
+        await asyncio.sleep(0.05)
+        conexoes.append(await _conecta(servidor, "dois"))
+        esperas = [asyncio.ensure_future(_espera_pergunta(leitor))
+                   for leitor, _ in conexoes]
+        prontas, _ = await asyncio.wait(esperas,
+                                        return_when=asyncio.FIRST_COMPLETED)
+        quem = esperas.index(prontas.pop())
+        assert esperas[quem].result()["tipo"] in PERGUNTAS
+        conexoes[quem][1].write(b"x" * (2 * LIMITE_LINHA) + b"\n")
+        outro = 1 - quem
+        mensagem = await asyncio.wait_for(esperas[outro], 5)
+        while mensagem["tipo"] in PERGUNTAS:
+            mensagem = await asyncio.wait_for(
+                _espera_pergunta(conexoes[outro][0]), 5)
+        for _, escritor in conexoes:
+            escritor.close()
+        return mensagem
+    finally:
+        await servidor.encerra()
+
+
+def test_linha_longa_e_abandono():
+    """Uma linha acima do limite conta como abandono e avisa o adversário."""
+    assert asyncio.run(_linha_longa_abandona())["tipo"] == "abandono"
+
+
+def test_partida_contra_maquina():
+    """Um cliente robô joga uma partida completa contra a máquina."""
+    async def joga():
+        servidor = ServidorTruco()
+        await servidor.inicia()
+        try:
+            return await cliente_robo(servidor.host, servidor.porta)
+        finally:
+            await servidor.encerra()
+    assert asyncio.run(joga())["tipo"] == "fim"
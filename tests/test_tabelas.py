@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from truco.baralho import Baralho
+from truco.regras import PAULISTA
+from truco.tabelas import IndiceMaos
+
+
+def test_indice_coincide_com_indices():
+    """O índice de uma mão é o mesmo por cartas e por identificadores."""
+    baralho = Baralho(rng=np.random.default_rng(0))
+    indice = IndiceMaos(baralho)
+    for _ in range(200):
+        ids, _ = baralho.distribui_cartas(como_ids=True)
+        cartas = [baralho.cartas_por_id[iden] for iden in ids]
+        assert indice.indice(cartas) == indice.indices(np.array(ids))
+        assert tuple(indice.maos[indice.indice(cartas)]) == \
+            indice.canonica(cartas)
+
+
+def test_indice_usa_valores_com_manilha_variavel():
+    """Com manilha variável, as mãos são indexadas pelos valores das cartas."""
+    baralho = Baralho(rng=np.random.default_rng(1), regras=PAULISTA)
+    indice = IndiceMaos(baralho)
+    assert indice.num_maos == IndiceMaos().num_maos
+    canonicas = {tuple(mao) for mao in indice.maos.tolist()}
+    for _ in range(500):
+        for cartas in baralho.distribui_cartas():
+            canonica = indice.canonica(cartas)
+            if canonica in canonicas:
+                assert tuple(indice.maos[indice.indice(cartas)]) == canonica
+            else:
+                with pytest.raises(ValueError):
+                    indice.indice(cartas)
+
+    # Sob esta vira há quatro cartas de valor 4, que são só duas com
+    # manilhas fixas
+    cartas = [carta for carta in baralho.cartas_por_id if carta.valor == 4]
+    assert len(cartas) == 4
+    with pytest.raises(ValueError):
+        indice.indice(cartas[:3])
@@ -0,0 +1,43 @@
+import numpy as np
+from truco.torneio import SPRT, ResultadoConfronto, Torneio
+
+
+def _torneio(vitorias_i: int, vitorias_j: int) -> Torneio:
+    torneio = Torneio(num_processos=1, semente=0)
+    torneio.registra("i")
+    torneio.registra("j")
+    torneio.vitorias[0, 1] = vitorias_i
+    torneio.vitorias[1, 0] = vitorias_j
+    return torneio
+
+
+def test_sprt_aceitar_h0_nao_e_o_outro_mais_forte():
+    """Com as vitórias divididas, o teste aceita H0 nos dois sentidos."""
+    sprt = SPRT()
+    assert sprt.decide(3000, 3000) == -1
+    assert _torneio(3000, 3000)._decide(0, 1) == \
+        ResultadoConfronto.EQUIVALENTES
+
+
+def test_confronto_aponta_o_mais_forte():
+    """Um placar desequilibrado aponta o lado certo."""
+    assert _torneio(70, 10)._decide(0, 1) == ResultadoConfronto.I_MAIS_FORTE
+    assert _torneio(10, 70)._decide(0, 1) == ResultadoConfronto.J_MAIS_FORTE
+    assert _torneio(10, 10)._decide(0, 1) == ResultadoConfronto.INCONCLUSIVO
+
+
+def test_jogadores_iguais_raramente_sao_separados():
+    """Com força igual, um jogador é apontado como mais forte em até 2 alfa."""
+    rng = np.random.default_rng(0)
+    separados = 0
+    repeticoes = 200
+    for _ in range(repeticoes):
+        torneio = _torneio(0, 0)
+        decisao = ResultadoConfronto.INCONCLUSIVO
+        while not decisao:
+            vitorias = rng.binomial(40, 0.5)
+            torneio.vitorias[0, 1] += vitorias
+            torneio.vitorias[1, 0] += 40 - vitorias
+            decisao = torneio._decide(0, 1)
+        separados += decisao != ResultadoConfronto.EQUIVALENTES
+    assert separados / repeticoes < 2 * 0.05 + 0.05
@@ -0,0 +1,116 @@
+import numpy as np
+
+
+class FonteAleatoria:
+    """
+    Fonte única de números aleatórios, dividida em fluxos independentes.
+
+    Cada fluxo é um `numpy.random.Generator` sobre `numpy.random.Philox`, um
+    gerador baseado em contador: a chave do Philox é derivada da entropia da
+    fonte e de uma chave de fluxo (uma tupla de inteiros, como
+    (processo, confronto, jogo)), e o contador começa em zero. O mesmo fluxo
+    pode então ser recriado em qualquer processo, sem comunicação e sem
+    depender da ordem em que os fluxos são pedidos, o que permite repetir
+    exatamente uma distribuição de cartas ou um jogo inteiro.
+
+    A fonte guarda só a entropia e a chave, então pode ser enviada a
+    processos de trabalho com pickle.
+
+    Atributos:
+        entropia (int): Entropia da fonte; sorteada se não houver semente.
+        chave (tuple[int]): Prefixo das chaves dos fluxos desta fonte.
+
+    Métodos:
+        semente(*chave): Retorna a SeedSequence de um fluxo.
+        fluxo(*chave): Cria o gerador de um fluxo.
+        subfonte(*chave): Cria uma fonte cujos fluxos ficam sob a chave.
+    """
+
+    def __init__(self, semente=None):
+        """
+        Inicializa uma nova instância da classe FonteAleatoria.
+
+        Args:
+            semente (int ou numpy.random.SeedSequence, opcional): Semente da
+                fonte. Se não for fornecida, a entropia é sorteada uma vez e
+                fica registrada em `entropia`.
+        """
+        if not isinstance(semente, np.random.SeedSequence):
+            semente = np.random.SeedSequence(semente)
+        self.entropia = semente.entropy
+        self.chave = tuple(semente.spawn_key)
+
+    def semente(self, *chave) -> np.random.SeedSequence:
+        """
+        Retorna a SeedSequence de um fluxo.
+
+        Args:
+            *chave (int): Chave do fluxo.
+
+        Returns:
+            numpy.random.SeedSequence: A semente do fluxo.
+        """
+        return np.random.SeedSequence(self.entropia,
+                                      spawn_key=self.chave + chave)
+
+    def fluxo(self, *chave) -> np.random.Generator:
+        """
+        Cria o gerador de um fluxo.
+
+        Chamadas com a mesma chave retornam geradores novos, na mesma
+        posição inicial, que produzem a mesma sequência.
+
+        Args:
+            *chave (int): Chave do fluxo.
+
+        Returns:
+            numpy.random.Generator: Gerador Philox do fluxo.
+        """
+        return np.random.Generator(np.random.Philox(self.semente(*chave)))
+
+    def subfonte(self, *chave) -> "FonteAleatoria":
+        """
+        Cria uma fonte cujos fluxos ficam sob a chave dada.
+
+        Args:
+            *chave (int): Chave da subfonte.
+
+        Returns:
+            FonteAleatoria: A subfonte.
+        """
+        return FonteAleatoria(self.semente(*chave))
+
+    def __repr__(self):
+        """
+        Retorna uma representação detalhada da fonte para depuração.
+
+        Returns:
+            str: Representação da fonte.
+        """
+        return f"FonteAleatoria(entropia={self.entropia}, chave={self.chave})"
+
+
+if __name__ == "__main__":
+    import functools
+    import sys
+    from .mcts import EstrategiaMCTS
+    from .jogador import TipoJogador
+    from .torneio import Participante, _joga_bloco
+    from .baralho import ARQUIVO_CARTAS
+
+    # Compara a variância da taxa de vitória estimada em jogos independentes
+    # e em jogos duplicados (mesmas cartas, lugares trocados).
+    num_blocos = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    jogos_por_bloco = 20
+    mcts = Participante("MCTS", TipoJogador.MCTS,
+                        functools.partial(EstrategiaMCTS, iteracoes=50))
+    maquina = Participante("Máquina")
+    fonte = FonteAleatoria(0)
+    for duplicata in (False, True):
+        taxas = np.array([
+            _joga_bloco(mcts, maquina, fonte.subfonte(bloco), 0,
+                        jogos_por_bloco, ARQUIVO_CARTAS, duplicata)
+            for bloco in range(num_blocos)]) / jogos_por_bloco
+        print(f"{'duplicado' if duplicata else 'independente':12s} "
+              f"taxa média {taxas.mean():.3f} | "
+              f"variância por bloco {taxas.var(ddof=1):.5f}")
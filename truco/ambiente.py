@@ -0,0 +1,805 @@
+import enum
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+import numpy as np
+from .aleatorio import FonteAleatoria
+from .baralho import Baralho, ARQUIVO_CARTAS
+from .jogada import Vencedor
+from .ponto import TipoPontos
+from .vetorizado import NIVEL_QUEDA, PONTOS_VITORIA, VALORES_NIVEL
+
+
+class Acao(enum.IntEnum):
+    """
+    Enumera as ações do agente no ambiente.
+
+    Valores:
+        CARTA_0, CARTA_1, CARTA_2 (0 a 2): Jogar a carta da posição 0, 1 ou 2
+            da mão, na ordem em que foi distribuída.
+        PEDIR_TRUCO (3): Pedir o próximo nível da aposta, em vez de jogar.
+        ACEITAR (4): Aceitar o pedido do adversário.
+        CORRER (5): Correr do pedido do adversário.
+        AUMENTAR (6): Pedir o nível seguinte ao pedido do adversário.
+    """
+    CARTA_0 = 0
+    CARTA_1 = 1
+    CARTA_2 = 2
+    PEDIR_TRUCO = 3
+    ACEITAR = 4
+    CORRER = 5
+    AUMENTAR = 6
+
+
+NUM_ACOES = len(Acao)
+
+# Fase da decisão pendente em cada mesa
+_TURNO = 0      # joga uma carta ou pede truco
+_RESPOSTA = 1   # responde a um pedido
+_CARTA = 2      # joga uma carta, depois de um pedido aceito no mesmo turno
+NUM_FASES = 3
+
+NUM_CARTAS = 40
+NUM_NIVEIS = len(TipoPontos)
+
+# Posição de cada parte no vetor de observação, sempre do ponto de vista
+# do agente
+OBS_MAO = 0                                  # 3 x 40: carta de cada posição da mão
+OBS_MINHAS = OBS_MAO + 3 * NUM_CARTAS        # 40: cartas que o agente já jogou
+OBS_DELE = OBS_MINHAS + NUM_CARTAS           # 40: cartas que o adversário já jogou
+OBS_MESA = OBS_DELE + NUM_CARTAS             # 40: carta do adversário na mesa
+OBS_NIVEL = OBS_MESA + NUM_CARTAS            # 5: valor atual da mão (TipoPontos)
+OBS_PEDIDO = OBS_NIVEL + NUM_NIVEIS          # 5: valor pedido, na resposta
+OBS_FASE = OBS_PEDIDO + NUM_NIVEIS           # 3: decisão pendente
+OBS_JOGADAS = OBS_FASE + NUM_FASES           # 3 x 3: ganhei, perdi, empatou
+OBS_PLACAR = OBS_JOGADAS + 9                 # 2: meus pontos, pontos dele (/12)
+OBS_ABRE = OBS_PLACAR + 2                    # 1: o agente abriu a jogada
+TAMANHO_OBSERVACAO = OBS_ABRE + 1
+
+_A = Vencedor.A.value
+_B = Vencedor.B.value
+_NENHUM = Vencedor.Nenhum.value
+
+# Forma (sem a dimensão das mesas) e tipo de cada saída do ambiente
+FORMATOS_SAIDAS = (((TAMANHO_OBSERVACAO,), np.float32),
+                   ((NUM_ACOES,), np.bool_),
+                   ((), np.float32),
+                   ((), np.bool_))
+
+
+def aloca_saidas(num_mesas: int, buffer=None) -> tuple:
+    """
+    Aloca os arrays de saída de um ambiente com `num_mesas` mesas.
+
+    Args:
+        num_mesas (int): Número de mesas.
+        buffer (buffer, opcional): Memória onde criar os arrays, um após o
+            outro e alinhados em 8 bytes, com pelo menos
+            `tamanho_saidas(num_mesas)` bytes. Se não for fornecida, os
+            arrays são alocados com zeros.
+
+    Returns:
+        tuple: (observacoes, mascaras, recompensas, terminados).
+    """
+    saidas = []
+    deslocamento = 0
+    for forma, dtype in FORMATOS_SAIDAS:
+        forma = (num_mesas,) + forma
+        if buffer is None:
+            saidas.append(np.zeros(forma, dtype=dtype))
+        else:
+            saida = np.frombuffer(buffer, dtype, int(np.prod(forma)),
+                                  deslocamento)
+            saidas.append(saida.reshape(forma))
+            deslocamento += _alinha(saida.nbytes)
+    return tuple(saidas)
+
+
+def tamanho_saidas(num_mesas: int) -> int:
+    """
+    Retorna o número de bytes das saídas de um ambiente.
+
+    Args:
+        num_mesas (int): Número de mesas.
+
+    Returns:
+        int: Bytes ocupados pelos arrays de `aloca_saidas` em um buffer.
+    """
+    return sum(_alinha(num_mesas * int(np.prod(forma))
+                       * np.dtype(dtype).itemsize)
+               for forma, dtype in FORMATOS_SAIDAS)
+
+
+def _alinha(num_bytes: int) -> int:
+    """
+    Arredonda um número de bytes para o múltiplo de 8 seguinte.
+    """
+    return -(-num_bytes // 8) * 8
+
+
+class AmbienteVetorizado:
+    """
+    Ambiente vetorizado, no estilo do Gym, para treinar agentes de truco.
+
+    O ambiente mantém `num_mesas` jogos simultâneos entre o agente e um
+    jogador máquina, com as mesmas regras de `Jogo` e as mesmas decisões
+    aleatórias do jogador máquina de `Interface`. O estado de todas as mesas
+    fica em arrays do NumPy, como em `SimuladorVetorizado`, e cada chamada
+    de `avanca` (`step`) recebe uma ação por mesa, aplica-a e avança o jogo, incluindo
+    as decisões do adversário, até a próxima decisão do agente. Quando um
+    jogo termina, a mesa recomeça sozinha, com o agente sorteado para A ou
+    B e quem abre sorteado.
+
+    As observações, as máscaras de ações permitidas, as recompensas e os
+    indicadores de fim de jogo são escritos a cada passo nos mesmos arrays,
+    alocados na criação do ambiente: o chamador deve copiá-los se quiser
+    guardá-los.
+
+    A observação de cada mesa é um vetor de `TAMANHO_OBSERVACAO` posições
+    (float32), com codificação one-hot das cartas da mão do agente por
+    posição, das cartas já jogadas por cada um, da carta do adversário na
+    mesa, do valor da mão, do valor pedido e da decisão pendente, além do
+    resultado das jogadas, do placar e de quem abriu a jogada. As posições
+    de cada parte são as constantes OBS_* deste módulo.
+
+    Atributos:
+        num_mesas (int): Número de mesas.
+        baralho (Baralho): Baralho usado nas distribuições.
+        rng (numpy.random.Generator): Gerador usado em todos os sorteios.
+        observacoes (numpy.ndarray): (num_mesas, TAMANHO_OBSERVACAO), float32.
+        mascaras (numpy.ndarray): (num_mesas, NUM_ACOES), bool: ações
+            permitidas em cada mesa.
+        recompensas (numpy.ndarray): (num_mesas,), float32: 1 se o agente
+            venceu um jogo no último passo, -1 se perdeu, 0 caso contrário.
+        terminados (numpy.ndarray): (num_mesas,), bool: se um jogo terminou
+            no último passo; a observação já é a do jogo seguinte.
+
+    Os métodos também têm os nomes da API do Gym, `reset` e `step`.
+
+    Métodos:
+        reinicia(semente): Começa novos jogos em todas as mesas.
+        avanca(acoes): Aplica uma ação por mesa e avança até a próxima decisão.
+    """
+
+    def __init__(self, num_mesas: int = 1024, semente=None,
+                 arquivo_csv: str = ARQUIVO_CARTAS, saidas: tuple = None):
+        """
+        Inicializa uma nova instância da classe AmbienteVetorizado.
+
+        Args:
+            num_mesas (int, opcional): Número de mesas. Padrão é 1024.
+            semente (int ou numpy.random.SeedSequence, opcional): Semente do
+                gerador aleatório.
+            arquivo_csv (str, opcional): Caminho para o arquivo CSV das cartas.
+            saidas (tuple, opcional): Arrays já alocados (observacoes,
+                mascaras, recompensas, terminados), com as formas e tipos
+                dos atributos, onde o ambiente escreve suas saídas. Se não
+                forem fornecidos, são alocados aqui.
+
+        Raises:
+            ValueError: Se o baralho não tiver NUM_CARTAS cartas.
+        """
+        self.num_mesas = num_mesas
+        self.rng = np.random.default_rng(semente)
+        self.baralho = Baralho(arquivo_csv, self.rng)
+        if self.baralho.num_cartas != NUM_CARTAS:
+            raise ValueError(f"O ambiente requer um baralho de {NUM_CARTAS} "
+                             f"cartas.")
+        self._valores = self.baralho.valores
+
+        # Saídas
+        if saidas is None:
+            saidas = aloca_saidas(num_mesas)
+        (self.observacoes, self.mascaras, self.recompensas,
+         self.terminados) = saidas
+
+        # Estado das mesas; lugares são 0 (A) e 1 (B)
+        self._linhas = np.arange(num_mesas)
+        # int16, para somar aos deslocamentos da observação
+        self.cartas = np.zeros((num_mesas, 2, 3), dtype=np.int16)
+        self.restantes = np.zeros((num_mesas, 2, 3), dtype=bool)
+        # Carta jogada por cada lugar em cada jogada, ou -1
+        self.jogadas = np.full((num_mesas, 2, 3), -1, dtype=np.int16)
+        self.vencedores = np.zeros((num_mesas, 3), dtype=np.int8)
+        self.rodada = np.zeros(num_mesas, dtype=np.int8)
+        self.nivel = np.zeros(num_mesas, dtype=np.int16)
+        self.pedido = np.zeros(num_mesas, dtype=np.int16)
+        self.pontos = np.zeros((num_mesas, 2), dtype=np.int16)
+        self.abre = np.zeros(num_mesas, dtype=np.int8)
+        self.vez = np.zeros(num_mesas, dtype=np.int8)
+        # Dono do turno: volta a jogar depois que o pedido é aceito
+        self.dono = np.zeros(num_mesas, dtype=np.int8)
+        self.proponente = np.zeros(num_mesas, dtype=np.int8)
+        self.fase = np.zeros(num_mesas, dtype=np.int16)
+        self.agente = np.zeros(num_mesas, dtype=np.int8)
+
+    def reinicia(self, semente=None) -> tuple:
+        """
+        Começa novos jogos em todas as mesas.
+
+        Args:
+            semente (int ou numpy.random.SeedSequence, opcional): Se
+                fornecida, reinicia o gerador aleatório com ela.
+
+        Returns:
+            tuple: (observacoes, mascaras), os arrays do ambiente.
+        """
+        if semente is not None:
+            self.rng = np.random.default_rng(semente)
+            self.baralho = Baralho(self.baralho.arquivo_csv, self.rng)
+        self.recompensas.fill(0)
+        self.terminados.fill(False)
+        self._novo_jogo(self._linhas)
+        self._joga_adversario()
+        self._observa()
+        return self.observacoes, self.mascaras
+
+    def avanca(self, acoes) -> tuple:
+        """
+        Aplica uma ação do agente em cada mesa e avança até a próxima decisão.
+
+        Args:
+            acoes (numpy.ndarray): Uma ação (Acao) por mesa, entre as
+                permitidas por `mascaras`.
+
+        Returns:
+            tuple: (observacoes, recompensas, terminados, mascaras), os
+                arrays do ambiente.
+
+        Raises:
+            ValueError: Se alguma ação não for permitida em sua mesa.
+        """
+        acoes = np.asarray(acoes)
+        if not self.mascaras[self._linhas, acoes].all():
+            mesa = int(np.flatnonzero(~self.mascaras[self._linhas, acoes])[0])
+            raise ValueError(f"Ação {Acao(int(acoes[mesa])).name} não "
+                             f"permitida na mesa {mesa}.")
+        self.recompensas.fill(0)
+        self.terminados.fill(False)
+        self._aplica(self._linhas, acoes)
+        self._joga_adversario()
+        self._observa()
+        return self.observacoes, self.recompensas, self.terminados, self.mascaras
+
+    reset = reinicia
+    step = avanca
+
+    def _novo_jogo(self, idx: np.ndarray):
+        """
+        Começa novos jogos nas mesas indicadas.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas.
+        """
+        self.pontos[idx] = 0
+        self.agente[idx] = self.rng.random(idx.size) >= 0.5
+        self._nova_mao(idx, self.rng.random(idx.size) >= 0.5)
+
+    def _nova_mao(self, idx: np.ndarray, abre: np.ndarray):
+        """
+        Distribui as cartas de uma nova mão nas mesas indicadas.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas.
+            abre (numpy.ndarray): Lugar que abre a mão em cada mesa.
+        """
+        self.cartas[idx] = self.baralho.distribui_lote(idx.size)
+        self.restantes[idx] = True
+        self.jogadas[idx] = -1
+        self.vencedores[idx] = _NENHUM
+        self.rodada[idx] = 0
+        self.nivel[idx] = 0
+        self.abre[idx] = abre
+        self.vez[idx] = abre
+        self.dono[idx] = abre
+        self.fase[idx] = _TURNO
+
+    def _aplica(self, idx: np.ndarray, acoes: np.ndarray):
+        """
+        Aplica a ação do jogador da vez nas mesas indicadas.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas.
+            acoes (numpy.ndarray): A ação de cada mesa.
+        """
+        carta = acoes <= Acao.CARTA_2
+        if carta.any():
+            self._joga_carta(idx[carta], acoes[carta])
+
+        # Um pedido ou um aumento passa a vez a quem deve responder
+        pede = (acoes == Acao.PEDIR_TRUCO) | (acoes == Acao.AUMENTAR)
+        if pede.any():
+            mesas = idx[pede]
+            self.pedido[mesas] = np.where(acoes[pede] == Acao.PEDIR_TRUCO,
+                                          self.nivel[mesas] + 1,
+                                          self.pedido[mesas] + 1)
+            self.proponente[mesas] = self.vez[mesas]
+            self.vez[mesas] = 1 - self.vez[mesas]
+            self.fase[mesas] = _RESPOSTA
+
+        # Aceito o pedido, o dono do turno joga sua carta
+        aceita = idx[acoes == Acao.ACEITAR]
+        self.nivel[aceita] = self.pedido[aceita]
+        self.vez[aceita] = self.dono[aceita]
+        self.fase[aceita] = _CARTA
+
+        # Quem pediu recebe o valor anterior ao pedido e abre a próxima mão
+        corre = idx[acoes == Acao.CORRER]
+        if corre.size:
+            self._encerra_mao(corre, self.proponente[corre],
+                              VALORES_NIVEL[self.pedido[corre] - 1])
+
+    def _joga_carta(self, idx: np.ndarray, posicao: np.ndarray):
+        """
+        Joga uma carta da mão do jogador da vez nas mesas indicadas.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas.
+            posicao (numpy.ndarray): Posição da carta na mão de cada mesa.
+        """
+        lugar = self.vez[idx]
+        rodada = self.rodada[idx]
+        self.restantes[idx, lugar, posicao] = False
+        self.jogadas[idx, lugar, rodada] = self.cartas[idx, lugar, posicao]
+
+        # Quem abre a jogada passa a vez ao adversário
+        primeira = lugar == self.abre[idx]
+        mesas = idx[primeira]
+        self.vez[mesas] = 1 - self.vez[mesas]
+        self.dono[mesas] = self.vez[mesas]
+        self.fase[mesas] = _TURNO
+
+        mesas = idx[~primeira]
+        if mesas.size:
+            self._resolve_jogada(mesas)
+
+    def _resolve_jogada(self, idx: np.ndarray):
+        """
+        Compara as cartas da jogada e encerra as mãos que terminaram.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas em que as duas cartas
+                foram jogadas.
+        """
+        rodada = self.rodada[idx]
+        carta_A = self._valores[self.jogadas[idx, 0, rodada]]
+        carta_B = self._valores[self.jogadas[idx, 1, rodada]]
+        vencedor = np.where(carta_A > carta_B, _A,
+                            np.where(carta_B > carta_A, _B, _NENHUM))
+        self.vencedores[idx, rodada] = vencedor
+        self.abre[idx] = np.where(vencedor == _A, 0,
+                                  np.where(vencedor == _B, 1, self.abre[idx]))
+        rodada += 1
+        self.rodada[idx] = rodada
+
+        # Mesmas regras de Mao.mao_acabou
+        vencedores = self.vencedores[idx]
+        vitorias_A = np.count_nonzero(vencedores == _A, axis=1)
+        vitorias_B = np.count_nonzero(vencedores == _B, axis=1)
+        acabou = (rodada >= 3) | ((rodada == 2) & (
+            (vitorias_A == 2) | (vitorias_B == 2)
+            | (vencedores[:, 0] == _NENHUM) | (vencedores[:, 1] == _NENHUM)))
+
+        continua = idx[~acabou]
+        self.vez[continua] = self.abre[continua]
+        self.dono[continua] = self.abre[continua]
+        self.fase[continua] = _TURNO
+
+        # Empate dá os pontos a B, como em Jogo.comecar
+        fim = idx[acabou]
+        if fim.size:
+            ganhador = np.where(vitorias_A[acabou] > vitorias_B[acabou], 0, 1)
+            self._encerra_mao(fim, ganhador, VALORES_NIVEL[self.nivel[fim]])
+
+    def _encerra_mao(self, idx: np.ndarray, ganhador: np.ndarray,
+                     valor: np.ndarray):
+        """
+        Pontua as mãos encerradas e começa a próxima mão ou o próximo jogo.
+
+        A próxima mão é aberta por quem abriria a jogada seguinte: quem
+        venceu a última jogada ou, quando alguém correu, quem fez o pedido.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas.
+            ganhador (numpy.ndarray): Lugar que recebe os pontos da mão.
+            valor (numpy.ndarray): Pontos da mão.
+        """
+        self.pontos[idx, ganhador] += valor
+        abre = np.where(self.fase[idx] == _RESPOSTA, ganhador, self.abre[idx])
+        fim = (self.pontos[idx] >= PONTOS_VITORIA).any(axis=1)
+
+        mesas = idx[fim]
+        self.terminados[mesas] = True
+        self.recompensas[mesas] = np.where(ganhador[fim] == self.agente[mesas],
+                                           1., -1.)
+        self._novo_jogo(mesas)
+        self._nova_mao(idx[~fim], abre[~fim])
+
+    def _joga_adversario(self):
+        """
+        Joga as decisões do adversário até que todas as mesas esperem o agente.
+
+        O adversário decide como o jogador máquina de `Interface`: pede
+        truco com probabilidade 1/2, responde com probabilidades 0,33, 0,33
+        e 0,34 (ou 1/2 e 1/2, quando não se pode aumentar) e joga uma carta
+        ao acaso entre as que restam.
+        """
+        while True:
+            idx = np.flatnonzero(self.vez != self.agente)
+            if not idx.size:
+                return
+            fase = self.fase[idx]
+            sorteio = self.rng.random(idx.size)
+            acoes = self._carta_ao_acaso(idx)
+
+            turno = (fase == _TURNO) & (self.nivel[idx] < NIVEL_QUEDA)
+            acoes[turno & (sorteio < 0.5)] = Acao.PEDIR_TRUCO
+
+            resposta = fase == _RESPOSTA
+            queda = self.pedido[idx] >= NIVEL_QUEDA
+            acoes[resposta] = np.where(
+                queda[resposta],
+                np.where(sorteio[resposta] < 0.5, Acao.ACEITAR, Acao.CORRER),
+                np.where(sorteio[resposta] < 0.33, Acao.ACEITAR,
+                         np.where(sorteio[resposta] < 0.66, Acao.CORRER,
+                                  Acao.AUMENTAR)))
+            self._aplica(idx, acoes)
+
+    def _carta_ao_acaso(self, idx: np.ndarray) -> np.ndarray:
+        """
+        Sorteia uma carta entre as que restam na mão do jogador da vez.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas.
+
+        Returns:
+            numpy.ndarray: A posição da carta sorteada em cada mesa.
+        """
+        chaves = self.rng.random((idx.size, 3))
+        chaves[~self.restantes[idx, self.vez[idx]]] = -1.
+        return chaves.argmax(axis=1)
+
+    def _observa(self):
+        """
+        Escreve as observações e as máscaras do ponto de vista do agente.
+        """
+        obs = self.observacoes
+        linhas = self._linhas
+        eu = self.agente
+        ele = 1 - eu
+        obs.fill(0.)
+
+        for posicao in range(3):
+            tem = self.restantes[linhas, eu, posicao]
+            obs[linhas[tem], OBS_MAO + posicao * NUM_CARTAS
+                + self.cartas[linhas[tem], eu[tem], posicao]] = 1.
+        for rodada in range(3):
+            for deslocamento, lugar in ((OBS_MINHAS, eu), (OBS_DELE, ele)):
+                carta = self.jogadas[linhas, lugar, rodada]
+                jogou = carta >= 0
+                obs[linhas[jogou], deslocamento + carta[jogou]] = 1.
+            # Resultado das jogadas concluídas, do ponto de vista do agente
+            feita = self.rodada > rodada
+            vencedor = self.vencedores[:, rodada]
+            resultado = np.where(vencedor == _NENHUM, 2,
+                                 np.where(vencedor - 1 == eu, 0, 1))
+            obs[linhas[feita], OBS_JOGADAS + 3 * rodada + resultado[feita]] = 1.
+
+        # Carta do adversário na mesa: ele abriu a jogada e já jogou
+        carta = self.jogadas[linhas, ele, self.rodada.clip(max=2)]
+        na_mesa = (self.abre == ele) & (carta >= 0)
+        obs[linhas[na_mesa], OBS_MESA + carta[na_mesa]] = 1.
+
+        obs[linhas, OBS_NIVEL + self.nivel] = 1.
+        resposta = self.fase == _RESPOSTA
+        obs[linhas[resposta], OBS_PEDIDO + self.pedido[resposta]] = 1.
+        obs[linhas, OBS_FASE + self.fase] = 1.
+        obs[:, OBS_PLACAR] = self.pontos[linhas, eu]
+        obs[:, OBS_PLACAR + 1] = self.pontos[linhas, ele]
+        obs[:, OBS_PLACAR:OBS_PLACAR + 2] /= PONTOS_VITORIA
+        obs[:, OBS_ABRE] = self.abre == eu
+
+        # Ações permitidas
+        mascaras = self.mascaras
+        joga = self.fase != _RESPOSTA
+        mascaras[:, :3] = self.restantes[linhas, eu] & joga[:, None]
+        mascaras[:, Acao.PEDIR_TRUCO] = ((self.fase == _TURNO)
+                                         & (self.nivel < NIVEL_QUEDA))
+        mascaras[:, Acao.ACEITAR] = resposta
+        mascaras[:, Acao.CORRER] = resposta
+        mascaras[:, Acao.AUMENTAR] = resposta & (self.pedido < NIVEL_QUEDA)
+
+
+# Comandos do treinador para os processos de AmbienteParalelo
+_AVANCA = 0
+_REINICIA = 1
+_ENCERRA = 2
+
+# Intervalo, em segundos, entre as verificações de que os processos vivem
+_ESPERA = 1.0
+
+
+def _vistas(buffer, num_mesas: int, num_processos: int) -> tuple:
+    """
+    Cria os arrays de AmbienteParalelo sobre a memória compartilhada.
+
+    A memória contém, nesta ordem, as saídas de todas as mesas
+    (`aloca_saidas`), a ação de cada mesa e o comando de cada processo. Os
+    arrays mantêm a memória exportada, então ela não pode ser fechada
+    enquanto algum deles existir.
+
+    Args:
+        buffer (buffer): Memória compartilhada, com pelo menos
+            `_tamanho_memoria(num_mesas, num_processos)` bytes.
+        num_mesas (int): Número total de mesas.
+        num_processos (int): Número de processos.
+
+    Returns:
+        tuple: (saidas, acoes, comandos), onde `comandos` tem, para cada
+            processo, o comando e a semente do comando.
+    """
+    saidas = aloca_saidas(num_mesas, buffer)
+    deslocamento = tamanho_saidas(num_mesas)
+    acoes = np.frombuffer(buffer, np.int64, num_mesas, deslocamento)
+    comandos = np.frombuffer(buffer, np.int64, 2 * num_processos,
+                             deslocamento + acoes.nbytes)
+    comandos = comandos.reshape(num_processos, 2)
+    return saidas, acoes, comandos
+
+
+def _tamanho_memoria(num_mesas: int, num_processos: int) -> int:
+    """
+    Retorna o número de bytes da memória compartilhada de AmbienteParalelo.
+    """
+    return tamanho_saidas(num_mesas) + 8 * num_mesas + 16 * num_processos
+
+
+def _trabalha(nome: str, num_mesas: int, num_processos: int, processo: int,
+              inicio: int, fim: int, semente: np.random.SeedSequence,
+              arquivo_csv: str, pedido, pronto):
+    """
+    Executa as mesas de um processo de AmbienteParalelo até ser encerrado.
+
+    Args:
+        nome (str): Nome da memória compartilhada.
+        num_mesas (int): Número total de mesas.
+        num_processos (int): Número de processos.
+        processo (int): Índice deste processo.
+        inicio (int): Primeira mesa deste processo.
+        fim (int): Mesa seguinte à última deste processo.
+        semente (numpy.random.SeedSequence): Semente das mesas do processo.
+        arquivo_csv (str): Caminho para o arquivo CSV das cartas.
+        pedido (multiprocessing.Semaphore): Liberado pelo treinador quando
+            há um comando para o processo.
+        pronto (multiprocessing.Semaphore): Liberado pelo processo quando o
+            comando foi executado.
+    """
+    memoria = shared_memory.SharedMemory(name=nome)
+    try:
+        _executa_comandos(memoria.buf, num_mesas, num_processos, processo,
+                          inicio, fim, semente, arquivo_csv, pedido, pronto)
+    finally:
+        # Os arrays sobre a memória já foram liberados em _executa_comandos
+        memoria.close()
+
+
+def _executa_comandos(buffer, num_mesas: int, num_processos: int,
+                      processo: int, inicio: int, fim: int,
+                      semente: np.random.SeedSequence, arquivo_csv: str,
+                      pedido, pronto):
+    """
+    Laço de comandos de `_trabalha`, com os mesmos argumentos.
+    """
+    saidas, acoes, comandos = _vistas(buffer, num_mesas, num_processos)
+    ambiente = AmbienteVetorizado(fim - inicio, semente, arquivo_csv,
+                                  tuple(saida[inicio:fim] for saida in saidas))
+    acoes = acoes[inicio:fim]
+    while True:
+        pedido.acquire()
+        comando, nova_semente = comandos[processo]
+        if comando == _AVANCA:
+            ambiente.avanca(acoes)
+        elif comando == _REINICIA:
+            if nova_semente >= 0:
+                semente = FonteAleatoria(int(nova_semente)).semente(processo)
+            else:
+                semente = None
+            ambiente.reinicia(semente)
+        else:
+            return
+        pronto.release()
+
+
+class AmbienteParalelo:
+    """
+    Ambiente vetorizado dividido entre vários processos.
+
+    As mesas são repartidas em fatias contíguas, uma por processo, e cada
+    processo executa a sua fatia com um `AmbienteVetorizado`. As ações, as
+    observações, as máscaras, as recompensas e os indicadores de fim de jogo
+    de todas as mesas ficam em um único bloco de memória compartilhada
+    (`multiprocessing.shared_memory`), e cada processo lê e escreve
+    diretamente na sua fatia. A cada passo, o treinador só escreve as ações
+    e sinaliza os processos com semáforos: nada é serializado com pickle
+    depois da criação dos processos.
+
+    A interface é a mesma de `AmbienteVetorizado`, com os arrays de saída
+    sobre a memória compartilhada; eles deixam de ser válidos depois de
+    `fecha`. Os processos são encerrados por `fecha` ou ao sair de um bloco
+    `with`.
+
+    A semente de cada processo é derivada da semente do ambiente com
+    `FonteAleatoria`, então os jogos são reprodutíveis para um mesmo número
+    de mesas e de processos.
+
+    Atributos:
+        num_mesas (int): Número total de mesas.
+        num_processos (int): Número de processos.
+        observacoes (numpy.ndarray): (num_mesas, TAMANHO_OBSERVACAO), float32.
+        mascaras (numpy.ndarray): (num_mesas, NUM_ACOES), bool.
+        recompensas (numpy.ndarray): (num_mesas,), float32.
+        terminados (numpy.ndarray): (num_mesas,), bool.
+
+    Métodos:
+        reinicia(semente): Começa novos jogos em todas as mesas.
+        avanca(acoes): Aplica uma ação por mesa e avança até a próxima decisão.
+        fecha(): Encerra os processos e libera a memória compartilhada.
+    """
+
+    def __init__(self, num_mesas: int = 8192, num_processos: int = None,
+                 semente: int = None, arquivo_csv: str = ARQUIVO_CARTAS):
+        """
+        Inicializa uma nova instância da classe AmbienteParalelo.
+
+        Args:
+            num_mesas (int, opcional): Número total de mesas. Padrão é 8192.
+            num_processos (int, opcional): Número de processos. Padrão é o
+                número de CPUs, limitado ao número de mesas.
+            semente (int, opcional): Semente do ambiente.
+            arquivo_csv (str, opcional): Caminho para o arquivo CSV das cartas.
+        """
+        self.num_mesas = num_mesas
+        self.num_processos = min(num_processos or os.cpu_count() or 1,
+                                 num_mesas)
+        self._linhas = np.arange(num_mesas)
+        self._aberto = True
+        self._memoria = shared_memory.SharedMemory(
+            create=True, size=_tamanho_memoria(num_mesas, self.num_processos))
+        saidas, self._acoes, self._comandos = _vistas(
+            self._memoria.buf, num_mesas, self.num_processos)
+        (self.observacoes, self.mascaras, self.recompensas,
+         self.terminados) = saidas
+
+        contexto = multiprocessing.get_context()
+        fonte = FonteAleatoria(semente)
+        self._pedidos = []
+        self._prontos = []
+        self._processos = []
+        for processo in range(self.num_processos):
+            inicio = num_mesas * processo // self.num_processos
+            fim = num_mesas * (processo + 1) // self.num_processos
+            pedido, pronto = contexto.Semaphore(0), contexto.Semaphore(0)
+            trabalhador = contexto.Process(
+                target=_trabalha, daemon=True,
+                args=(self._memoria.name, num_mesas, self.num_processos,
+                      processo, inicio, fim, fonte.semente(processo),
+                      arquivo_csv, pedido, pronto))
+            trabalhador.start()
+            self._pedidos.append(pedido)
+            self._prontos.append(pronto)
+            self._processos.append(trabalhador)
+
+    def reinicia(self, semente: int = None) -> tuple:
+        """
+        Começa novos jogos em todas as mesas.
+
+        Args:
+            semente (int, opcional): Se fornecida, reinicia o gerador de cada
+                processo com uma semente derivada dela.
+
+        Returns:
+            tuple: (observacoes, mascaras), os arrays do ambiente.
+        """
+        self._comandos[:, 0] = _REINICIA
+        self._comandos[:, 1] = -1 if semente is None else semente
+        self._executa()
+        return self.observacoes, self.mascaras
+
+    def avanca(self, acoes) -> tuple:
+        """
+        Aplica uma ação em cada mesa e avança até a próxima decisão.
+
+        Args:
+            acoes (numpy.ndarray): Uma ação (Acao) por mesa, entre as
+                permitidas por `mascaras`.
+
+        Returns:
+            tuple: (observacoes, recompensas, terminados, mascaras), os
+                arrays do ambiente.
+
+        Raises:
+            ValueError: Se alguma ação não for permitida em sua mesa.
+        """
+        acoes = np.asarray(acoes)
+        if not self.mascaras[self._linhas, acoes].all():
+            mesa = int(np.flatnonzero(~self.mascaras[self._linhas, acoes])[0])
+            raise ValueError(f"Ação {Acao(int(acoes[mesa])).name} não "
+                             f"permitida na mesa {mesa}.")
+        self._acoes[:] = acoes
+        self._comandos[:, 0] = _AVANCA
+        self._executa()
+        return self.observacoes, self.recompensas, self.terminados, self.mascaras
+
+    reset = reinicia
+    step = avanca
+
+    def _executa(self):
+        """
+        Sinaliza o comando a todos os processos e espera que terminem.
+
+        Raises:
+            RuntimeError: Se algum processo terminou inesperadamente.
+        """
+        for pedido in self._pedidos:
+            pedido.release()
+        for pronto, trabalhador in zip(self._prontos, self._processos):
+            while not pronto.acquire(timeout=_ESPERA):
+                if not trabalhador.is_alive():
+                    raise RuntimeError(f"O processo {trabalhador.name} "
+                                       f"terminou com código "
+                                       f"{trabalhador.exitcode}.")
+
+    def fecha(self):
+        """
+        Encerra os processos e libera a memória compartilhada.
+
+        Se os arrays de saída ainda forem referenciados fora do ambiente, a
+        memória só é liberada quando eles forem coletados.
+        """
+        if not self._aberto:
+            return
+        self._aberto = False
+        self._comandos[:, 0] = _ENCERRA
+        for pedido in self._pedidos:
+            pedido.release()
+        for trabalhador in self._processos:
+            trabalhador.join()
+        del (self._acoes, self._comandos, self.observacoes, self.mascaras,
+             self.recompensas, self.terminados)
+        self._memoria.unlink()
+        try:
+            self._memoria.close()
+        except BufferError:
+            # Arrays ainda referenciados: a memória é fechada com o ambiente
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fecha()
+
+
+if __name__ == "__main__":
+    import time
+
+    def joga(ambiente, num_jogos: int) -> str:
+        # Agente aleatório: sorteia uma ação entre as permitidas
+        observacoes, mascaras = ambiente.reinicia(0)
+        rng = np.random.default_rng(1)
+        vitorias = jogos = passos = 0
+        inicio = time.perf_counter()
+        while jogos < num_jogos:
+            chaves = np.where(mascaras, rng.random(mascaras.shape), -1.)
+            observacoes, recompensas, terminados, mascaras = ambiente.avanca(
+                chaves.argmax(axis=1))
+            jogos += np.count_nonzero(terminados)
+            vitorias += np.count_nonzero(recompensas > 0)
+            passos += ambiente.num_mesas
+        duracao = time.perf_counter() - inicio
+        return (f"{jogos} jogos, agente aleatório vence {vitorias / jogos:.1%}"
+                f" | {passos / duracao:,.0f} passos/s")
+
+    print("1 processo:", joga(AmbienteVetorizado(num_mesas=8192), 50000))
+    with AmbienteParalelo(num_mesas=8192) as ambiente:
+        print(f"{ambiente.num_processos} processos:", joga(ambiente, 50000))
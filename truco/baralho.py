@@ -1,59 +1,290 @@
-import pandas as pd
+import csv
+import os
+import random
 from .carta import Carta
 
+# Arquivo de cartas distribuído junto com o pacote
+ARQUIVO_CARTAS = os.path.join(os.path.dirname(__file__), "cartas.csv")
+
+# Cartas já lidas, por caminho absoluto do CSV: ((mtime, tamanho), cartas)
+_cache_cartas = {}
+
+
+def _le_cartas(arquivo_csv: str) -> tuple:
+    """
+    Lê as cartas de um arquivo CSV, usando o cache enquanto o arquivo não mudar.
+
+    A leitura usa apenas a biblioteca padrão. O resultado fica guardado por
+    processo e é descartado quando a data de modificação ou o tamanho do
+    arquivo mudam, de modo que criar vários baralhos (por exemplo, um por
+    mesa ou por processo de trabalho) não relê o arquivo.
+
+    Args:
+        arquivo_csv (str): Caminho do arquivo CSV, com as colunas Carta e Valor.
+
+    Returns:
+        tuple[Carta]: A carta de cada linha do arquivo, na ordem do arquivo.
+    """
+    caminho = os.path.abspath(arquivo_csv)
+    estado = os.stat(caminho)
+    versao = (estado.st_mtime_ns, estado.st_size)
+    em_cache = _cache_cartas.get(caminho)
+    if em_cache is not None and em_cache[0] == versao:
+        return em_cache[1]
+
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        linhas = [(linha["Carta"], int(linha["Valor"]))
+                  for linha in csv.DictReader(arquivo)]
+    cartas = tuple(Carta(nome, valor, iden)
+                   for iden, (nome, valor) in enumerate(linhas))
+    _cache_cartas[caminho] = (versao, cartas)
+    return cartas
+
 class Baralho:
     """
     Classe que representa um baralho de cartas para o jogo de Truco.
     A classe Baralho é responsável por carregar as cartas de um arquivo CSV e
     distribuí-las entre os jogadores.
+
+    Internamente, cada carta é identificada por um inteiro (sua linha no CSV),
+    e a distribuição sorteia uma permutação desses identificadores. O arquivo
+    é lido só com a biblioteca padrão; numpy e pandas são importados apenas
+    quando `valores`, `cartas` ou `distribui_lote` são usados.
+
     Attributes:
-        cartas (pandas.DataFrame): DataFrame contendo as informações das cartas do baralho.
+        arquivo_csv (str): Caminho do arquivo CSV de onde as cartas foram lidas.
+        cartas (pandas.DataFrame): DataFrame contendo as informações das cartas
+                                   do baralho, criado no primeiro acesso.
+        nomes (list[str]): Nome de cada carta, indexado pelo identificador.
+        valores (numpy.ndarray): Valor de cada carta, indexado pelo
+                                 identificador, criado no primeiro acesso.
+                                 Com manilha variável, são os valores sob a
+                                 vira da última distribuição.
+        cartas_por_id (tuple[Carta]): Objeto `Carta` de cada identificador,
+                                      criado uma única vez. Com manilha
+                                      variável, são as cartas com os valores
+                                      sob a vira da última distribuição.
+        num_cartas (int): Quantidade de cartas no baralho.
+        rng (numpy.random.Generator ou random.Random): Gerador usado nos sorteios.
+        regras (Regras): Regras do jogo, ou None para as manilhas fixas do CSV.
+        vira (Carta): Vira da última distribuição, ou None sem manilha variável.
     Methods:
         distribui_cartas: Distribui um número específico de cartas para dois jogadores.
+        distribui_maos: Distribui um número específico de cartas para cada lugar da mesa.
+        distribui_lote: Distribui as cartas de várias mesas de uma só vez.
+        carta: Retorna o objeto `Carta` correspondente a um identificador.
+        cartas_da_vira: Retorna as cartas com os valores sob uma vira.
+        aplica_regras: Passa a distribuir as cartas de acordo com as regras.
     """
-    def __init__(self, arquivo_csv: str):
+    def __init__(self, arquivo_csv: str = ARQUIVO_CARTAS,
+                 rng: "numpy.random.Generator" = None, regras=None):
         """
         Inicializa a classe Baralho carregando as cartas de um arquivo CSV.
 
         Args:
-            arquivo_csv (str): Caminho para o arquivo CSV contendo as informações das cartas.
-        
-        Attributes:
-            cartas (pandas.DataFrame): DataFrame contendo as informações das cartas do baralho.
+            arquivo_csv (str, optional): Caminho para o arquivo CSV contendo as
+                                         informações das cartas. O padrão é o
+                                         arquivo distribuído com o pacote.
+            rng (numpy.random.Generator ou random.Random, optional): Gerador de
+                                                    números aleatórios usado na
+                                                    distribuição. Se não for
+                                                    fornecido, um `random.Random`
+                                                    novo é criado.
+            regras (Regras, optional): Regras do jogo. Com manilha variável,
+                                       cada distribuição vira uma carta.
+        """
+        self.arquivo_csv = arquivo_csv
+        self.cartas_por_id = _le_cartas(arquivo_csv)
+        self.nomes = [carta.nome for carta in self.cartas_por_id]
+        self.num_cartas = len(self.cartas_por_id)
+        self.rng = rng if rng is not None else random.Random()
+        self._permutacao = getattr(self.rng, "permutation", None)
+        self._valores = {}
+        self._cartas = None
+        self._rng_lote = None
+        self._tabela_avulsa = None
+        self._cartas_lidas = self.cartas_por_id
+        self.aplica_regras(regras)
+
+    def aplica_regras(self, regras):
+        """
+        Passa a distribuir as cartas de acordo com as regras.
+
+        As regras são compiladas para as cartas do arquivo só na primeira vez;
+        depois, trocar de regras não relê o arquivo nem cria cartas.
+
+        Args:
+            regras (Regras): As regras, ou None para as manilhas fixas do CSV.
+        """
+        self.regras = regras
+        self.vira = None
+        self.cartas_por_id = self._cartas_lidas
+        self._tabela_vira = None
+        if regras is not None and regras.manilha_variavel:
+            self._tabela_vira = regras.compila(self._cartas_lidas)
+
+    @property
+    def valores(self):
+        """
+        Valor de cada carta como `numpy.ndarray`, criado no primeiro acesso.
+
+        Com manilha variável, os valores são os de `cartas_por_id`, sob a vira
+        da última distribuição; o array de cada vira é criado uma única vez.
+
+        Returns:
+            numpy.ndarray: Valores das cartas (int8), indexados pelo identificador.
+        """
+        cartas = self.cartas_por_id
+        em_cache = self._valores.get(id(cartas))
+        if em_cache is not None and em_cache[0] is cartas:
+            return em_cache[1]
+        import numpy as np
+        valores = np.array([carta.valor for carta in cartas], dtype=np.int8)
+        self._valores[id(cartas)] = (cartas, valores)
+        return valores
+
+    @property
+    def cartas(self):
+        """
+        Tabela das cartas como `pandas.DataFrame`, criada no primeiro acesso.
+
+        Returns:
+            pandas.DataFrame: Colunas Carta e Valor, uma linha por carta.
+        """
+        if self._cartas is None:
+            import pandas as pd
+            self._cartas = pd.DataFrame({
+                'Carta': self.nomes,
+                'Valor': [carta.valor for carta in self._cartas_lidas],
+            })
+        return self._cartas
+
+    def carta(self, iden: int) -> Carta:
+        """
+        Retorna o objeto `Carta` correspondente a um identificador.
+
+        Args:
+            iden (int): Identificador da carta (linha no arquivo CSV).
+
+        Returns:
+            Carta: A carta correspondente.
+        """
+        return self.cartas_por_id[iden]
+
+    def cartas_da_vira(self, vira: Carta = None) -> tuple:
+        """
+        Retorna as cartas do baralho com os valores que têm sob uma vira.
+
+        Serve para quem analisa uma mão sem ter distribuído as cartas, como
+        as estratégias: a vira da mão (`Mao.vira`) basta para saber o valor
+        de cada carta, mesmo que este baralho não use manilha variável.
+
+        Args:
+            vira (Carta, opcional): A vira. Se for None, as cartas do arquivo.
+
+        Returns:
+            tuple[Carta]: A carta de cada identificador sob a vira.
         """
-        self.cartas = pd.read_csv(arquivo_csv)
+        if vira is None:
+            return self._cartas_lidas
+        if self._tabela_vira is not None:
+            return self._tabela_vira[vira.indice]
+        if self._tabela_avulsa is None:
+            from .regras import Regras
+            self._tabela_avulsa = Regras(manilha_variavel=True).compila(
+                self._cartas_lidas)
+        return self._tabela_avulsa[vira.indice]
 
-    def distribui_cartas(self, num_cartas=3) -> list:
+    def distribui_cartas(self, num_cartas=3, como_ids=False) -> tuple:
         """
         Distribui um número específico de cartas para dois jogadores.
 
+        Equivale a `distribui_maos` com dois lugares.
+
         Args:
-            num_cartas (int, optional): Número de cartas a serem distribuídas para cada jogador. 
+            num_cartas (int, optional): Número de cartas a serem distribuídas para cada jogador.
                                         O padrão é 3.
+            como_ids (bool, optional): Se True, retorna os identificadores das
+                                       cartas em vez de objetos `Carta`.
+                                       O padrão é False.
 
         Returns:
             tuple: Uma tupla contendo duas listas:
                 - jogador_A (list[Carta]): Lista de objetos `Carta` para o jogador A.
                 - jogador_B (list[Carta]): Lista de objetos `Carta` para o jogador B.
+                Se `como_ids` for True, as listas são substituídas pelos
+                identificadores das cartas (arrays `numpy.ndarray` com um
+                gerador do numpy, listas com um `random.Random`).
+                Com manilha variável, a carta seguinte é a vira, guardada em
+                `vira`.
+        """
+        return tuple(self.distribui_maos(2, num_cartas, como_ids))
+
+    def distribui_maos(self, num_maos: int, num_cartas=3,
+                       como_ids=False) -> list:
+        """
+        Distribui um número específico de cartas para cada lugar da mesa.
+
+        Args:
+            num_maos (int): Número de lugares (mãos) a receber cartas.
+            num_cartas (int, optional): Número de cartas por lugar. O padrão é 3.
+            como_ids (bool, optional): Se True, retorna os identificadores das
+                                       cartas em vez de objetos `Carta`.
+                                       O padrão é False.
+
+        Returns:
+            list: A lista de cartas de cada lugar, na ordem dos lugares, como
+                em `distribui_cartas`. Com manilha variável, a carta seguinte
+                à última distribuída é a vira, guardada em `vira`.
+        """
+        num_distribuidas = num_cartas*num_maos
+        num_sorteadas = num_distribuidas + (self._tabela_vira is not None)
+        if self._permutacao is not None:
+            escolhidas = self._permutacao(self.num_cartas)[:num_sorteadas]
+        else:
+            escolhidas = self.rng.sample(range(self.num_cartas), num_sorteadas)
+
+        if self._tabela_vira is not None:
+            vira = int(escolhidas[-1])
+            self.cartas_por_id = self._tabela_vira[vira]
+            self.vira = self.cartas_por_id[vira]
+
+        if como_ids:
+            return [escolhidas[inicio:inicio + num_cartas]
+                    for inicio in range(0, num_distribuidas, num_cartas)]
+
+        cartas = self.cartas_por_id
+        if self._permutacao is not None:
+            escolhidas = escolhidas.tolist()
+        return [[cartas[iden] for iden in escolhidas[inicio:inicio + num_cartas]]
+                for inicio in range(0, num_distribuidas, num_cartas)]
+
+    def distribui_lote(self, num_mesas: int, num_cartas=3,
+                       num_maos=2) -> "numpy.ndarray":
+        """
+        Distribui as cartas de várias mesas de uma só vez.
+
+        Cada mesa recebe uma distribuição independente, com as cartas de cada
+        jogador em ordem aleatória. Com um `random.Random`, os sorteios usam um
+        gerador do numpy semeado a partir dele.
+
+        Args:
+            num_mesas (int): Número de mesas (distribuições independentes).
+            num_cartas (int, optional): Número de cartas por jogador. O padrão é 3.
+            num_maos (int, optional): Número de lugares por mesa. O padrão é 2.
+
+        Returns:
+            numpy.ndarray: Array de formato (num_mesas, num_maos, num_cartas)
+                           com os identificadores das cartas de cada jogador.
         """
-        cartas_escolhidas = self.cartas.sample(n=num_cartas*2)
-        jogador_A = []
-        jogador_B = []
-        
-        # Distribui as cartas para o jogador A
-        for n in range(num_cartas):
-            dados = cartas_escolhidas.iloc[n]
-            carta = Carta(dados['Carta'], dados['Valor'])
-            jogador_A.append(carta)
-        
-        # Distribui as cartas para o jogador B
-        for n in range(num_cartas):
-            dados = cartas_escolhidas.iloc[n+num_cartas]
-            carta = Carta(dados['Carta'], dados['Valor'])
-            jogador_B.append(carta)
-
-        return jogador_A, jogador_B
-    
+        if self._rng_lote is None:
+            import numpy as np
+            self._rng_lote = (self.rng if self._permutacao is not None else
+                              np.random.default_rng(self.rng.getrandbits(64)))
+        chaves = self._rng_lote.random((num_mesas, self.num_cartas))
+        escolhidas = chaves.argsort(axis=1)[:, :num_cartas*num_maos]
+        return escolhidas.reshape(num_mesas, num_maos, num_cartas)
+
 if __name__ == "__main__":
     baralho = Baralho("cartas.csv")
     jogador_A, jogador_B = baralho.distribui_cartas()
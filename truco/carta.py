@@ -2,13 +2,23 @@ class Carta:
     """
     Representa uma carta de baralho com um nome e um valor associado.
 
+    As cartas são imutáveis e internadas: criar uma carta com o mesmo nome,
+    valor e índice de uma já existente devolve o mesmo objeto. Assim, cada
+    carta do baralho existe uma única vez na memória, e distribuir cartas não
+    cria novos objetos.
+
+    Duas cartas são iguais quando têm o mesmo valor, e o hash também depende
+    só do valor, de modo que cartas equivalentes no jogo ocupam a mesma
+    chave em dicionários e conjuntos.
+
     Atributos:
         nome (str): O nome da carta (ex.: "Ás de Espadas").
         valor (int): O valor numérico da carta, usado para comparações.
+        indice (int ou None): A posição da carta no baralho que a criou.
 
     Métodos:
-        __init__(nome: str, valor: int):
-            Inicializa uma instância da classe Carta com um nome e um valor.
+        __new__(nome: str, valor: int, indice: int = None):
+            Retorna a instância única da carta com esse nome, valor e índice.
 
         __str__() -> str:
             Retorna uma representação em string da carta (apenas o nome).
@@ -16,6 +26,9 @@ class Carta:
         __repr__() -> str:
             Retorna uma representação detalhada da carta para depuração.
 
+        __hash__() -> int:
+            Retorna o hash do valor da carta.
+
         __eq__(outra) -> bool:
             Compara se duas cartas têm o mesmo valor.
 
@@ -32,16 +45,71 @@ class Carta:
             Verifica se o valor da carta atual é maior ou igual ao valor de outra carta.
     """
 
-    def __init__(self, nome: str, valor: int):
+    __slots__ = ("nome", "valor", "indice")
+
+    # Cartas já criadas, indexadas por (nome, valor, indice)
+    _internadas = {}
+
+    def __new__(cls, nome: str, valor: int, indice: int = None):
         """
-        Inicializa uma instância da classe Carta.
+        Retorna a instância única da carta com esse nome, valor e índice.
 
         Args:
             nome (str): O nome da carta.
             valor (int): O valor numérico da carta.
+            indice (int, opcional): A posição da carta no baralho.
+
+        Returns:
+            Carta: A carta correspondente, criada apenas na primeira chamada.
+        """
+        chave = (nome, valor, indice)
+        carta = cls._internadas.get(chave)
+        if carta is None:
+            carta = object.__new__(cls)
+            object.__setattr__(carta, "nome", str(nome))
+            object.__setattr__(carta, "valor", int(valor))
+            object.__setattr__(carta, "indice", indice)
+            cls._internadas[chave] = carta
+        return carta
+
+    def __setattr__(self, nome, valor):
+        """
+        Impede a alteração de uma carta.
+
+        Raises:
+            AttributeError: Sempre, pois as cartas são imutáveis.
+        """
+        raise AttributeError("Carta é imutável.")
+
+    def __delattr__(self, nome):
+        """
+        Impede a remoção de atributos de uma carta.
+
+        Raises:
+            AttributeError: Sempre, pois as cartas são imutáveis.
+        """
+        raise AttributeError("Carta é imutável.")
+
+    def __reduce__(self):
         """
-        self.nome = nome
-        self.valor = valor
+        Permite serializar a carta, reinternando-a ao ser carregada.
+
+        Returns:
+            tuple: A classe e os argumentos usados para recriar a carta.
+        """
+        return (Carta, (self.nome, self.valor, self.indice))
+
+    def __copy__(self):
+        """
+        Retorna a própria carta, já que ela é imutável.
+        """
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        Retorna a própria carta, já que ela é imutável.
+        """
+        return self
 
     def __str__(self) -> str:
         """
@@ -60,7 +128,16 @@ class Carta:
             str: Uma string no formato "Carta(nome, valor)".
         """
         return f"Carta({self.nome}, {self.valor})"
-    
+
+    def __hash__(self) -> int:
+        """
+        Retorna o hash do valor da carta, coerente com `__eq__`.
+
+        Returns:
+            int: O hash da carta.
+        """
+        return hash(self.valor)
+
     def __eq__(self, outra) -> bool:
         """
         Compara se duas cartas têm o mesmo valor.
@@ -71,9 +148,10 @@ class Carta:
         Returns:
             bool: True se os valores forem iguais, False caso contrário.
         """
-        if isinstance(outra, Carta):
+        try:
             return self.valor == outra.valor
-        return False
+        except AttributeError:
+            return NotImplemented
 
     def __lt__(self, outra) -> bool:
         """
@@ -85,9 +163,7 @@ class Carta:
         Returns:
             bool: True se o valor da carta atual for menor, False caso contrário.
         """
-        if isinstance(outra, Carta):
-            return self.valor < outra.valor
-        return False
+        return self.valor < outra.valor
 
     def __le__(self, outra) -> bool:
         """
@@ -99,10 +175,8 @@ class Carta:
         Returns:
             bool: True se o valor da carta atual for menor ou igual, False caso contrário.
         """
-        if isinstance(outra, Carta):
-            return self.valor <= outra.valor
-        return False
-    
+        return self.valor <= outra.valor
+
     def __gt__(self, outra) -> bool:
         """
         Verifica se o valor da carta atual é maior que o valor de outra carta.
@@ -113,10 +187,8 @@ class Carta:
         Returns:
             bool: True se o valor da carta atual for maior, False caso contrário.
         """
-        if isinstance(outra, Carta):
-            return self.valor > outra.valor
-        return False
-    
+        return self.valor > outra.valor
+
     def __ge__(self, outra) -> bool:
         """
         Verifica se o valor da carta atual é maior ou igual ao valor de outra carta.
@@ -127,6 +199,4 @@ class Carta:
         Returns:
             bool: True se o valor da carta atual for maior ou igual, False caso contrário.
         """
-        if isinstance(outra, Carta):
-            return self.valor >= outra.valor
-        return False
\ No newline at end of file
+        return self.valor >= outra.valor
@@ -0,0 +1,625 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+import numpy as np
+from .baralho import Baralho, ARQUIVO_CARTAS
+from .carta import Carta
+from .equidade import CalculadoraEquidade
+from .estrategia import Estrategia
+from .interface import TipoRespostaTruco
+from .jogada import Vencedor
+from .jogador import Jogador
+from .mao import Mao
+from .ponto import Ponto, TipoPontos
+
+# Valor de cada nível de aposta, na ordem da escada de TipoPontos
+VALORES_NIVEL = [tipo.value for tipo in TipoPontos]
+NIVEL = {tipo: nivel for nivel, tipo in enumerate(TipoPontos)}
+NIVEL_QUEDA = len(TipoPontos) - 1
+PONTOS_VITORIA = TipoPontos.Queda.value
+
+# Históricos de jogadas em que a mão ainda não acabou
+HISTORICOS = {
+    (): 0,
+    (Vencedor.Nenhum.value,): 1,
+    (Vencedor.A.value,): 2,
+    (Vencedor.B.value,): 3,
+    (Vencedor.A.value, Vencedor.B.value): 4,
+    (Vencedor.B.value, Vencedor.A.value): 5,
+}
+
+# Faixa de cada placar (0 a 11 pontos)
+FAIXAS_PLACAR = [0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 3, 3]
+NUM_FAIXAS_PLACAR = 4
+
+# Decisões: pedir ou não no nível 0..3, ou responder a um pedido do nível 1..4
+NUM_DECISOES = 2 * NIVEL_QUEDA
+NUM_ACOES = 3
+
+# Respostas na ordem das ações de uma decisão de resposta
+RESPOSTAS = (TipoRespostaTruco.ACEITAR, TipoRespostaTruco.CORRER,
+             TipoRespostaTruco.AUMENTAR)
+
+
+class AbstracaoCFR:
+    """
+    Reduz uma situação de aposta a um conjunto de informação abstrato.
+
+    Um conjunto de informação é identificado por:
+
+    * a posição do jogador (A ou B, pois o empate favorece B);
+    * a faixa de força das cartas que restam ao jogador, dada pela
+      probabilidade de vitória mais metade da de empate calculada por
+      `CalculadoraEquidade` com o histórico da mão;
+    * o histórico de jogadas da mão (`vencedor_jogadas`);
+    * a decisão: pedir ou não a partir do nível atual, ou responder a um
+      pedido de um dado nível da escada de TipoPontos;
+    * a faixa do placar de cada jogador.
+
+    Atributos:
+        calculadora (CalculadoraEquidade): Calculadora usada nas faixas de força.
+        num_faixas (int): Número de faixas de força.
+        num_conjuntos (int): Número total de conjuntos de informação.
+
+    Métodos:
+        faixa(cartas, historico, vira): Retorna a faixa de força das cartas.
+        conjunto(posicao, faixa, historico, decisao, pontos, pontos_adversario):
+            Retorna o índice do conjunto de informação.
+        acoes_legais(decisao): Retorna as ações permitidas em uma decisão.
+    """
+
+    def __init__(self, baralho: Baralho = None, num_faixas: int = 8):
+        """
+        Inicializa uma nova instância da classe AbstracaoCFR.
+
+        Args:
+            baralho (Baralho, opcional): Baralho do jogo.
+            num_faixas (int, opcional): Número de faixas de força. Padrão é 8.
+        """
+        self.calculadora = CalculadoraEquidade(baralho)
+        self.num_faixas = num_faixas
+        self.num_conjuntos = (2 * num_faixas * len(HISTORICOS) * NUM_DECISOES
+                              * NUM_FAIXAS_PLACAR * NUM_FAIXAS_PLACAR)
+
+    def faixa(self, cartas: list[Carta], historico: list[Vencedor],
+              vira: Carta = None) -> int:
+        """
+        Retorna a faixa de força das cartas que restam a um jogador.
+
+        Args:
+            cartas (list[Carta]): Cartas na mão do jogador.
+            historico (list[Vencedor]): Vencedores das jogadas já disputadas.
+            vira (Carta, opcional): Vira da mão, com manilha variável; a força
+                é calculada com os valores sob ela.
+
+        Returns:
+            int: Faixa de força, entre 0 e num_faixas - 1.
+        """
+        vitoria, empate, _ = self.calculadora.calcula(cartas,
+                                                      historico=historico,
+                                                      vira=vira)
+        return min(int((vitoria + empate / 2) * self.num_faixas),
+                   self.num_faixas - 1)
+
+    def conjunto(self, posicao: int, faixa: int, historico: int, decisao: int,
+                 pontos: int, pontos_adversario: int) -> int:
+        """
+        Retorna o índice do conjunto de informação.
+
+        Args:
+            posicao (int): 0 para o jogador A, 1 para o jogador B.
+            faixa (int): Faixa de força das cartas.
+            historico (int): Índice do histórico de jogadas em HISTORICOS.
+            decisao (int): Nível atual (0 a 3) ao decidir se pede, ou
+                NIVEL_QUEDA - 1 mais o nível pedido (1 a 4) ao responder.
+            pontos (int): Pontos do jogador.
+            pontos_adversario (int): Pontos do adversário.
+
+        Returns:
+            int: Índice entre 0 e num_conjuntos - 1.
+        """
+        indice = posicao * self.num_faixas + faixa
+        indice = indice * len(HISTORICOS) + historico
+        indice = indice * NUM_DECISOES + decisao
+        indice = indice * NUM_FAIXAS_PLACAR + FAIXAS_PLACAR[pontos]
+        return indice * NUM_FAIXAS_PLACAR + FAIXAS_PLACAR[pontos_adversario]
+
+    @staticmethod
+    def acoes_legais(decisao: int) -> tuple:
+        """
+        Retorna as ações permitidas em uma decisão.
+
+        Ao decidir se pede, a ação 0 é não pedir e a 1 é pedir. Ao responder,
+        as ações são aceitar (0), correr (1) e, exceto em pedidos de queda,
+        aumentar (2).
+
+        Args:
+            decisao (int): Índice da decisão.
+
+        Returns:
+            tuple: Índices das ações permitidas.
+        """
+        if decisao < NIVEL_QUEDA:
+            return (0, 1)
+        if decisao - NIVEL_QUEDA + 1 < NIVEL_QUEDA:
+            return (0, 1, 2)
+        return (0, 1)
+
+
+def _estrategia_atual(arrependimento: list, legais: tuple) -> list:
+    """
+    Calcula a estratégia por casamento de arrependimentos.
+
+    Args:
+        arrependimento (list): Arrependimento acumulado de cada ação.
+        legais (tuple): Ações permitidas.
+
+    Returns:
+        list: Probabilidade de cada ação permitida.
+    """
+    positivos = [max(arrependimento[acao], 0.) for acao in legais]
+    total = sum(positivos)
+    if total > 0:
+        return [valor / total for valor in positivos]
+    return [1. / len(legais)] * len(legais)
+
+
+# Abstração de cada processo de treino, criada uma única vez por processo
+_abstracoes = {}
+
+
+def _abstracao_do_processo(arquivo_csv: str, num_faixas: int) -> AbstracaoCFR:
+    """
+    Retorna a abstração do processo atual, criando-a na primeira chamada.
+
+    Args:
+        arquivo_csv (str): Caminho para o arquivo CSV das cartas.
+        num_faixas (int): Número de faixas de força.
+
+    Returns:
+        AbstracaoCFR: A abstração, com a memória de equidades do processo.
+    """
+    chave = (arquivo_csv, num_faixas)
+    if chave not in _abstracoes:
+        _abstracoes[chave] = AbstracaoCFR(Baralho(arquivo_csv), num_faixas)
+    return _abstracoes[chave]
+
+
+def _treina_lote(arquivo_csv: str, num_faixas: int, arrependimento: np.ndarray,
+                 semente: np.random.SeedSequence,
+                 num_iteracoes: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Executa iterações de MCCFR com amostragem externa em um processo.
+
+    Cada iteração sorteia as cartas, a ordem em que cada jogador as joga
+    (os jogadores escolhem cartas ao acaso, como os jogadores máquina), quem
+    abre e o placar, e percorre a árvore de apostas uma vez para cada jogador.
+
+    Args:
+        arquivo_csv (str): Caminho para o arquivo CSV das cartas.
+        num_faixas (int): Número de faixas de força.
+        arrependimento (numpy.ndarray): Arrependimentos no início do lote.
+        semente (numpy.random.SeedSequence): Semente do lote.
+        num_iteracoes (int): Número de iterações.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Variação dos arrependimentos e
+            soma das estratégias acumuladas no lote.
+    """
+    abstracao = _abstracao_do_processo(arquivo_csv, num_faixas)
+    cartas_por_id = abstracao.calculadora.baralho.cartas_por_id
+    rng = np.random.default_rng(semente)
+    regrets = arrependimento.tolist()
+    somas = [[0., 0., 0.] for _ in range(len(regrets))]
+    acoes_legais = [abstracao.acoes_legais(d) for d in range(NUM_DECISOES)]
+    conjunto = abstracao.conjunto
+    aleatorio = rng.random
+
+    for _ in range(num_iteracoes):
+        ids = rng.permutation(len(cartas_por_id))[:6].tolist()
+        cartas = ([cartas_por_id[i] for i in ids[:3]],
+                  [cartas_por_id[i] for i in ids[3:]])
+        pontos = rng.integers(0, PONTOS_VITORIA, size=2).tolist()
+        lider = int(rng.integers(2))
+
+        # Disputa as jogadas na ordem sorteada e monta a sequência de vezes
+        resultados = []
+        turnos = []
+        mao = Mao()
+        for rodada in range(3):
+            turnos.append((lider, rodada))
+            turnos.append((1 - lider, rodada))
+            carta_A, carta_B = cartas[0][rodada], cartas[1][rodada]
+            if carta_A > carta_B:
+                vencedor = Vencedor.A
+            elif carta_B > carta_A:
+                vencedor = Vencedor.B
+            else:
+                vencedor = Vencedor.Nenhum
+            mao.adiciona_vencedor(vencedor)
+            resultados.append(vencedor.value)
+            if vencedor != Vencedor.Nenhum:
+                lider = vencedor.value - 1
+            if mao.mao_acabou():
+                break
+        # Empate dá os pontos a B, como em Jogo.comecar
+        ganhador_natural = 0 if mao.quem_ganhou_a_mao() == Vencedor.A else 1
+
+        # Base do conjunto de informação de cada jogador em cada jogada
+        bases = [[0] * len(resultados) for _ in range(2)]
+        for posicao in range(2):
+            for rodada in range(len(resultados)):
+                historico = mao.vencedor_jogadas[:rodada]
+                faixa = abstracao.faixa(cartas[posicao][rodada:], historico)
+                bases[posicao][rodada] = conjunto(
+                    posicao, faixa, HISTORICOS[tuple(resultados[:rodada])], 0,
+                    pontos[posicao], pontos[1 - posicao])
+        passo_decisao = NUM_FAIXAS_PLACAR * NUM_FAIXAS_PLACAR
+
+        def utilidade(ganhador, valor, jogador):
+            ganho = min(valor, PONTOS_VITORIA - pontos[ganhador])
+            return ganho if ganhador == jogador else -ganho
+
+        def no(indice, posicao, decisao, filho, jogador):
+            legais = acoes_legais[decisao]
+            sigma = _estrategia_atual(regrets[indice], legais)
+            if posicao == jogador:
+                utilidades = [filho(acao) for acao in legais]
+                esperada = sum(p * u for p, u in zip(sigma, utilidades))
+                linha = regrets[indice]
+                for acao, u in zip(legais, utilidades):
+                    linha[acao] += u - esperada
+                return esperada
+            linha = somas[indice]
+            for acao, p in zip(legais, sigma):
+                linha[acao] += p
+            sorteio = aleatorio()
+            for acao, p in zip(legais, sigma):
+                sorteio -= p
+                if sorteio < 0:
+                    break
+            return filho(acao)
+
+        def turno(k, nivel, jogador):
+            if k == len(turnos):
+                return utilidade(ganhador_natural, VALORES_NIVEL[nivel], jogador)
+            if nivel >= NIVEL_QUEDA:
+                return turno(k + 1, nivel, jogador)
+            posicao, rodada = turnos[k]
+            indice = bases[posicao][rodada] + nivel * passo_decisao
+
+            def filho(acao):
+                if acao == 0:
+                    return turno(k + 1, nivel, jogador)
+                return resposta(k, posicao, nivel + 1, jogador)
+            return no(indice, posicao, nivel, filho, jogador)
+
+        def resposta(k, proponente, proposto, jogador):
+            posicao = 1 - proponente
+            rodada = turnos[k][1]
+            decisao = NIVEL_QUEDA - 1 + proposto
+            indice = bases[posicao][rodada] + decisao * passo_decisao
+
+            def filho(acao):
+                if acao == 0:
+                    return turno(k + 1, proposto, jogador)
+                if acao == 1:
+                    return utilidade(proponente, VALORES_NIVEL[proposto - 1],
+                                     jogador)
+                return resposta(k, posicao, proposto + 1, jogador)
+            return no(indice, posicao, decisao, filho, jogador)
+
+        turno(0, 0, 0)
+        turno(0, 0, 1)
+
+    return (np.array(regrets) - arrependimento, np.array(somas))
+
+
+class TreinadorCFR:
+    """
+    Treina uma política de apostas por minimização de arrependimento contrafactual.
+
+    O treino usa Monte Carlo CFR com amostragem externa sobre os conjuntos de
+    informação de `AbstracaoCFR`, no jogo de uma mão: as decisões são pedir
+    truco (e seis, nove, queda) e responder com aceitar, correr ou aumentar,
+    como em `Jogo._propor_truco` e `Jogo._resposta_ao_truco`. As cartas
+    são jogadas ao acaso. A utilidade de uma mão são os pontos ganhos ou
+    perdidos, limitados ao que falta para o vencedor chegar a 12, de modo que
+    o placar influencia as decisões.
+
+    Cada rodada de treino divide as iterações entre processos, que partem dos
+    mesmos arrependimentos e devolvem suas variações, somadas em seguida.
+    Ao fim de cada rodada, arrependimentos e estratégias acumuladas podem ser
+    gravados em disco, e um treino interrompido continua a partir do arquivo.
+
+    Atributos:
+        abstracao (AbstracaoCFR): Abstração dos conjuntos de informação.
+        arrependimento (numpy.ndarray): Arrependimento acumulado por conjunto e ação.
+        soma_estrategias (numpy.ndarray): Soma das estratégias por conjunto e ação.
+        iteracoes (int): Número de iterações já realizadas.
+        caminho (str ou None): Arquivo de checkpoint.
+
+    Métodos:
+        treina(num_iteracoes): Executa iterações de treino.
+        salva(caminho): Grava o estado do treino.
+        politica(): Retorna a estratégia média normalizada.
+    """
+
+    def __init__(self, arquivo_csv: str = ARQUIVO_CARTAS, num_faixas: int = 8,
+                 caminho: str = None, num_processos: int = None,
+                 semente: int = None, iteracoes_por_rodada: int = 20000):
+        """
+        Inicializa uma nova instância da classe TreinadorCFR.
+
+        Se `caminho` apontar para um checkpoint existente, o treino continua
+        a partir dele.
+
+        Args:
+            arquivo_csv (str, opcional): Caminho para o arquivo CSV das cartas.
+            num_faixas (int, opcional): Número de faixas de força. Padrão é 8.
+            caminho (str, opcional): Arquivo `.npz` de checkpoint.
+            num_processos (int, opcional): Número de processos. Padrão é o
+                número de CPUs da máquina.
+            semente (int, opcional): Semente do treino.
+            iteracoes_por_rodada (int, opcional): Iterações entre duas
+                sincronizações dos processos. Padrão é 20000.
+        """
+        self.arquivo_csv = arquivo_csv
+        self.abstracao = _abstracao_do_processo(arquivo_csv, num_faixas)
+        self.caminho = caminho
+        self.num_processos = num_processos or os.cpu_count() or 1
+        self.semente = np.random.SeedSequence(semente).entropy
+        self.iteracoes_por_rodada = iteracoes_por_rodada
+        self.iteracoes = 0
+        formato = (self.abstracao.num_conjuntos, NUM_ACOES)
+        self.arrependimento = np.zeros(formato)
+        self.soma_estrategias = np.zeros(formato)
+
+        if caminho is not None and os.path.exists(caminho):
+            with np.load(caminho) as dados:
+                if dados["arrependimento"].shape != formato:
+                    raise ValueError(f"O checkpoint {caminho} não corresponde "
+                                     f"à abstração com {num_faixas} faixas.")
+                self.arrependimento = dados["arrependimento"]
+                self.soma_estrategias = dados["soma_estrategias"]
+                self.iteracoes = int(dados["iteracoes"])
+                self.semente = int(str(dados["semente"]))
+
+    def treina(self, num_iteracoes: int):
+        """
+        Executa iterações de treino, gravando um checkpoint a cada rodada.
+
+        Args:
+            num_iteracoes (int): Número de iterações a executar.
+        """
+        num_faixas = self.abstracao.num_faixas
+        executor = None
+        if self.num_processos > 1:
+            executor = ProcessPoolExecutor(self.num_processos)
+        try:
+            while num_iteracoes > 0:
+                rodada = min(num_iteracoes, self.iteracoes_por_rodada)
+                partes = [rodada // self.num_processos] * self.num_processos
+                for i in range(rodada % self.num_processos):
+                    partes[i] += 1
+                partes = [parte for parte in partes if parte]
+                sementes = [
+                    np.random.SeedSequence(self.semente,
+                                           spawn_key=(self.iteracoes, i))
+                    for i in range(len(partes))
+                ]
+                argumentos = ([self.arquivo_csv] * len(partes),
+                              [num_faixas] * len(partes),
+                              [self.arrependimento] * len(partes),
+                              sementes, partes)
+                if executor is None:
+                    variacoes = map(_treina_lote, *argumentos)
+                else:
+                    variacoes = executor.map(_treina_lote, *argumentos)
+                for arrependimento, soma in list(variacoes):
+                    self.arrependimento += arrependimento
+                    self.soma_estrategias += soma
+
+                self.iteracoes += rodada
+                num_iteracoes -= rodada
+                if self.caminho is not None:
+                    self.salva(self.caminho)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def salva(self, caminho: str):
+        """
+        Grava o estado do treino em um arquivo `.npz`.
+
+        O arquivo é escrito com outro nome e depois renomeado, de modo que
+        uma interrupção não corrompa o checkpoint anterior. A semente é
+        gravada como texto decimal, pois a entropia de uma SeedSequence
+        criada sem semente tem 128 bits e não cabe em um inteiro do NumPy.
+
+        Args:
+            caminho (str): Caminho do arquivo.
+        """
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        with open(temporario, "wb") as arquivo:
+            np.savez(arquivo, arrependimento=self.arrependimento,
+                     soma_estrategias=self.soma_estrategias,
+                     iteracoes=self.iteracoes, semente=str(self.semente),
+                     num_faixas=self.abstracao.num_faixas)
+        os.replace(temporario, caminho)
+
+    def politica(self) -> np.ndarray:
+        """
+        Retorna a estratégia média normalizada de cada conjunto de informação.
+
+        Conjuntos nunca visitados recebem a estratégia uniforme sobre as
+        ações permitidas.
+
+        Returns:
+            numpy.ndarray: Probabilidade de cada ação, por conjunto.
+        """
+        return _normaliza(self.soma_estrategias, self.abstracao)
+
+
+def _normaliza(soma_estrategias: np.ndarray,
+               abstracao: AbstracaoCFR) -> np.ndarray:
+    """
+    Normaliza as estratégias acumuladas, usando a uniforme onde não há dados.
+
+    Args:
+        soma_estrategias (numpy.ndarray): Soma das estratégias por conjunto.
+        abstracao (AbstracaoCFR): Abstração dos conjuntos de informação.
+
+    Returns:
+        numpy.ndarray: Probabilidade de cada ação, por conjunto.
+    """
+    passo_decisao = NUM_FAIXAS_PLACAR * NUM_FAIXAS_PLACAR
+    decisoes = (np.arange(abstracao.num_conjuntos) // passo_decisao
+                % NUM_DECISOES)
+    uniforme = np.zeros((NUM_DECISOES, NUM_ACOES))
+    for decisao in range(NUM_DECISOES):
+        legais = abstracao.acoes_legais(decisao)
+        uniforme[decisao, list(legais)] = 1. / len(legais)
+
+    total = soma_estrategias.sum(axis=1, keepdims=True)
+    politica = np.where(total > 0,
+                        soma_estrategias / np.where(total > 0, total, 1),
+                        uniforme[decisoes])
+    return politica
+
+
+class PoliticaCFR(Estrategia):
+    """
+    Estratégia de apostas treinada por `TreinadorCFR`.
+
+    Usada por jogadores do tipo TipoJogador.CFR: as decisões de pedir e
+    responder truco seguem a estratégia média do treino, sorteada no
+    conjunto de informação da situação; as cartas são escolhidas ao acaso,
+    como no treino.
+
+    Atributos:
+        abstracao (AbstracaoCFR): Abstração dos conjuntos de informação.
+        politica (numpy.ndarray): Probabilidade de cada ação, por conjunto.
+
+    Métodos:
+        carrega(caminho): Cria a política a partir de um checkpoint.
+    """
+
+    def __init__(self, politica: np.ndarray, abstracao: AbstracaoCFR = None,
+                 rng: np.random.Generator = None):
+        """
+        Inicializa uma nova instância da classe PoliticaCFR.
+
+        Args:
+            politica (numpy.ndarray): Probabilidade de cada ação, por conjunto.
+            abstracao (AbstracaoCFR, opcional): Abstração usada no treino.
+            rng (numpy.random.Generator, opcional): Gerador usado nos sorteios.
+        """
+        self.abstracao = abstracao if abstracao is not None else AbstracaoCFR()
+        self.politica = politica
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    @classmethod
+    def carrega(cls, caminho: str, baralho: Baralho = None,
+                rng: np.random.Generator = None) -> "PoliticaCFR":
+        """
+        Cria a política a partir de um checkpoint de `TreinadorCFR`.
+
+        Args:
+            caminho (str): Arquivo `.npz` do checkpoint.
+            baralho (Baralho, opcional): Baralho do jogo.
+            rng (numpy.random.Generator, opcional): Gerador usado nos sorteios.
+
+        Returns:
+            PoliticaCFR: A política treinada.
+        """
+        with np.load(caminho) as dados:
+            abstracao = AbstracaoCFR(baralho, int(dados["num_faixas"]))
+            politica = _normaliza(dados["soma_estrategias"], abstracao)
+        return cls(politica, abstracao, rng)
+
+    def _sorteia(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                 decisao: int) -> int:
+        """
+        Sorteia uma ação da política no conjunto de informação do jogador.
+
+        Args:
+            jogador (Jogador): O jogador que decide.
+            adversario (Jogador): O outro jogador.
+            mao (Mao): A mão em andamento.
+            decisao (int): Índice da decisão.
+
+        Returns:
+            int: Índice da ação sorteada.
+        """
+        posicao = 0 if jogador.id == Vencedor.A else 1
+        cartas = mao.cartas_A if posicao == 0 else mao.cartas_B
+        historico = mao.vencedor_jogadas
+        chave = tuple(vencedor.value for vencedor in historico)
+        indice = self.abstracao.conjunto(
+            posicao, self.abstracao.faixa(cartas, historico, mao.vira),
+            HISTORICOS[chave], decisao,
+            min(jogador.pontos, PONTOS_VITORIA - 1),
+            min(adversario.pontos, PONTOS_VITORIA - 1))
+        probabilidades = self.politica[indice]
+        return int(np.searchsorted(np.cumsum(probabilidades),
+                                   self.rng.random() * probabilidades.sum(),
+                                   side="right"))
+
+    def escolhe_carta(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                      cartas: list[Carta]) -> int:
+        """
+        Escolhe uma carta ao acaso.
+
+        Args:
+            jogador (Jogador): O jogador da vez.
+            adversario (Jogador): O outro jogador.
+            mao (Mao): A mão em andamento.
+            cartas (list[Carta]): Cartas disponíveis para escolha.
+
+        Returns:
+            int: Índice da carta escolhida na lista.
+        """
+        return int(self.rng.integers(len(cartas)))
+
+    def pergunta_truco(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                       proposto: Ponto) -> bool:
+        """
+        Decide se o jogador pede aumento da aposta.
+
+        Args:
+            jogador (Jogador): O jogador da vez.
+            adversario (Jogador): O outro jogador.
+            mao (Mao): A mão em andamento.
+            proposto (Ponto): O valor que seria pedido.
+
+        Returns:
+            bool: True para pedir, False caso contrário.
+        """
+        return self._sorteia(jogador, adversario, mao,
+                             NIVEL[proposto.valor] - 1) == 1
+
+    def responde_truco(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                       proposto: Ponto) -> TipoRespostaTruco:
+        """
+        Responde a um pedido de aumento da aposta.
+
+        Args:
+            jogador (Jogador): O jogador que responde.
+            adversario (Jogador): O jogador que pediu.
+            mao (Mao): A mão em andamento.
+            proposto (Ponto): O valor pedido.
+
+        Returns:
+            TipoRespostaTruco: A resposta sorteada.
+        """
+        decisao = NIVEL_QUEDA - 1 + NIVEL[proposto.valor]
+        return RESPOSTAS[self._sorteia(jogador, adversario, mao, decisao)]
+
+
+if __name__ == "__main__":
+    caminho = sys.argv[1] if len(sys.argv) > 1 else "cfr.npz"
+    num_iteracoes = int(sys.argv[2]) if len(sys.argv) > 2 else 100000
+    treinador = TreinadorCFR(caminho=caminho)
+    treinador.treina(num_iteracoes)
+    print(f"{treinador.iteracoes} iterações gravadas em {caminho}")
@@ -0,0 +1,201 @@
+import glob
+import os
+import numpy as np
+from .registro import (DTYPE_REGISTRO, TAMANHO_CABECALHO, TAMANHO_REGISTRO,
+                       _le_cabecalho)
+
+# Colunas derivadas, além dos campos de DTYPE_REGISTRO. Todas são vistas
+# (sem cópia) sobre os registros mapeados.
+_DERIVADAS = {
+    "cartas_A": lambda registros: registros["cartas"][:, 0],
+    "cartas_B": lambda registros: registros["cartas"][:, 1],
+    "pontos_A": lambda registros: registros["pontos"][:, 0],
+    "pontos_B": lambda registros: registros["pontos"][:, 1],
+}
+
+# Nomes das colunas disponíveis
+COLUNAS = DTYPE_REGISTRO.names + tuple(_DERIVADAS)
+
+
+def _coluna(registros: np.ndarray, nome: str) -> np.ndarray:
+    """
+    Retorna uma coluna, sem cópia, de um vetor de registros.
+
+    Args:
+        registros (numpy.ndarray): Registros com dtype `DTYPE_REGISTRO`.
+        nome (str): Nome da coluna, um de `COLUNAS`.
+
+    Returns:
+        numpy.ndarray: Vista da coluna sobre os registros.
+
+    Raises:
+        KeyError: Se a coluna não existir.
+    """
+    if nome in _DERIVADAS:
+        return _DERIVADAS[nome](registros)
+    if nome not in DTYPE_REGISTRO.names:
+        raise KeyError(f"Coluna desconhecida: {nome!r}.")
+    return registros[nome]
+
+
+class CorpusPartidas:
+    """
+    Leitor colunar de um diretório de registros de partidas.
+
+    Os arquivos gravados por `GravadorPartidas` são mapeados em memória com
+    `numpy.memmap`, de modo que as colunas (cartas da mão, vencedor de cada
+    jogada, valor da mão, quem correu etc.) são vistas sem cópia sobre o
+    arquivo. Cada arquivo só é mapeado enquanto está sendo lido e a leitura
+    pode ser feita em blocos, então a memória usada não depende do tamanho
+    do corpus.
+
+    Atributos:
+        arquivos (list[str]): Arquivos de registro do corpus, em ordem.
+        tamanhos (list[int]): Número de registros completos de cada arquivo.
+        num_registros (int): Número total de registros (mãos).
+
+    Métodos:
+        mapeia(indice): Mapeia em memória os registros de um arquivo.
+        coluna(nome): Itera sobre a coluna de cada arquivo.
+        blocos(colunas, tamanho): Itera sobre o corpus em blocos de colunas.
+        filtra(condicao, colunas, tamanho): Retorna as linhas que satisfazem a condição.
+        conta(condicao, tamanho): Conta as linhas que satisfazem a condição.
+    """
+
+    def __init__(self, diretorio: str, padrao: str = "*.trlog"):
+        """
+        Inicializa o corpus com os arquivos de registro de um diretório.
+
+        Args:
+            diretorio (str): Diretório com os arquivos de registro.
+            padrao (str, opcional): Padrão dos nomes de arquivo. Padrão é
+                "*.trlog", a extensão usada por `Simulador`.
+
+        Raises:
+            ValueError: Se algum arquivo não for um registro compatível.
+        """
+        self.arquivos = sorted(glob.glob(os.path.join(diretorio, padrao)))
+        self.tamanhos = []
+        for caminho in self.arquivos:
+            with open(caminho, "rb") as arquivo:
+                _le_cabecalho(arquivo)
+            self.tamanhos.append((os.path.getsize(caminho) - TAMANHO_CABECALHO)
+                                 // TAMANHO_REGISTRO)
+        self.num_registros = sum(self.tamanhos)
+
+    def mapeia(self, indice: int) -> np.ndarray:
+        """
+        Mapeia em memória os registros de um arquivo, somente para leitura.
+
+        Args:
+            indice (int): Posição do arquivo em `arquivos`.
+
+        Returns:
+            numpy.ndarray: Registros do arquivo com dtype `DTYPE_REGISTRO`.
+        """
+        if not self.tamanhos[indice]:
+            return np.empty(0, dtype=DTYPE_REGISTRO)
+        return np.memmap(self.arquivos[indice], dtype=DTYPE_REGISTRO,
+                         mode="r", offset=TAMANHO_CABECALHO,
+                         shape=(self.tamanhos[indice],))
+
+    def coluna(self, nome: str):
+        """
+        Itera sobre uma coluna, um arquivo por vez.
+
+        Args:
+            nome (str): Nome da coluna, um de `COLUNAS`.
+
+        Yields:
+            numpy.ndarray: Vista, sem cópia, da coluna de cada arquivo.
+        """
+        for indice in range(len(self.arquivos)):
+            yield _coluna(self.mapeia(indice), nome)
+
+    def blocos(self, colunas=COLUNAS, tamanho: int = 1 << 20):
+        """
+        Itera sobre o corpus em blocos de no máximo `tamanho` registros.
+
+        Args:
+            colunas (tuple[str], opcional): Colunas de cada bloco. Padrão é
+                todas as de `COLUNAS`.
+            tamanho (int, opcional): Registros por bloco. Padrão é 2**20.
+
+        Yields:
+            dict: Nome de cada coluna para sua vista, sem cópia, no bloco.
+        """
+        for indice in range(len(self.arquivos)):
+            registros = self.mapeia(indice)
+            for inicio in range(0, len(registros), tamanho):
+                bloco = registros[inicio:inicio + tamanho]
+                yield {nome: _coluna(bloco, nome) for nome in colunas}
+
+    def filtra(self, condicao, colunas=COLUNAS, tamanho: int = 1 << 20) -> dict:
+        """
+        Retorna as linhas que satisfazem uma condição.
+
+        A condição é avaliada bloco a bloco, então só as linhas selecionadas
+        são copiadas para a memória.
+
+        Args:
+            condicao (callable): Recebe um bloco (como em `blocos`, com todas
+                as colunas) e retorna uma máscara booleana de suas linhas.
+            colunas (tuple[str], opcional): Colunas do resultado.
+            tamanho (int, opcional): Registros por bloco. Padrão é 2**20.
+
+        Returns:
+            dict: Nome de cada coluna para o vetor de suas linhas selecionadas.
+        """
+        partes = {nome: [] for nome in colunas}
+        for bloco in self.blocos(tamanho=tamanho):
+            mascara = condicao(bloco)
+            for nome in colunas:
+                partes[nome].append(bloco[nome][mascara])
+        return {nome: (np.concatenate(partes[nome]) if partes[nome] else
+                       _coluna(np.empty(0, dtype=DTYPE_REGISTRO), nome))
+                for nome in colunas}
+
+    def conta(self, condicao, tamanho: int = 1 << 20) -> int:
+        """
+        Conta as linhas que satisfazem uma condição.
+
+        Args:
+            condicao (callable): Como em `filtra`.
+            tamanho (int, opcional): Registros por bloco. Padrão é 2**20.
+
+        Returns:
+            int: Número de linhas selecionadas.
+        """
+        return sum(int(np.count_nonzero(condicao(bloco)))
+                   for bloco in self.blocos(tamanho=tamanho))
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    from .baralho import Baralho
+    from .simulador import Simulador
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        Simulador(semente=0, diretorio_registros=diretorio).executa(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
+        corpus = CorpusPartidas(diretorio)
+        print(f"{len(corpus.arquivos)} arquivos, {corpus.num_registros} mãos")
+
+        # Taxa de vitória de quem abre a mão quando tem o zap
+        zap = Baralho().nomes.index("Zap")
+
+        def abre_com_zap(bloco):
+            cartas_abre = np.where((bloco["quem_abre"] == 1)[:, None],
+                                   bloco["cartas_A"], bloco["cartas_B"])
+            return (cartas_abre == zap).any(axis=1)
+
+        selecionadas = corpus.filtra(abre_com_zap, ("quem_abre", "vencedor"))
+        vitorias = np.mean(selecionadas["vencedor"]
+                           == selecionadas["quem_abre"])
+        print(f"quem abre com o zap vence {vitorias:.1%} de "
+              f"{len(selecionadas['vencedor'])} mãos")
+
+        corridas = corpus.conta(lambda bloco: bloco["quem_correu"] > 0)
+        print(f"mãos decididas por corrida: "
+              f"{corridas / corpus.num_registros:.1%}")
@@ -0,0 +1,88 @@
+from enum import Enum
+from numbers import Integral
+from .jogador import Jogador
+from .ponto import Ponto
+
+class TipoDecisao(Enum):
+    """
+    Enumera as decisões que um jogador pode ter de tomar durante o jogo.
+
+    Valores:
+        CARTA (1): Escolher a carta a jogar.
+        PEDIR_TRUCO (2): Decidir se pede aumento da aposta.
+        RESPONDER_TRUCO (3): Responder a um pedido de aumento da aposta.
+    """
+    CARTA = 1
+    PEDIR_TRUCO = 2
+    RESPONDER_TRUCO = 3
+
+class Decisao:
+    """
+    Representa um pedido de decisão feito por `Jogo.passos` a um jogador.
+
+    A resposta esperada depende do tipo: o índice da carta escolhida em
+    `opcoes` (CARTA), um booleano (PEDIR_TRUCO) ou um TipoRespostaTruco
+    entre os de `opcoes` (RESPONDER_TRUCO).
+
+    Atributos:
+        tipo (TipoDecisao): O tipo da decisão.
+        jogador (Jogador): O jogador que deve decidir.
+        opcoes (list): As opções permitidas: as cartas disponíveis, [False, True]
+                       ou as respostas permitidas ao truco.
+        mao (Mao): A mão em andamento.
+        valor (Ponto): Valor que seria pedido (PEDIR_TRUCO) ou valor da mão
+                       antes do pedido (RESPONDER_TRUCO).
+        proponente (Jogador): Quem fez o pedido, em RESPONDER_TRUCO.
+
+    Métodos:
+        valida(resposta): Verifica se uma resposta é permitida.
+    """
+
+    def __init__(self, tipo: TipoDecisao, jogador: Jogador, opcoes: list,
+                 mao, valor: Ponto = None, proponente: Jogador = None):
+        """
+        Inicializa uma nova instância da classe Decisao.
+
+        Args:
+            tipo (TipoDecisao): O tipo da decisão.
+            jogador (Jogador): O jogador que deve decidir.
+            opcoes (list): As opções permitidas.
+            mao (Mao): A mão em andamento.
+            valor (Ponto, opcional): Valor associado ao pedido de truco.
+            proponente (Jogador, opcional): Quem fez o pedido de truco.
+        """
+        self.tipo = tipo
+        self.jogador = jogador
+        self.opcoes = opcoes
+        self.mao = mao
+        self.valor = valor
+        self.proponente = proponente
+
+    def valida(self, resposta):
+        """
+        Verifica se uma resposta é permitida nesta decisão.
+
+        Args:
+            resposta: A resposta do jogador.
+
+        Raises:
+            ValueError: Se a resposta não for permitida.
+        """
+        if self.tipo == TipoDecisao.CARTA:
+            if (isinstance(resposta, bool)
+                    or not isinstance(resposta, Integral)
+                    or not 0 <= resposta < len(self.opcoes)):
+                raise ValueError(f"Escolha de carta inválida: {resposta!r}.")
+        elif resposta not in self.opcoes:
+            raise ValueError(f"Resposta inválida para {self.tipo.name}: "
+                             f"{resposta!r}.")
+
+    def __repr__(self):
+        """
+        Retorna uma representação detalhada da decisão para depuração.
+
+        Returns:
+            str: Representação da decisão.
+        """
+        return (f"Decisao(tipo={self.tipo.name}, jogador={self.jogador.nome}, "
+                f"opcoes={self.opcoes})")
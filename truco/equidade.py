@@ -0,0 +1,252 @@
+from itertools import combinations, permutations, product
+import numpy as np
+from .baralho import Baralho
+from .carta import Carta
+from .jogada import Vencedor
+from .mao import Mao
+
+
+def _tabela_resultados() -> np.ndarray:
+    """
+    Calcula o vencedor da mão para cada sequência de três jogadas.
+
+    A sequência (r0, r1, r2) de códigos de Vencedor ocupa a posição
+    r0 + 3*r1 + 9*r2. As regras são as de `Mao.mao_acabou` e
+    `Mao.quem_ganhou_a_mao`: jogadas posteriores ao fim da mão são ignoradas.
+
+    Returns:
+        numpy.ndarray: Código de Vencedor da mão para cada sequência.
+    """
+    tabela = np.zeros(27, dtype=np.int8)
+    for sequencia in product(Vencedor, repeat=3):
+        mao = Mao()
+        for vencedor in sequencia:
+            mao.adiciona_vencedor(vencedor)
+            if mao.mao_acabou():
+                break
+        indice = sum(v.value * 3**i for i, v in enumerate(sequencia))
+        tabela[indice] = mao.quem_ganhou_a_mao().value
+    return tabela
+
+
+class CalculadoraEquidade:
+    """
+    Calcula a probabilidade exata de vencer uma mão a partir das cartas.
+
+    Todas as mãos do adversário compatíveis com as cartas conhecidas são
+    enumeradas, e cada jogador escolhe suas cartas ao acaso, como os jogadores
+    máquina de `Interface`. O resultado de cada mão segue as regras de
+    empate de `Mao.mao_acabou` e `Mao.quem_ganhou_a_mao`.
+
+    Como o resultado só depende dos valores das cartas, as consultas são
+    memorizadas pelos valores envolvidos, e consultas repetidas custam uma
+    busca em dicionário.
+
+    Com manilha variável, as cartas são identificadas pelo índice (o nome
+    das manilhas muda com a vira) e valem o que valem sob a vira da mão,
+    que também não pode estar com o adversário.
+
+    Atributos:
+        baralho (Baralho): Baralho de onde as mãos são tiradas.
+
+    Métodos:
+        calcula(cartas, vistas, historico, carta_adversario): Retorna as
+            probabilidades de vitória, empate e derrota.
+    """
+
+    # Vencedor de cada sequência de jogadas, compartilhado entre instâncias
+    _resultados = _tabela_resultados()
+
+    def __init__(self, baralho: Baralho = None):
+        """
+        Inicializa uma nova instância da classe CalculadoraEquidade.
+
+        Args:
+            baralho (Baralho, opcional): Baralho usado na enumeração. Padrão é
+                o baralho distribuído com o pacote.
+        """
+        self.baralho = baralho if baralho is not None else Baralho()
+        self._valores_por_vira = {}
+        self._combinacoes = {}
+        self._permutacoes = {}
+        self._memo = {}
+
+    def calcula(self, cartas: list[Carta], vistas: list[Carta] = (),
+                historico: list[Vencedor] = (),
+                carta_adversario: Carta = None,
+                vira: Carta = None) -> tuple[float, float, float]:
+        """
+        Retorna as probabilidades de vitória, empate e derrota na mão.
+
+        O jogador é tratado como o jogador A das jogadas. O adversário tem
+        o mesmo número de cartas que o jogador, ou uma a menos se já tiver
+        jogado `carta_adversario` na jogada atual.
+
+        Args:
+            cartas (list[Carta]): Cartas que o jogador ainda tem na mão.
+            vistas (list[Carta], opcional): Cartas que com certeza não estão
+                com o adversário (por exemplo, cartas já jogadas).
+            historico (list[Vencedor], opcional): Vencedores das jogadas já
+                disputadas nesta mão.
+            carta_adversario (Carta, opcional): Carta que o adversário já
+                jogou na jogada atual.
+            vira (Carta, opcional): Vira da mão, com manilha variável.
+
+        Returns:
+            tuple[float, float, float]: Probabilidades de vitória, empate e
+                derrota do jogador.
+
+        Raises:
+            ValueError: Se o número de cartas não for compatível com o
+                histórico da mão.
+        """
+        if not 1 <= len(cartas) <= 3 or len(cartas) + len(historico) != 3:
+            raise ValueError("O número de cartas na mão e de jogadas no "
+                             "histórico deve somar 3.")
+
+        ids = [carta.indice for carta in cartas]
+        ids_vistas = [carta.indice for carta in vistas]
+        if vira is not None:
+            ids_vistas.append(vira.indice)
+        id_adversario = (None if carta_adversario is None
+                         else carta_adversario.indice)
+        valores, lista_valores = self._valores_da_vira(vira)
+        # O valor da vira, o seu posto, define o valor das demais cartas
+        chave = (
+            tuple(sorted([lista_valores[iden] for iden in ids])),
+            tuple(sorted([lista_valores[iden] for iden in ids_vistas])),
+            tuple([vencedor.value for vencedor in historico]),
+            None if id_adversario is None else lista_valores[id_adversario],
+            None if vira is None else vira.valor,
+        )
+        resultado = self._memo.get(chave)
+        if resultado is None:
+            resultado = self._enumera(valores, ids, ids_vistas, historico,
+                                      id_adversario)
+            self._memo[chave] = resultado
+        return resultado
+
+    def _valores_da_vira(self, vira: Carta) -> tuple[np.ndarray, list]:
+        """
+        Retorna o valor de cada carta sob uma vira, criado uma vez por posto.
+
+        Args:
+            vira (Carta ou None): A vira, ou None para as cartas do arquivo.
+
+        Returns:
+            tuple[numpy.ndarray, list]: Os valores por identificador, como
+                array e como lista.
+        """
+        chave = None if vira is None else vira.valor
+        em_cache = self._valores_por_vira.get(chave)
+        if em_cache is None:
+            valores = np.array([carta.valor for carta
+                                in self.baralho.cartas_da_vira(vira)],
+                               dtype=np.int8)
+            em_cache = self._valores_por_vira[chave] = (valores,
+                                                        valores.tolist())
+        return em_cache
+
+    def _enumera(self, valores: np.ndarray, ids: list[int],
+                 ids_vistas: list[int], historico: list[Vencedor],
+                 id_adversario: int) -> tuple[float, float, float]:
+        """
+        Enumera as mãos do adversário e as ordens de jogo de uma consulta.
+
+        Args:
+            valores (numpy.ndarray): Valor de cada carta, por identificador.
+            ids (list[int]): Identificadores das cartas do jogador.
+            ids_vistas (list[int]): Identificadores das cartas vistas.
+            historico (list[Vencedor]): Vencedores das jogadas anteriores.
+            id_adversario (int ou None): Carta já jogada pelo adversário.
+
+        Returns:
+            tuple[float, float, float]: Probabilidades de vitória, empate e
+                derrota do jogador.
+        """
+        num_cartas = len(ids)
+        num_adversario = num_cartas - (id_adversario is not None)
+        excluidas = 0
+        for iden in (*ids, *ids_vistas):
+            excluidas |= 1 << iden
+        if id_adversario is not None:
+            excluidas |= 1 << id_adversario
+
+        # Valores das cartas do jogador em cada ordem de jogo: (Pj, n)
+        proprias = valores[ids][self._permutacao(num_cartas)]
+
+        # Valores das cartas do adversário em cada mão e ordem: (M, Pa, n)
+        if num_adversario:
+            combinacoes, mascaras = self._combinacao(num_adversario)
+            validas = combinacoes[(mascaras & np.uint64(excluidas)) == 0]
+            adversarias = valores[validas][:, self._permutacao(num_adversario)]
+        else:
+            adversarias = np.zeros((1, 1, 0), dtype=np.int8)
+        if id_adversario is not None:
+            na_mesa = np.full(adversarias.shape[:2] + (1,),
+                              valores[id_adversario], dtype=np.int8)
+            adversarias = np.concatenate((na_mesa, adversarias), axis=2)
+
+        # Código de Vencedor de cada jogada restante: (Pj, M, Pa, n)
+        proprias = proprias[:, None, None, :]
+        adversarias = adversarias[None]
+        codigos = np.where(proprias > adversarias, Vencedor.A.value,
+                           np.where(proprias < adversarias, Vencedor.B.value,
+                                    Vencedor.Nenhum.value))
+
+        inicio = len(historico)
+        pesos = 3 ** np.arange(inicio, 3)
+        indices = (codigos * pesos).sum(axis=-1)
+        indices += sum(v.value * 3**i for i, v in enumerate(historico))
+        contagem = np.bincount(self._resultados[indices].ravel(), minlength=3)
+        total = contagem.sum()
+        return (float(contagem[Vencedor.A.value] / total),
+                float(contagem[Vencedor.Nenhum.value] / total),
+                float(contagem[Vencedor.B.value] / total))
+
+    def _combinacao(self, tamanho: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Retorna todas as mãos de um tamanho, com suas máscaras de bits.
+
+        Args:
+            tamanho (int): Número de cartas por mão.
+
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: Identificadores das cartas de
+                cada mão, de formato (M, tamanho), e a máscara de bits de cada
+                mão.
+        """
+        if tamanho not in self._combinacoes:
+            combinacoes = np.array(
+                list(combinations(range(self.baralho.num_cartas), tamanho)),
+                dtype=np.intp)
+            mascaras = np.bitwise_or.reduce(
+                np.left_shift(np.uint64(1), combinacoes.astype(np.uint64)),
+                axis=1)
+            self._combinacoes[tamanho] = (combinacoes, mascaras)
+        return self._combinacoes[tamanho]
+
+    def _permutacao(self, tamanho: int) -> np.ndarray:
+        """
+        Retorna todas as ordens possíveis de jogar um número de cartas.
+
+        Args:
+            tamanho (int): Número de cartas.
+
+        Returns:
+            numpy.ndarray: Permutações de formato (tamanho!, tamanho).
+        """
+        if tamanho not in self._permutacoes:
+            self._permutacoes[tamanho] = np.array(
+                list(permutations(range(tamanho))), dtype=np.intp)
+        return self._permutacoes[tamanho]
+
+
+if __name__ == "__main__":
+    calculadora = CalculadoraEquidade()
+    baralho = calculadora.baralho
+    cartas, _ = baralho.distribui_cartas()
+    vitoria, empate, derrota = calculadora.calcula(cartas)
+    print("Cartas:", [carta.nome for carta in cartas])
+    print(f"Vitória: {vitoria:.4f}, empate: {empate:.4f}, "
+          f"derrota: {derrota:.4f}")
@@ -0,0 +1,252 @@
+from .baralho import Baralho
+from .interface import Interface
+from .jogada import Vencedor
+from .jogador import Jogador
+from .jogo import Jogo
+from .mao import Mao
+
+# Números de lugares suportados: um contra um, duplas e trios
+NUM_LUGARES = (2, 4, 6)
+
+# ORDEM_FALA[n][abre]: ordem em que os n lugares jogam e falam quando o
+# lugar `abre` começa a jogada. Os lugares se alternam entre as equipes,
+# então o lugar seguinte é sempre um adversário.
+ORDEM_FALA = {n: tuple(tuple((abre + k) % n for k in range(n))
+                       for abre in range(n))
+              for n in NUM_LUGARES}
+
+# EQUIPE[n][lugar]: equipe de cada lugar; lugares pares são da equipe A
+EQUIPE = {n: tuple(Vencedor.A if lugar % 2 == 0 else Vencedor.B
+                   for lugar in range(n))
+          for n in NUM_LUGARES}
+
+
+def resolve_jogada(cartas: list, ordem: tuple, equipe: tuple) -> tuple:
+    """
+    Determina a equipe que vence uma jogada e o lugar que a venceu.
+
+    Vence a maior carta. Se a maior carta aparece nas duas equipes, a jogada
+    empata; se aparece mais de uma vez na mesma equipe, vence o lugar que a
+    jogou primeiro.
+
+    Args:
+        cartas (list[Carta]): A carta jogada por cada lugar.
+        ordem (tuple[int]): Os lugares, na ordem em que jogaram.
+        equipe (tuple[Vencedor]): A equipe de cada lugar.
+
+    Returns:
+        tuple: (Vencedor, lugar), onde o lugar é o primeiro a jogar a maior
+            carta, ou None se a jogada empatou.
+    """
+    lugar_maior = ordem[0]
+    maior = cartas[lugar_maior]
+    empate = False
+    for lugar in ordem[1:]:
+        carta = cartas[lugar]
+        if carta > maior:
+            lugar_maior, maior, empate = lugar, carta, False
+        elif carta == maior and equipe[lugar] is not equipe[lugar_maior]:
+            empate = True
+    if empate:
+        return Vencedor.Nenhum, None
+    return equipe[lugar_maior], lugar_maior
+
+
+class JogoEquipes(Jogo):
+    """
+    Controla um jogo de truco entre duas equipes, em duplas ou trios.
+
+    Os lugares se alternam entre as equipes (lugares pares na equipe A,
+    ímpares na equipe B). A ordem de jogo e de fala, a equipe de cada lugar
+    e o adversário que responde a cada pedido de truco vêm das tabelas
+    `ORDEM_FALA` e `EQUIPE`. Cada jogada vai para a equipe da maior carta,
+    com empate quando as duas equipes a jogam; quem jogou a maior carta abre
+    a jogada seguinte. Os pedidos de truco, a mão de 10, a pontuação e a
+    regra de que a mão empatada vai para a equipe B são os mesmos de `Jogo`.
+
+    O `id` de cada jogador é a sua equipe e os pontos de cada jogador são os
+    da sua equipe. Os jogadores devem ser humanos ou máquinas: as
+    estratégias de `truco.estrategia` supõem um jogo entre dois jogadores.
+    A mão entregue à interface tem em `cartas_A` e `cartas_B` as cartas dos
+    lugares 0 e 1 e, em `cartas_distribuidas`, as de todos os lugares.
+
+    Métodos:
+        comecar(jogadores, baralho, quem_abre): Inicia um novo jogo.
+        passos(jogadores, baralho, quem_abre): Executa um jogo passo a passo.
+    """
+
+    def __init__(self, interface: Interface,
+                 rng: "numpy.random.Generator" = None, instrumentacao=None,
+                 regras=None):
+        """
+        Inicializa uma nova instância da classe JogoEquipes.
+
+        Args:
+            interface (Interface): Objeto de interface para interação com os jogadores.
+            rng (numpy.random.Generator ou random.Random, opcional): Gerador
+                usado para sortear o lugar que começa o jogo.
+            instrumentacao (Instrumentacao, opcional): Recebe as contagens de
+                eventos e os tempos de cada fase do jogo.
+            regras (Regras, opcional): Regras do jogo.
+        """
+        super().__init__(interface, rng, None, instrumentacao, regras)
+
+    def comecar(self, jogadores: list, baralho: Baralho, quem_abre: int = None):
+        """
+        Inicia um novo jogo entre equipes.
+
+        Args:
+            jogadores (list[Jogador]): Os jogadores, na ordem dos lugares.
+            baralho (Baralho): Baralho de cartas a ser usado no jogo.
+            quem_abre (int, opcional): Lugar que abre a primeira mão. Se não
+                for fornecido, é sorteado.
+
+        Returns:
+            Jogador: O jogador do primeiro lugar da equipe vencedora.
+        """
+        passos = self.passos(jogadores, baralho, quem_abre)
+        try:
+            decisao = next(passos)
+            while True:
+                decisao = passos.send(self.interface.decide(decisao))
+        except StopIteration as fim:
+            return fim.value
+
+    def passos(self, jogadores: list, baralho: Baralho, quem_abre: int = None):
+        """
+        Executa um jogo entre equipes passo a passo, como `Jogo.passos`.
+
+        Args:
+            jogadores (list[Jogador]): Os jogadores, na ordem dos lugares.
+            baralho (Baralho): Baralho de cartas a ser usado no jogo.
+            quem_abre (int, opcional): Lugar que abre a primeira mão. Se não
+                for fornecido, é sorteado.
+
+        Yields:
+            Decisao: A próxima decisão a ser tomada.
+
+        Returns:
+            Jogador: O jogador do primeiro lugar da equipe vencedora, como
+                valor de StopIteration.
+
+        Raises:
+            ValueError: Se o número de jogadores não estiver em `NUM_LUGARES`
+                ou se algum jogador tiver estratégia.
+        """
+        num_lugares = len(jogadores)
+        if num_lugares not in ORDEM_FALA:
+            raise ValueError(f"Número de jogadores não suportado: {num_lugares}.")
+        if any(jogador.estrategia is not None for jogador in jogadores):
+            raise ValueError("Jogos entre equipes não aceitam estratégias.")
+        ordem_fala = ORDEM_FALA[num_lugares]
+        equipe = EQUIPE[num_lugares]
+        primeiro = {Vencedor.A: jogadores[0], Vencedor.B: jogadores[1]}
+        for lugar, jogador in enumerate(jogadores):
+            jogador.iniciar_pontos()
+            jogador.adicionar_id(equipe[lugar])
+        if self.regras is not None and baralho.regras is not self.regras:
+            baralho.aplica_regras(self.regras)
+        instrumentacao = self.instrumentacao
+
+        # Sorteia o lugar que começa o jogo, se não foi definido
+        if quem_abre is None:
+            quem_abre = int(self._rand() * num_lugares)
+        abre = quem_abre
+
+        while True:
+            self.interface.informa_quem_abre(jogadores[abre])
+
+            # Distribui as cartas
+            if instrumentacao is not None:
+                inicio = instrumentacao.relogio()
+            mao = Mao()
+            cartas = baralho.distribui_maos(num_lugares)
+            mao.cartas_A, mao.cartas_B = cartas[0], cartas[1]
+            mao.cartas_distribuidas = tuple(tuple(maos) for maos in cartas)
+            mao.vira = baralho.vira
+            if self.regras is not None:
+                self._aplica_regras(mao, primeiro[Vencedor.A],
+                                    primeiro[Vencedor.B])
+            if instrumentacao is not None:
+                instrumentacao.maos += 1
+                instrumentacao.mede("distribuicao", inicio)
+            self.interface.informa_nova_mao(mao, primeiro[Vencedor.A],
+                                            primeiro[Vencedor.B])
+
+            # Loop da mão atual: cada lugar joga na ordem da tabela
+            alguem_correu = False
+            while not mao.mao_acabou():
+                jogadas = [None] * num_lugares
+                for lugar in ordem_fala[abre]:
+                    adversario = jogadores[ordem_fala[lugar][1]]
+                    escolha, mao, alguem_correu, quem_correu, valor = yield from self._vez(
+                        jogadores[lugar], cartas[lugar], adversario, mao
+                    )
+                    if alguem_correu:
+                        # Quem fez o último pedido abre a próxima mão
+                        abre = (lugar if equipe[lugar] is not quem_correu
+                                else ordem_fala[lugar][1])
+                        break
+                    jogadas[lugar] = cartas[lugar].pop(escolha)
+                if alguem_correu:
+                    break
+
+                if instrumentacao is not None:
+                    inicio = instrumentacao.relogio()
+                vencedor, lugar_vencedor = resolve_jogada(
+                    jogadas, ordem_fala[abre], equipe)
+                mao.adiciona_vencedor(vencedor)
+                mao.cartas_jogadas.append(tuple(jogadas))
+                mao.carta_na_mesa = None
+                if lugar_vencedor is not None:
+                    abre = lugar_vencedor
+                if instrumentacao is not None:
+                    instrumentacao.mede("resolucao", inicio)
+                    instrumentacao.jogadas += 1
+                    if vencedor == Vencedor.Nenhum:
+                        instrumentacao.empates += 1
+                self.interface.informa_placar_mao(primeiro[Vencedor.A],
+                                                  primeiro[Vencedor.B], mao)
+
+            # Pontua a mão; a mão empatada vai para a equipe B
+            if instrumentacao is not None:
+                inicio = instrumentacao.relogio()
+            if not alguem_correu:
+                valor = mao.quanto_vale_a_mao()
+                vencedor = (Vencedor.A if mao.quem_ganhou_a_mao() == Vencedor.A
+                            else Vencedor.B)
+            else:
+                vencedor = (Vencedor.B if quem_correu == Vencedor.A
+                            else Vencedor.A)
+            primeiro[vencedor].aumentar_pontos(valor)
+            for jogador in jogadores:
+                jogador.pontos = primeiro[jogador.id].pontos
+            if instrumentacao is not None:
+                instrumentacao.mede("pontuacao", inicio)
+
+            self.interface.informa_placar_jogo(primeiro[Vencedor.A],
+                                               primeiro[Vencedor.B])
+            if self._verifica_fim_jogo(primeiro[Vencedor.A],
+                                       primeiro[Vencedor.B]):
+                vencedor = self._define_vencedor(primeiro[Vencedor.A],
+                                                 primeiro[Vencedor.B])
+                self.interface.mostra_vencedor(vencedor)
+                return vencedor
+
+
+if __name__ == "__main__":
+    import numpy as np
+    from .interface import InterfaceSilenciosa
+    from .jogador import TipoJogador
+
+    rng = np.random.default_rng(0)
+    jogo = JogoEquipes(InterfaceSilenciosa(rng), rng)
+    baralho = Baralho(rng=rng)
+    for num_lugares in NUM_LUGARES:
+        jogadores = [Jogador(f"J{lugar}", TipoJogador.MAQUINA)
+                     for lugar in range(num_lugares)]
+        vitorias = {Vencedor.A: 0, Vencedor.B: 0}
+        for _ in range(2000):
+            vitorias[jogo.comecar(jogadores, baralho).id] += 1
+        print(f"{num_lugares} lugares: vitórias A {vitorias[Vencedor.A]}, "
+              f"B {vitorias[Vencedor.B]}")
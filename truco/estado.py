@@ -0,0 +1,309 @@
+from .baralho import Baralho
+from .jogada import Vencedor
+from .jogador import Jogador
+from .mao import Mao
+from .ponto import Ponto, TipoPontos
+
+# Posição de cada campo no inteiro de estado; as cartas ocupam 40 bits cada
+BITS_CARTAS = 40
+_CARTAS_A = 0
+_CARTAS_B = _CARTAS_A + BITS_CARTAS
+_NUM_JOGADAS = _CARTAS_B + BITS_CARTAS       # 2 bits: jogadas concluídas
+_JOGADAS = _NUM_JOGADAS + 2                  # 3 x 2 bits: Vencedor de cada uma
+_NIVEL = _JOGADAS + 6                        # 3 bits: índice em TipoPontos
+_BITS_PONTOS = 5
+_PONTOS_A = _NIVEL + 3                       # 5 bits
+_PONTOS_B = _PONTOS_A + _BITS_PONTOS         # 5 bits
+_VEZ = _PONTOS_B + _BITS_PONTOS              # 2 bits: Vencedor da vez
+_MESA = _VEZ + 2                             # 6 bits: índice da carta + 1
+
+_MASCARA_CARTAS = (1 << BITS_CARTAS) - 1
+_NIVEIS = tuple(TipoPontos)
+_INDICE_NIVEL = {tipo: nivel for nivel, tipo in enumerate(_NIVEIS)}
+_VENCEDORES = tuple(Vencedor(valor) for valor in range(3))
+
+
+def mascara_cartas(cartas) -> int:
+    """
+    Retorna a máscara de bits de um conjunto de cartas.
+
+    O bit i da máscara indica a carta da linha i de `cartas.csv`
+    (`Carta.indice`).
+
+    Args:
+        cartas (iterable[Carta]): As cartas.
+
+    Returns:
+        int: A máscara de bits.
+
+    Raises:
+        ValueError: Se alguma carta não tiver índice no baralho.
+    """
+    mascara = 0
+    for carta in cartas:
+        if carta.indice is None or carta.indice >= BITS_CARTAS:
+            raise ValueError(f"A carta {carta} não tem índice no baralho.")
+        mascara |= 1 << carta.indice
+    return mascara
+
+
+def indices_da_mascara(mascara: int) -> list[int]:
+    """
+    Retorna os índices das cartas de uma máscara, em ordem crescente.
+
+    Args:
+        mascara (int): A máscara de bits.
+
+    Returns:
+        list[int]: Os índices dos bits ligados.
+    """
+    indices = []
+    while mascara:
+        menor = mascara & -mascara
+        indices.append(menor.bit_length() - 1)
+        mascara ^= menor
+    return indices
+
+
+class EstadoCompacto:
+    """
+    Estado imutável de uma mão codificado em um único inteiro.
+
+    As cartas em mão de cada jogador são máscaras de 40 bits sobre as cartas
+    de `cartas.csv`; o resultado das jogadas, o valor da mão, o placar, o
+    jogador da vez e a carta na mesa ocupam mais alguns bits. Copiar um
+    estado é copiar uma referência, comparar e calcular o hash custam o
+    mesmo que para um inteiro pequeno, e o estado pode ser usado como chave
+    de dicionário em tabelas de transposição e caches.
+
+    A ordem das cartas na mão de cada jogador e o histórico de jogadas e
+    apostas não fazem parte do estado.
+
+    Atributos:
+        bits (int): O estado codificado.
+
+    Métodos:
+        de_mao(mao, jogador_A, jogador_B): Codifica uma mão e o placar.
+        para_mao(baralho): Reconstrói a mão correspondente.
+        aplica_placar(jogador_A, jogador_B): Copia o placar para os jogadores.
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, bits: int = 0):
+        """
+        Inicializa um estado a partir do inteiro codificado.
+
+        Args:
+            bits (int, opcional): O estado codificado. Padrão é 0.
+        """
+        object.__setattr__(self, "bits", bits)
+
+    def __setattr__(self, nome, valor):
+        """
+        Impede a alteração de um EstadoCompacto.
+
+        Raises:
+            AttributeError: Sempre, pois o estado é imutável.
+        """
+        raise AttributeError("EstadoCompacto é imutável.")
+
+    @classmethod
+    def de_mao(cls, mao: Mao, jogador_A: Jogador = None,
+               jogador_B: Jogador = None) -> "EstadoCompacto":
+        """
+        Codifica uma mão e, opcionalmente, o placar dos jogadores.
+
+        Args:
+            mao (Mao): A mão a codificar.
+            jogador_A (Jogador, opcional): Jogador A, de onde vem o placar.
+            jogador_B (Jogador, opcional): Jogador B, de onde vem o placar.
+
+        Returns:
+            EstadoCompacto: O estado correspondente.
+
+        Raises:
+            ValueError: Se alguma carta não tiver índice no baralho ou se
+                um placar não couber em 5 bits (0 a 31).
+        """
+        bits = (mascara_cartas(mao.cartas_A) << _CARTAS_A
+                | mascara_cartas(mao.cartas_B) << _CARTAS_B
+                | len(mao.vencedor_jogadas) << _NUM_JOGADAS
+                | _INDICE_NIVEL[mao.pontos.valor] << _NIVEL)
+        for jogada, vencedor in enumerate(mao.vencedor_jogadas):
+            bits |= vencedor.value << (_JOGADAS + 2 * jogada)
+        for jogador, deslocamento in ((jogador_A, _PONTOS_A),
+                                      (jogador_B, _PONTOS_B)):
+            if jogador is None:
+                continue
+            if not 0 <= jogador.pontos < 1 << _BITS_PONTOS:
+                raise ValueError(f"O placar de {jogador.nome} "
+                                 f"({jogador.pontos}) não cabe em "
+                                 f"{_BITS_PONTOS} bits.")
+            bits |= jogador.pontos << deslocamento
+        if mao.vez is not None:
+            bits |= mao.vez.value << _VEZ
+        if mao.carta_na_mesa is not None:
+            bits |= (mao.carta_na_mesa.indice + 1) << _MESA
+        return cls(bits)
+
+    def para_mao(self, baralho: Baralho) -> Mao:
+        """
+        Reconstrói a mão correspondente ao estado.
+
+        As cartas de cada jogador ficam em ordem crescente de índice, e o
+        histórico da mão (`cartas_jogadas`, `apostas`) fica vazio.
+
+        Args:
+            baralho (Baralho): Baralho que define os índices das cartas.
+
+        Returns:
+            Mao: A mão reconstruída.
+        """
+        cartas = baralho.cartas_por_id
+        mao = Mao()
+        mao.cartas_A = [cartas[i] for i in indices_da_mascara(self.cartas_A)]
+        mao.cartas_B = [cartas[i] for i in indices_da_mascara(self.cartas_B)]
+        mao.vencedor_jogadas = list(self.vencedores)
+        mao.pontos = self.ponto
+        mao.vez = self.vez
+        mesa = self.bits >> _MESA & 63
+        mao.carta_na_mesa = cartas[mesa - 1] if mesa else None
+        return mao
+
+    def aplica_placar(self, jogador_A: Jogador, jogador_B: Jogador):
+        """
+        Copia o placar do estado para os jogadores.
+
+        Args:
+            jogador_A (Jogador): Jogador A.
+            jogador_B (Jogador): Jogador B.
+        """
+        jogador_A.pontos = self.pontos_A
+        jogador_B.pontos = self.pontos_B
+
+    @property
+    def cartas_A(self) -> int:
+        """
+        Máscara das cartas em mão do jogador A.
+        """
+        return self.bits >> _CARTAS_A & _MASCARA_CARTAS
+
+    @property
+    def cartas_B(self) -> int:
+        """
+        Máscara das cartas em mão do jogador B.
+        """
+        return self.bits >> _CARTAS_B & _MASCARA_CARTAS
+
+    @property
+    def vencedores(self) -> tuple:
+        """
+        Vencedor de cada jogada concluída.
+        """
+        num_jogadas = self.bits >> _NUM_JOGADAS & 3
+        jogadas = self.bits >> _JOGADAS
+        return tuple(_VENCEDORES[jogadas >> (2 * i) & 3]
+                     for i in range(num_jogadas))
+
+    @property
+    def ponto(self) -> Ponto:
+        """
+        Valor atual da mão.
+        """
+        return Ponto(_NIVEIS[self.bits >> _NIVEL & 7])
+
+    @property
+    def pontos_A(self) -> int:
+        """
+        Pontos do jogador A no jogo.
+        """
+        return self.bits >> _PONTOS_A & 31
+
+    @property
+    def pontos_B(self) -> int:
+        """
+        Pontos do jogador B no jogo.
+        """
+        return self.bits >> _PONTOS_B & 31
+
+    @property
+    def vez(self) -> Vencedor:
+        """
+        Jogador da vez, ou None se não estiver definido.
+        """
+        vez = self.bits >> _VEZ & 3
+        return _VENCEDORES[vez] if vez else None
+
+    def __eq__(self, outro) -> bool:
+        """
+        Compara dois estados.
+
+        Args:
+            outro (EstadoCompacto): O outro estado.
+
+        Returns:
+            bool: True se os estados forem iguais.
+        """
+        return (isinstance(outro, EstadoCompacto)
+                and self.bits == outro.bits)
+
+    def __hash__(self) -> int:
+        """
+        Retorna o hash do estado.
+
+        Returns:
+            int: O hash do inteiro codificado.
+        """
+        return hash(self.bits)
+
+    def __copy__(self):
+        """
+        Retorna o próprio estado, já que ele é imutável.
+        """
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        Retorna o próprio estado, já que ele é imutável.
+        """
+        return self
+
+    def __reduce__(self):
+        """
+        Permite serializar o estado.
+
+        Returns:
+            tuple: A classe e o inteiro codificado.
+        """
+        return (EstadoCompacto, (self.bits,))
+
+    def __repr__(self):
+        """
+        Retorna uma representação detalhada do estado para depuração.
+
+        Returns:
+            str: Representação do estado.
+        """
+        return f"EstadoCompacto({self.bits:#x})"
+
+
+if __name__ == "__main__":
+    import copy
+    import timeit
+
+    baralho = Baralho()
+    mao = Mao()
+    mao.coleta_cartas(baralho)
+    mao.quem_ganhou_jogada(0, 0)
+    mao.aumenta_pontos()
+    estado = EstadoCompacto.de_mao(mao)
+    print(estado, [str(carta) for carta in estado.para_mao(baralho).cartas_A],
+          estado.vencedores, estado.ponto)
+
+    vezes = 100000
+    print(f"cópia de Mao: "
+          f"{timeit.timeit(lambda: copy.deepcopy(mao), number=vezes) / vezes * 1e6:.2f} us | "
+          f"cópia de estado: "
+          f"{timeit.timeit(lambda: copy.copy(estado), number=vezes) / vezes * 1e6:.2f} us | "
+          f"hash: {timeit.timeit(lambda: hash(estado), number=vezes) / vezes * 1e6:.2f} us")
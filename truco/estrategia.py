@@ -0,0 +1,68 @@
+from .carta import Carta
+from .jogador import Jogador
+from .mao import Mao
+from .ponto import Ponto
+
+
+class Estrategia:
+    """
+    Classe base para as estratégias que decidem por um jogador máquina.
+
+    Um jogador com estratégia (por exemplo, do tipo TipoJogador.CFR) tem
+    suas decisões delegadas pela `Interface` aos métodos abaixo, que recebem
+    o jogador, seu adversário e a mão em andamento.
+
+    Métodos:
+        escolhe_carta(jogador, adversario, mao, cartas): Escolhe a carta a jogar.
+        pergunta_truco(jogador, adversario, mao, proposto): Decide se pede truco.
+        responde_truco(jogador, adversario, mao, proposto): Responde a um pedido.
+    """
+
+    def escolhe_carta(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                      cartas: list[Carta]) -> int:
+        """
+        Escolhe a carta a jogar.
+
+        Args:
+            jogador (Jogador): O jogador da vez.
+            adversario (Jogador): O outro jogador.
+            mao (Mao): A mão em andamento.
+            cartas (list[Carta]): Cartas disponíveis para escolha.
+
+        Returns:
+            int: Índice da carta escolhida na lista.
+        """
+        raise NotImplementedError
+
+    def pergunta_truco(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                       proposto: Ponto) -> bool:
+        """
+        Decide se o jogador pede aumento da aposta.
+
+        Args:
+            jogador (Jogador): O jogador da vez.
+            adversario (Jogador): O outro jogador.
+            mao (Mao): A mão em andamento.
+            proposto (Ponto): O valor que seria pedido.
+
+        Returns:
+            bool: True para pedir, False caso contrário.
+        """
+        raise NotImplementedError
+
+    def responde_truco(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                       proposto: Ponto):
+        """
+        Responde a um pedido de aumento da aposta.
+
+        Args:
+            jogador (Jogador): O jogador que responde.
+            adversario (Jogador): O jogador que pediu.
+            mao (Mao): A mão em andamento.
+            proposto (Ponto): O valor pedido.
+
+        Returns:
+            TipoRespostaTruco: ACEITAR, CORRER ou, se `proposto` não for
+                queda, AUMENTAR.
+        """
+        raise NotImplementedError
@@ -0,0 +1,141 @@
+from time import perf_counter_ns
+from .ponto import TipoPontos
+
+# Fases cronometradas de uma mão
+FASES = ("distribuicao", "decisao", "resolucao", "pontuacao")
+
+
+class Instrumentacao:
+    """
+    Contadores de eventos e cronômetros por fase de um `Jogo`.
+
+    Um `Jogo` criado com uma instrumentação atualiza seus contadores a cada
+    mão, jogada e aposta e acumula o tempo gasto em cada fase: distribuição
+    das cartas, decisões dos jogadores, resolução das jogadas e pontuação.
+    Sem instrumentação, o custo no `Jogo` é o de um teste contra None em
+    cada evento.
+
+    Atributos:
+        maos (int): Mãos distribuídas.
+        jogadas (int): Jogadas resolvidas.
+        empates (int): Jogadas empatadas (Vencedor.Nenhum).
+        pedidos (dict): Pedidos de aumento por valor pedido (TipoPontos),
+            incluindo os aumentos feitos em resposta a um pedido.
+        aceites (int): Respostas que aceitaram o pedido.
+        corridas (int): Respostas em que o jogador correu.
+        aumentos (int): Respostas que aumentaram a aposta.
+        tempo_ns (dict): Nanossegundos acumulados em cada fase.
+        chamadas (dict): Número de medições de cada fase.
+
+    Métodos:
+        zera(): Reinicia contadores e cronômetros.
+        mede(fase, inicio): Acumula o tempo de uma fase iniciada em `inicio`.
+        combina(outra): Soma outra instrumentação a esta.
+        retrato(): Retorna um retrato estruturado dos contadores e tempos.
+    """
+
+    # Relógio usado para marcar o início das fases
+    relogio = staticmethod(perf_counter_ns)
+
+    def __init__(self):
+        """
+        Inicializa uma instrumentação zerada.
+        """
+        self.zera()
+
+    def zera(self):
+        """
+        Reinicia contadores e cronômetros.
+        """
+        self.maos = 0
+        self.jogadas = 0
+        self.empates = 0
+        self.pedidos = {tipo: 0 for tipo in TipoPontos
+                        if tipo is not TipoPontos.Comum}
+        self.aceites = 0
+        self.corridas = 0
+        self.aumentos = 0
+        self.tempo_ns = dict.fromkeys(FASES, 0)
+        self.chamadas = dict.fromkeys(FASES, 0)
+
+    def mede(self, fase: str, inicio: int):
+        """
+        Acumula o tempo de uma fase.
+
+        Args:
+            fase (str): Uma das `FASES`.
+            inicio (int): Instante de início, obtido de `relogio()`.
+        """
+        self.tempo_ns[fase] += perf_counter_ns() - inicio
+        self.chamadas[fase] += 1
+
+    def combina(self, outra: "Instrumentacao") -> "Instrumentacao":
+        """
+        Soma os contadores e tempos de outra instrumentação a esta.
+
+        Args:
+            outra (Instrumentacao): Instrumentação a ser somada.
+
+        Returns:
+            Instrumentacao: A própria instrumentação, já atualizada.
+        """
+        self.maos += outra.maos
+        self.jogadas += outra.jogadas
+        self.empates += outra.empates
+        for tipo, quantidade in outra.pedidos.items():
+            self.pedidos[tipo] += quantidade
+        self.aceites += outra.aceites
+        self.corridas += outra.corridas
+        self.aumentos += outra.aumentos
+        for fase in FASES:
+            self.tempo_ns[fase] += outra.tempo_ns[fase]
+            self.chamadas[fase] += outra.chamadas[fase]
+        return self
+
+    def retrato(self) -> dict:
+        """
+        Retorna um retrato estruturado dos contadores e tempos.
+
+        Returns:
+            dict: {"contadores": {...}, "fases": {fase: {"chamadas",
+                "total_ns", "media_ns"}}}, pronto para ser serializado em JSON.
+        """
+        return {
+            "contadores": {
+                "maos": self.maos,
+                "jogadas": self.jogadas,
+                "empates": self.empates,
+                "pedidos": {tipo.name: quantidade
+                            for tipo, quantidade in self.pedidos.items()},
+                "aceites": self.aceites,
+                "corridas": self.corridas,
+                "aumentos": self.aumentos,
+            },
+            "fases": {
+                fase: {"chamadas": self.chamadas[fase],
+                       "total_ns": self.tempo_ns[fase],
+                       "media_ns": (self.tempo_ns[fase]
+                                    / max(self.chamadas[fase], 1))}
+                for fase in FASES
+            },
+        }
+
+
+if __name__ == "__main__":
+    import json
+    import numpy as np
+    from .baralho import Baralho
+    from .interface import InterfaceSilenciosa
+    from .jogador import Jogador, TipoJogador
+    from .jogo import Jogo
+
+    rng = np.random.default_rng(0)
+    instrumentacao = Instrumentacao()
+    jogo = Jogo(InterfaceSilenciosa(rng), rng,
+                instrumentacao=instrumentacao)
+    jogador_A = Jogador("A", TipoJogador.MAQUINA)
+    jogador_B = Jogador("B", TipoJogador.MAQUINA)
+    baralho = Baralho(rng=rng)
+    for _ in range(1000):
+        jogo.comecar(jogador_A, jogador_B, baralho)
+    print(json.dumps(instrumentacao.retrato(), indent=2))
@@ -1,9 +1,10 @@
 from .mao import Mao
 from .baralho import Baralho
 from .jogador import Jogador, TipoJogador
-from numpy.random import randint, rand
+import random
 from .carta import Carta
 from .ponto import TipoPontos, Ponto
+from .decisao import Decisao, TipoDecisao
 from enum import Enum
 
 class TipoRespostaTruco(Enum):
@@ -19,6 +20,23 @@ class TipoRespostaTruco(Enum):
     CORRER = 2
     AUMENTAR = 3
 
+# Resposta associada a cada opção apresentada ao jogador humano
+_OPCOES_RESPOSTA = {
+    '1': TipoRespostaTruco.ACEITAR,
+    '2': TipoRespostaTruco.CORRER,
+    '3': TipoRespostaTruco.AUMENTAR,
+}
+
+# Limiares do sorteio do jogador máquina ao responder um truco, conforme
+# ainda seja possível aumentar a aposta ou não
+_LIMIARES_MAQUINA = {
+    True: ((.33, TipoRespostaTruco.ACEITAR),
+           (.66, TipoRespostaTruco.CORRER),
+           (1., TipoRespostaTruco.AUMENTAR)),
+    False: ((.5, TipoRespostaTruco.ACEITAR),
+            (1., TipoRespostaTruco.CORRER)),
+}
+
 class Interface:
     """
     Gerencia a interface de interação com os jogadores durante o jogo de truco.
@@ -27,9 +45,9 @@ class Interface:
     escolhas e mostrar o estado do jogo.
     
     Métodos:
-        __init__(): Inicializa a interface.
+        __init__(rng): Inicializa a interface.
+        decide(decisao): Obtém a resposta de um jogador a uma decisão do jogo.
         escolhe_carta(jogador, cartas): Solicita ao jogador que escolha uma carta.
-        resposta_ao_truco(jogador_proponente, jogador_resposta, valor): Obtém resposta ao pedido de truco.
         mostra_vencedor(jogador): Exibe o vencedor do jogo.
         informa_quem_abre(jogador): Informa qual jogador inicia a mão.
         pergunta_truco(jogador_proponente, valor): Pergunta se um jogador quer pedir truco.
@@ -37,20 +55,64 @@ class Interface:
         informa_placar_mao(jogador_A, jogador_B, mao): Exibe o placar da mão atual.
         informa_quem_correu(jogador): Informa qual jogador correu.
         mostra_mao(jogador, mao): Exibe as cartas na mão de um jogador.
+        informa_nova_mao(mao, jogador_A, jogador_B): Registra a mão que começa.
+        _exibe(*args, **kwargs): Envia uma mensagem para a saída.
+        _escolhe_resposta(jogador_proponente, jogador_resposta, valor): Obtém uma resposta individual ao truco.
     """
     
-    def __init__(self):
+    def __init__(self, rng: "numpy.random.Generator" = None):
         """
         Inicializa uma nova instância da classe Interface.
+        
+        Args:
+            rng (numpy.random.Generator ou random.Random, opcional): Gerador
+                usado nas decisões dos jogadores máquina. Se não for
+                fornecido, usa o estado global do módulo `random`.
         """
-        pass
+        if rng is None:
+            self._rand = random.random
+            self._randint = random.randrange
+        else:
+            self._rand = rng.random
+            self._randint = getattr(rng, "integers", None) or rng.randrange
+        self.mao = None
+        self.jogadores = ()
+
+    def _exibe(self, *args, **kwargs):
+        """
+        Exibe uma mensagem ao jogador.
+        
+        Todas as saídas da interface passam por este método, de modo que
+        subclasses possam redirecioná-las ou suprimi-las.
+        """
+        print(*args, **kwargs)
+
+    def decide(self, decisao: Decisao):
+        """
+        Obtém a resposta de um jogador a uma decisão entregue por `Jogo.passos`.
+        
+        Args:
+            decisao (Decisao): A decisão a ser tomada.
+            
+        Returns:
+            O índice da carta escolhida, se o jogador pede truco (bool) ou a
+            resposta ao truco (TipoRespostaTruco), conforme o tipo da decisão.
+        """
+        if decisao.tipo == TipoDecisao.CARTA:
+            return self.escolhe_carta(decisao.jogador, decisao.opcoes)
+        elif decisao.tipo == TipoDecisao.PEDIR_TRUCO:
+            return self.pergunta_truco(decisao.jogador, decisao.valor)
+        else:
+            return self._escolhe_resposta(decisao.proponente, decisao.jogador,
+                                          decisao.valor)
 
     def escolhe_carta(self, jogador: Jogador, cartas: list[Carta]) -> int:
         """
         Solicita ao jogador que escolha uma carta entre as disponíveis.
         
         Para jogadores humanos, apresenta as cartas e solicita uma entrada.
-        Para jogadores máquina, escolhe aleatoriamente.
+        Para jogadores máquina, escolhe aleatoriamente. Para jogadores com
+        estratégia, delega a escolha à estratégia.
         
         Args:
             jogador (Jogador): O jogador que fará a escolha.
@@ -59,24 +121,34 @@ class Interface:
         Returns:
             int: Índice da carta escolhida na lista.
         """
-        if jogador.tipo == TipoJogador.HUMANO:
-            print(f"{jogador.nome}, escolha uma carta:")
+        if jogador.estrategia is not None:
+            escolha = jogador.estrategia.escolhe_carta(
+                jogador, self._adversario(jogador), self.mao, cartas)
+            self._exibe(f"{jogador.nome} escolheu a carta: {cartas[escolha].nome}")
+            
+        elif jogador.tipo == TipoJogador.HUMANO:
+            self._exibe(f"{jogador.nome}, escolha uma carta:")
             for i, carta in enumerate(cartas):
-                print(f"{i}: {carta.nome}")
+                self._exibe(f"{i}: {carta.nome}")
             escolha = int(input("Digite o número da carta: "))
             while escolha < 0 or escolha >= len(cartas):
-                print("Escolha inválida. Tente novamente.")
+                self._exibe("Escolha inválida. Tente novamente.")
                 escolha = int(input("Digite o número da carta: "))
                 
         elif jogador.tipo == TipoJogador.MAQUINA:
-            escolha = randint(0, len(cartas))
-            print(f"{jogador.nome} escolheu a carta: {cartas[escolha].nome}")
+            escolha = self._randint(0, len(cartas))
+            self._exibe(f"{jogador.nome} escolheu a carta: {cartas[escolha].nome}")
          
         return escolha
 
-    def resposta_ao_truco(self, jogador_proponente, jogador_resposta, valor):
+    def _escolhe_resposta(self, jogador_proponente, jogador_resposta,
+                          valor) -> TipoRespostaTruco:
         """
-        Processa a resposta a um pedido de truco.
+        Obtém a resposta de um jogador a um pedido de truco.
+        
+        Para jogadores humanos, apresenta as opções e solicita uma entrada.
+        Para jogadores máquina, decide aleatoriamente. Para jogadores com
+        estratégia, delega a decisão à estratégia.
         
         Args:
             jogador_proponente (Jogador): Jogador que propôs o truco.
@@ -84,69 +156,63 @@ class Interface:
             valor (Ponto): Valor atual dos pontos da mão.
             
         Returns:
-            tuple: Uma tupla contendo (resposta, valor_atualizado, id_de_quem_correu).
-                resposta: Tipo de resposta dada (ACEITAR, CORRER ou AUMENTAR).
-                valor_atualizado: Novo valor dos pontos da mão.
-                id_de_quem_correu: ID do jogador que correu, ou None.
+            TipoRespostaTruco: A resposta escolhida.
         """
-        quem_correu = None
+        proposto = valor.proximo()
+        pode_aumentar = proposto.proximo() is not None
+        
+        if jogador_resposta.estrategia is not None:
+            resposta = jogador_resposta.estrategia.responde_truco(
+                jogador_resposta, jogador_proponente, self.mao, proposto)
+            self._exibe_resposta(jogador_resposta, resposta, proposto)
         
-        if jogador_resposta.tipo == TipoJogador.HUMANO:
+        elif jogador_resposta.tipo == TipoJogador.HUMANO:
             
-            print(f"O jogador {jogador_proponente.nome} "
-                  f"pediu {valor.proximo()}!"
-                  f" {jogador_resposta.nome}, o que você deseja fazer?")
-            print(f"1: Aceitar {valor.proximo()}")
-            print(f"2: Correr")
+            self._exibe(f"O jogador {jogador_proponente.nome} "
+                        f"pediu {proposto}!"
+                        f" {jogador_resposta.nome}, o que você deseja fazer?")
+            self._exibe(f"1: Aceitar {proposto}")
+            self._exibe(f"2: Correr")
             
-            if valor.proximo().valor != TipoPontos.Queda:
-                print(f"3: Pedir {valor.proximo().proximo()}")
+            if pode_aumentar:
+                self._exibe(f"3: Pedir {proposto.proximo()}")
                 respostas_possiveis = ['1', '2', '3']
             else:
                 respostas_possiveis = ['1', '2']
                 
             resposta = input("Escolha uma opção: ").strip()
             while resposta not in respostas_possiveis:
-                print("Opção inválida. Tente novamente.")
+                self._exibe("Opção inválida. Tente novamente.")
                 resposta = input("Escolha uma opção: ").strip()
+            resposta = _OPCOES_RESPOSTA[resposta]
                 
         elif jogador_resposta.tipo == TipoJogador.MAQUINA:
-            escolha = rand()
-            if valor.proximo().valor != TipoPontos.Queda:
-                if escolha < .33:
-                    resposta = '1'
-                    print(f"Jogador {jogador_resposta.nome} "
-                          f"aceitou {valor.proximo()}!")
-                elif escolha < .66:
-                    resposta = '2'
-                    print(f"Jogador {jogador_resposta.nome} "
-                          f"correu!")
-                else:
-                    resposta = '3'
-                    print(f"Jogador {jogador_resposta.nome} "
-                          f"pediu {valor.proximo().proximo()}!")
-            else:
-                if escolha < .5:
-                    resposta = '1'
-                    print(f"Jogador {jogador_resposta.nome} "
-                          f"aceitou {valor.proximo()}!")
-                else:
-                    resposta = '2'
-                    print(f"Jogador {jogador_resposta.nome} correu!")
-            
-        if resposta == '1':
-            resposta = TipoRespostaTruco.ACEITAR
-            valor = valor.proximo()
-        elif resposta == '2':
-            resposta = TipoRespostaTruco.CORRER
-            quem_correu = jogador_resposta.id
-        elif resposta == '3':
-            resposta = TipoRespostaTruco.AUMENTAR
-            resposta, valor, quem_correu = self.resposta_ao_truco(
-                jogador_resposta, jogador_proponente, valor.proximo()
-            )
-        
-        return resposta, valor, quem_correu
+            escolha = self._rand()
+            for limite, resposta in _LIMIARES_MAQUINA[pode_aumentar]:
+                if escolha < limite:
+                    break
+            self._exibe_resposta(jogador_resposta, resposta, proposto)
+        
+        return resposta
+
+    def _exibe_resposta(self, jogador_resposta: Jogador,
+                        resposta: TipoRespostaTruco, proposto: Ponto):
+        """
+        Anuncia a resposta de um jogador máquina a um pedido de truco.
+        
+        Args:
+            jogador_resposta (Jogador): Jogador que respondeu.
+            resposta (TipoRespostaTruco): A resposta dada.
+            proposto (Ponto): O valor pedido.
+        """
+        if resposta == TipoRespostaTruco.ACEITAR:
+            self._exibe(f"Jogador {jogador_resposta.nome} "
+                        f"aceitou {proposto}!")
+        elif resposta == TipoRespostaTruco.CORRER:
+            self._exibe(f"Jogador {jogador_resposta.nome} correu!")
+        else:
+            self._exibe(f"Jogador {jogador_resposta.nome} "
+                        f"pediu {proposto.proximo()}!")
 
     def mostra_vencedor(self, jogador: Jogador):
         """
@@ -155,7 +221,7 @@ class Interface:
         Args:
             jogador (Jogador): O jogador vencedor.
         """
-        print(f"Vencedor: {jogador.nome} com {jogador.pontos} pontos!")
+        self._exibe(f"Vencedor: {jogador.nome} com {jogador.pontos} pontos!")
 
     def informa_quem_abre(self, jogador: Jogador):
         """
@@ -164,26 +230,34 @@ class Interface:
         Args:
             jogador (Jogador): O jogador que abre a mão.
         """
-        print(f"Jogador {jogador.nome} abre a mão!")
+        self._exibe(f"Jogador {jogador.nome} abre a mão!")
 
     def pergunta_truco(self, jogador_proponente: Jogador, valor: Ponto) -> bool:
         """
         Pergunta se um jogador deseja pedir truco.
         
         Para jogadores humanos, solicita uma entrada.
-        Para jogadores máquina, decide aleatoriamente.
+        Para jogadores máquina, decide aleatoriamente. Para jogadores com
+        estratégia, delega a decisão à estratégia.
         
         Args:
             jogador_proponente (Jogador): O jogador a quem será feita a pergunta.
-            valor (Ponto): O valor atual dos pontos da mão.
+            valor (Ponto): O valor que seria pedido.
             
         Returns:
             bool: True se o jogador pediu truco, False caso contrário.
         """
-        if jogador_proponente.tipo == TipoJogador.MAQUINA:
-            escolha = rand()
+        if jogador_proponente.estrategia is not None:
+            pediu = jogador_proponente.estrategia.pergunta_truco(
+                jogador_proponente, self._adversario(jogador_proponente),
+                self.mao, valor)
+            if pediu:
+                self._exibe(f"Jogador {jogador_proponente.nome} pediu {valor}!")
+            return pediu
+        elif jogador_proponente.tipo == TipoJogador.MAQUINA:
+            escolha = self._rand()
             if escolha < .5:
-                print(f"Jogador {jogador_proponente.nome} pediu {valor}!")
+                self._exibe(f"Jogador {jogador_proponente.nome} pediu {valor}!")
                 return True
             else:
                 return False
@@ -203,8 +277,8 @@ class Interface:
             jogador_A (Jogador): Primeiro jogador.
             jogador_B (Jogador): Segundo jogador.
         """
-        print(f"Placar: {jogador_A.nome}: {jogador_A.pontos}, "
-              f"{jogador_B.nome}: {jogador_B.pontos}")
+        self._exibe(f"Placar: {jogador_A.nome}: {jogador_A.pontos}, "
+                    f"{jogador_B.nome}: {jogador_B.pontos}")
         
     def informa_placar_mao(self, jogador_A: Jogador, jogador_B: Jogador, mao: Mao):
         """
@@ -216,8 +290,8 @@ class Interface:
             mao (Mao): A mão atual do jogo.
         """
         vitorias_A, vitorias_B = mao.conta_vitorias()
-        print(f"Placar da mão: {jogador_A.nome}: {vitorias_A}, "
-              f"{jogador_B.nome}: {vitorias_B}")
+        self._exibe(f"Placar da mão: {jogador_A.nome}: {vitorias_A}, "
+                    f"{jogador_B.nome}: {vitorias_B}")
 
     def informa_quem_correu(self, jogador: Jogador):
         """
@@ -226,7 +300,39 @@ class Interface:
         Args:
             jogador (Jogador): O jogador que correu.
         """
-        print(f"Jogador {jogador.nome} correu!")
+        self._exibe(f"Jogador {jogador.nome} correu!")
+
+    def informa_nova_mao(self, mao: Mao, jogador_A: Jogador, jogador_B: Jogador):
+        """
+        Registra a mão que começa e os jogadores da partida.
+        
+        A mão fica disponível para as estratégias dos jogadores durante as
+        decisões seguintes. Só a vira, se houver, é exibida.
+        
+        Args:
+            mao (Mao): A mão recém-distribuída.
+            jogador_A (Jogador): Primeiro jogador.
+            jogador_B (Jogador): Segundo jogador.
+        """
+        self.mao = mao
+        self.jogadores = (jogador_A, jogador_B)
+        if mao.vira is not None:
+            self._exibe(f"Vira: {mao.vira.nome}")
+
+    def _adversario(self, jogador: Jogador) -> Jogador:
+        """
+        Retorna o adversário de um jogador na partida atual.
+        
+        Args:
+            jogador (Jogador): O jogador.
+            
+        Returns:
+            Jogador: O outro jogador, ou None se a partida não foi registrada.
+        """
+        for outro in self.jogadores:
+            if outro is not jogador:
+                return outro
+        return None
 
     def mostra_mao(self, jogador: Jogador, mao: Mao):
         """
@@ -236,10 +342,140 @@ class Interface:
             jogador (Jogador): O jogador cuja mão será exibida.
             mao (Mao): A mão do jogo.
         """
-        print(f"Mão do jogador {jogador.nome}:", end=" ")
+        self._exibe(f"Mão do jogador {jogador.nome}:", end=" ")
         for i, carta in enumerate(mao.cartas_A):
-            print(f"{carta.nome}", end=" ")
-        print()
+            self._exibe(f"{carta.nome}", end=" ")
+        self._exibe()
+
+class InterfaceSilenciosa(Interface):
+    """
+    Interface sem entrada nem saída, para partidas entre jogadores máquina.
+    
+    Todas as mensagens são descartadas e, em vez de exibi-las, a interface
+    contabiliza as decisões tomadas ao longo das partidas, o que permite
+    simular muitos jogos sem custo de E/S.
+    
+    Atributos:
+        maos (int): Número de mãos iniciadas.
+        oportunidades_truco (int): Vezes em que um jogador pôde pedir truco.
+        pedidos_truco (int): Vezes em que um jogador pediu truco.
+        respostas_truco (int): Número de respostas dadas a pedidos de truco.
+        aceites (int): Respostas que aceitaram o pedido.
+        corridas (int): Respostas em que o jogador correu.
+        aumentos (int): Respostas que aumentaram a aposta.
+        
+    Métodos:
+        zera_contadores(): Reinicia todos os contadores.
+    """
+    
+    def __init__(self, rng: "numpy.random.Generator" = None):
+        """
+        Inicializa uma nova instância da classe InterfaceSilenciosa.
+        
+        Args:
+            rng (numpy.random.Generator ou random.Random, opcional): Gerador
+                usado nas decisões dos jogadores máquina.
+        """
+        super().__init__(rng)
+        self.zera_contadores()
+
+    def zera_contadores(self):
+        """
+        Reinicia todos os contadores da interface.
+        """
+        self.maos = 0
+        self.oportunidades_truco = 0
+        self.pedidos_truco = 0
+        self.respostas_truco = 0
+        self.aceites = 0
+        self.corridas = 0
+        self.aumentos = 0
+
+    def _exibe(self, *args, **kwargs):
+        """
+        Descarta a mensagem.
+        """
+        pass
+
+    def _verifica_maquina(self, jogador: Jogador):
+        """
+        Garante que apenas jogadores máquina participem da partida.
+        
+        Args:
+            jogador (Jogador): O jogador a ser verificado.
+            
+        Raises:
+            ValueError: Se o jogador for humano.
+        """
+        if jogador.tipo == TipoJogador.HUMANO:
+            raise ValueError(f"O jogador {jogador.nome} é humano e não pode "
+                             f"jogar em uma InterfaceSilenciosa.")
+
+    def informa_quem_abre(self, jogador: Jogador):
+        """
+        Contabiliza o início de uma nova mão.
+        
+        Args:
+            jogador (Jogador): O jogador que abre a mão.
+        """
+        self.maos += 1
+
+    def escolhe_carta(self, jogador: Jogador, cartas: list[Carta]) -> int:
+        """
+        Escolhe uma carta para um jogador máquina.
+        
+        Args:
+            jogador (Jogador): O jogador que fará a escolha.
+            cartas (list[Carta]): Lista de cartas disponíveis para escolha.
+            
+        Returns:
+            int: Índice da carta escolhida na lista.
+        """
+        self._verifica_maquina(jogador)
+        return super().escolhe_carta(jogador, cartas)
+
+    def pergunta_truco(self, jogador_proponente: Jogador, valor: Ponto) -> bool:
+        """
+        Decide se um jogador máquina pede truco e contabiliza a decisão.
+        
+        Args:
+            jogador_proponente (Jogador): O jogador a quem será feita a pergunta.
+            valor (Ponto): O valor atual dos pontos da mão.
+            
+        Returns:
+            bool: True se o jogador pediu truco, False caso contrário.
+        """
+        self._verifica_maquina(jogador_proponente)
+        pediu = super().pergunta_truco(jogador_proponente, valor)
+        self.oportunidades_truco += 1
+        if pediu:
+            self.pedidos_truco += 1
+        return pediu
+
+    def _escolhe_resposta(self, jogador_proponente, jogador_resposta,
+                          valor) -> TipoRespostaTruco:
+        """
+        Obtém a resposta de um jogador máquina e contabiliza a decisão.
+        
+        Args:
+            jogador_proponente (Jogador): Jogador que propôs o truco.
+            jogador_resposta (Jogador): Jogador que responderá ao pedido.
+            valor (Ponto): Valor atual dos pontos da mão.
+            
+        Returns:
+            TipoRespostaTruco: A resposta escolhida.
+        """
+        self._verifica_maquina(jogador_resposta)
+        resposta = super()._escolhe_resposta(jogador_proponente,
+                                             jogador_resposta, valor)
+        self.respostas_truco += 1
+        if resposta == TipoRespostaTruco.ACEITAR:
+            self.aceites += 1
+        elif resposta == TipoRespostaTruco.CORRER:
+            self.corridas += 1
+        else:
+            self.aumentos += 1
+        return resposta
 
 if __name__ == "__main__":
     """
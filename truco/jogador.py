@@ -9,9 +9,15 @@ class TipoJogador(Enum):
     Valores:
         HUMANO (1): Representa um jogador humano.
         MAQUINA (2): Representa um jogador controlado pelo computador.
+        CFR (3): Jogador máquina que aposta segundo uma política treinada
+                 por minimização de arrependimento contrafactual.
+        MCTS (4): Jogador máquina que decide por busca em árvore Monte Carlo
+                  sobre conjuntos de informação.
     """
     HUMANO = 1
     MAQUINA = 2
+    CFR = 3
+    MCTS = 4
 
 class Jogador:
     """
@@ -25,9 +31,11 @@ class Jogador:
         tipo (TipoJogador): O tipo do jogador (humano ou máquina).
         pontos (int): A pontuação atual do jogador.
         id (Vencedor): O identificador do jogador no jogo.
+        estrategia (Estrategia): Estratégia que toma as decisões do jogador,
+                                 ou None para jogadores humanos e máquina.
         
     Métodos:
-        __init__(nome, tipo): Inicializa uma instância da classe Jogador.
+        __init__(nome, tipo, estrategia): Inicializa uma instância da classe Jogador.
         iniciar_pontos(): Reinicia a pontuação do jogador para zero.
         adicionar_id(iden): Atribui um identificador ao jogador.
         aumentar_pontos(pontos): Incrementa a pontuação do jogador.
@@ -35,18 +43,29 @@ class Jogador:
         __repr__(): Retorna uma representação detalhada do jogador para depuração.
     """
     
-    def __init__(self, nome: str, tipo: TipoJogador = TipoJogador.HUMANO):
+    def __init__(self, nome: str, tipo: TipoJogador = TipoJogador.HUMANO,
+                 estrategia=None):
         """
         Inicializa uma nova instância da classe Jogador.
         
         Args:
             nome (str): O nome do jogador.
             tipo (TipoJogador, opcional): O tipo do jogador. Padrão é TipoJogador.HUMANO.
+            estrategia (Estrategia, opcional): Estratégia que decide pelo
+                jogador. Obrigatória para os tipos que não são HUMANO nem MAQUINA.
+                
+        Raises:
+            ValueError: Se o tipo exigir uma estratégia e nenhuma for fornecida.
         """
+        if (estrategia is None
+                and tipo not in (TipoJogador.HUMANO, TipoJogador.MAQUINA)):
+            raise ValueError(f"Jogadores do tipo {tipo.name} precisam de "
+                             f"uma estratégia.")
         self.nome = nome
         self.tipo = tipo
         self.pontos = 0
         self.id = None
+        self.estrategia = estrategia
 
     def iniciar_pontos(self):
         """
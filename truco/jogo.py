@@ -2,10 +2,12 @@ from .mao import Mao
 from .jogada import Vencedor
 from .baralho import Baralho
 from .jogador import Jogador, TipoJogador
-from numpy.random import rand
+import random
 from .jogada import Jogada
 from .ponto import TipoPontos, Ponto
 from .interface import Interface, TipoRespostaTruco
+from .decisao import Decisao, TipoDecisao
+from .regras import TipoMao
 
 
 class Jogo:
@@ -17,47 +19,134 @@ class Jogo:
     
     Atributos:
         interface (Interface): Objeto de interface para interação com os jogadores.
+        registro (GravadorPartidas): Gravador que registra cada mão jogada, ou None.
+        instrumentacao (Instrumentacao): Contadores e cronômetros do jogo, ou None.
+        regras (Regras): Regras do jogo, ou None para as regras padrão.
         
     Métodos:
-        __init__(interface): Inicializa uma instância da classe Jogo.
-        comecar(jogador_A, jogador_B, baralho): Inicia um novo jogo de truco.
+        __init__(interface, rng, registro, instrumentacao, regras): Inicializa uma instância da classe Jogo.
+        comecar(jogador_A, jogador_B, baralho, quem_abre): Inicia um novo jogo de truco.
+        passos(jogador_A, jogador_B, baralho, quem_abre): Executa um jogo passo a passo.
         _verifica_fim_jogo(jogador_A, jogador_B): Verifica se o jogo terminou.
         _define_vencedor(jogador_A, jogador_B): Determina qual jogador venceu o jogo.
         _quem_abre_proxima(vencedor, ultima_rodada): Define quem abre a próxima rodada.
         _quem_abre_caso_correu(quem_correu): Define quem abre quando alguém correu.
-        _propor_truco(jogador_proponente, jogador_resposta, valor): Gerencia pedidos de truco.
+        _propor_truco(jogador_proponente, jogador_resposta, valor, mao): Gerencia pedidos de truco.
+        _resposta_ao_truco(jogador_proponente, jogador_resposta, valor, mao): Obtém a resposta ao pedido.
+        _conta_resposta(resposta, valor): Contabiliza uma resposta na instrumentação.
+        _pergunta(decisao): Entrega uma decisão ao chamador e valida a resposta.
+        _aplica_regras(mao, jogador_A, jogador_B): Ajusta a mão à mão de 10 e à mão de ferro.
+        _escolhe_carta(jogador_vez, cartas_vez, mao): Obtém a carta a ser jogada.
         _vez(jogador_vez, cartas_vez, jogador_espera, mao): Controla o turno de um jogador.
     """
     
-    def __init__(self, interface: Interface):
+    def __init__(self, interface: Interface,
+                 rng: "numpy.random.Generator" = None, registro=None,
+                 instrumentacao=None, regras=None):
         """
         Inicializa uma nova instância da classe Jogo.
         
         Args:
             interface (Interface): Objeto de interface para interação com os jogadores.
+            rng (numpy.random.Generator ou random.Random, opcional): Gerador
+                usado para sortear quem começa o jogo. Se não for fornecido,
+                usa o estado global do módulo `random`.
+            registro (GravadorPartidas, opcional): Gravador que recebe um
+                registro binário de cada mão jogada.
+            instrumentacao (Instrumentacao, opcional): Recebe as contagens de
+                eventos e os tempos de cada fase do jogo.
+            regras (Regras, opcional): Regras do jogo: manilhas pela vira,
+                mão de 10 e mão de ferro. Padrão são as regras de sempre.
+        
+        Raises:
+            ValueError: Se houver registro e as regras tiverem manilha
+                variável ou mão de 10, que o registro binário não descreve.
         """
+        if registro is not None and regras is not None and (
+                regras.manilha_variavel or regras.mao_de_10):
+            raise ValueError("O registro binário só descreve mãos com "
+                             "manilhas fixas e sem mão de 10.")
         self.interface = interface
+        self.registro = registro
+        self.instrumentacao = instrumentacao
+        self.regras = regras
+        self._rand = rng.random if rng is not None else random.random
     
-    def comecar(self, jogador_A: Jogador, jogador_B: Jogador, baralho: Baralho):
+    def comecar(self, jogador_A: Jogador, jogador_B: Jogador, baralho: Baralho,
+                quem_abre: Vencedor = None):
         """
         Inicia um novo jogo de truco.
         
-        Configura os jogadores, distribui as cartas e gerencia o loop principal do jogo
-        até que um jogador atinja a pontuação de vitória.
+        Conduz o jogo de `passos` até o fim, obtendo cada decisão dos
+        jogadores através da interface.
         
         Args:
             jogador_A (Jogador): Primeiro jogador.
             jogador_B (Jogador): Segundo jogador.
             baralho (Baralho): Baralho de cartas a ser usado no jogo.
+            quem_abre (Vencedor, opcional): Quem abre a primeira mão. Se não
+                for fornecido, é sorteado.
+            
+        Returns:
+            Jogador: O jogador que venceu o jogo.
+        """
+        passos = self.passos(jogador_A, jogador_B, baralho, quem_abre)
+        try:
+            decisao = next(passos)
+            while True:
+                decisao = passos.send(self.interface.decide(decisao))
+        except StopIteration as fim:
+            return fim.value
+    
+    def passos(self, jogador_A: Jogador, jogador_B: Jogador, baralho: Baralho,
+               quem_abre: Vencedor = None):
+        """
+        Executa um jogo de truco passo a passo.
+        
+        Configura os jogadores, distribui as cartas e gerencia o loop principal do jogo
+        até que um jogador atinja a pontuação de vitória. Cada decisão de um
+        jogador (escolher carta, pedir truco, responder truco) é entregue ao
+        chamador como uma `Decisao`, com as opções permitidas, e a resposta é
+        recebida por `send`. As mensagens do jogo continuam sendo enviadas à
+        interface.
+        
+        Como todo o estado do jogo fica no gerador, o chamador pode pausar o
+        jogo, intercalar muitos jogos em uma mesma thread ou reunir decisões
+        de vários jogos antes de respondê-las.
+        
+        Args:
+            jogador_A (Jogador): Primeiro jogador.
+            jogador_B (Jogador): Segundo jogador.
+            baralho (Baralho): Baralho de cartas a ser usado no jogo. Se o
+                jogo tiver regras, elas passam a valer também no baralho.
+            quem_abre (Vencedor, opcional): Quem abre a primeira mão. Se não
+                for fornecido, é sorteado.
+            
+        Yields:
+            Decisao: A próxima decisão a ser tomada.
+            
+        Returns:
+            Jogador: O jogador que venceu o jogo, como valor de StopIteration.
+            
+        Raises:
+            ValueError: Se uma resposta recebida não estiver entre as opções.
         """
         jogador_A.iniciar_pontos()
         jogador_B.iniciar_pontos()
         jogador_A.adicionar_id(Vencedor.A)
         jogador_B.adicionar_id(Vencedor.B)
         fim_jogo = False
+        instrumentacao = self.instrumentacao
+        if self.regras is not None and baralho.regras is not self.regras:
+            baralho.aplica_regras(self.regras)
+        partida = None
+        if self.registro is not None:
+            partida = self.registro.nova_partida()
         
-        # Sorteia quem começa o jogo
-        if rand() < 0.5:
+        # Sorteia quem começa o jogo, se não foi definido
+        if quem_abre is not None:
+            jogador_que_abre = quem_abre
+        elif self._rand() < 0.5:
             jogador_que_abre = Vencedor.A
         else:
             jogador_que_abre = Vencedor.B
@@ -72,8 +161,17 @@ class Jogo:
                 self.interface.informa_quem_abre(jogador_B)
             
             # Distribui as cartas
+            if instrumentacao is not None:
+                inicio = instrumentacao.relogio()
             mao = Mao()
             mao.coleta_cartas(baralho)
+            if self.regras is not None:
+                self._aplica_regras(mao, jogador_A, jogador_B)
+            if instrumentacao is not None:
+                instrumentacao.maos += 1
+                instrumentacao.mede("distribuicao", inicio)
+            self.interface.informa_nova_mao(mao, jogador_A, jogador_B)
+            abre_mao = jogador_que_abre
             
             # Loop da mão atual
             while not mao.mao_acabou():
@@ -81,13 +179,13 @@ class Jogo:
                 # Vez do jogador que abre
                 if jogador_que_abre == Vencedor.A:
                     
-                    escolha_A, mao, alguem_correu, quem_correu, valor = self._vez(
+                    escolha_A, mao, alguem_correu, quem_correu, valor = yield from self._vez(
                         jogador_A, mao.cartas_A, jogador_B, mao
                     )  
                     
                 elif jogador_que_abre == Vencedor.B:
                     
-                    escolha_B, mao, alguem_correu, quem_correu, valor = self._vez(
+                    escolha_B, mao, alguem_correu, quem_correu, valor = yield from self._vez(
                         jogador_B, mao.cartas_B, jogador_A, mao
                     )
                     
@@ -99,11 +197,11 @@ class Jogo:
                 # Vez do outro jogador
                 if jogador_que_abre == Vencedor.A:
                     
-                    escolha_B, mao, alguem_correu, quem_correu, valor = self._vez(
+                    escolha_B, mao, alguem_correu, quem_correu, valor = yield from self._vez(
                         jogador_B, mao.cartas_B, jogador_A, mao
                     )
                 elif jogador_que_abre == Vencedor.B:
-                    escolha_A, mao, alguem_correu, quem_correu, valor = self._vez(
+                    escolha_A, mao, alguem_correu, quem_correu, valor = yield from self._vez(
                         jogador_A, mao.cartas_A, jogador_B, mao
                     )
                 
@@ -113,7 +211,14 @@ class Jogo:
                     break
                 
                 # Compara as cartas para determinar o vencedor da jogada
+                if instrumentacao is not None:
+                    inicio = instrumentacao.relogio()
                 vencedor = mao.quem_ganhou_jogada(escolha_A, escolha_B)
+                if instrumentacao is not None:
+                    instrumentacao.mede("resolucao", inicio)
+                    instrumentacao.jogadas += 1
+                    if vencedor == Vencedor.Nenhum:
+                        instrumentacao.empates += 1
                 
                 # Exibe o placar atual da mão
                 self.interface.informa_placar_mao(jogador_A, jogador_B, mao)
@@ -126,6 +231,8 @@ class Jogo:
                 fim_jogo = self._verifica_fim_jogo(jogador_A, jogador_B)
             
             # Finalização da mão atual
+            if instrumentacao is not None:
+                inicio = instrumentacao.relogio()
             if not alguem_correu:
                 
                 vencedor = mao.quem_ganhou_a_mao()
@@ -145,6 +252,18 @@ class Jogo:
                     jogador_A.aumentar_pontos(valor)
                     vencedor = Vencedor.A
                     
+            if instrumentacao is not None:
+                instrumentacao.mede("pontuacao", inicio)
+            
+            # Registra a mão encerrada
+            if partida is not None:
+                self.registro.registra_mao(
+                    partida, mao, abre_mao,
+                    quem_correu if alguem_correu else None,
+                    valor if alguem_correu else mao.quanto_vale_a_mao(),
+                    jogador_A, jogador_B
+                )
+            
             # Exibe o placar atual do jogo
             self.interface.informa_placar_jogo(jogador_A, jogador_B)
             
@@ -153,6 +272,8 @@ class Jogo:
                 vencedor = self._define_vencedor(jogador_A, jogador_B)
                 self.interface.mostra_vencedor(vencedor)
                 fim_jogo = True
+        
+        return vencedor
     
     def _verifica_fim_jogo(self, jogador_A: Jogador,
                            jogador_B: Jogador) -> bool:
@@ -220,8 +341,70 @@ class Jogo:
         else:
             return Vencedor.A
     
+    def _pergunta(self, decisao: Decisao):
+        """
+        Entrega uma decisão ao chamador de `passos` e valida a resposta.
+        
+        Args:
+            decisao (Decisao): A decisão a ser tomada.
+            
+        Returns:
+            A resposta recebida.
+            
+        Raises:
+            ValueError: Se a resposta não estiver entre as opções.
+        """
+        if self.instrumentacao is None:
+            resposta = yield decisao
+        else:
+            inicio = self.instrumentacao.relogio()
+            resposta = yield decisao
+            self.instrumentacao.mede("decisao", inicio)
+        decisao.valida(resposta)
+        return resposta
+    
+    def _aplica_regras(self, mao: Mao, jogador_A: Jogador,
+                       jogador_B: Jogador):
+        """
+        Ajusta uma mão recém-distribuída à mão de 10 e à mão de ferro.
+        
+        Na mão de 10, a mão vale um truco e não se pode pedir truco; na mão
+        de ferro, além disso, as cartas são jogadas às cegas.
+        
+        Args:
+            mao (Mao): A mão recém-distribuída.
+            jogador_A (Jogador): Primeiro jogador.
+            jogador_B (Jogador): Segundo jogador.
+        """
+        tipo_mao = self.regras.tipo_de_mao(jogador_A.pontos, jogador_B.pontos)
+        if tipo_mao is not TipoMao.Normal:
+            mao.pontos = Ponto(TipoPontos.Truco)
+            mao.truco_permitido = False
+            mao.as_cegas = tipo_mao is TipoMao.MaoDeFerro
+    
+    def _escolhe_carta(self, jogador_vez: Jogador, cartas_vez: list, mao: Mao):
+        """
+        Obtém a carta a ser jogada, perguntando ao jogador se não for às cegas.
+        
+        Às cegas, joga a primeira carta que resta, na ordem (aleatória) em
+        que as cartas foram distribuídas.
+        
+        Args:
+            jogador_vez (Jogador): Jogador que está na vez.
+            cartas_vez (list): Cartas disponíveis para o jogador.
+            mao (Mao): A mão atual do jogo.
+            
+        Returns:
+            int: Índice da carta escolhida.
+        """
+        if mao.as_cegas:
+            return 0
+        return (yield from self._pergunta(Decisao(
+            TipoDecisao.CARTA, jogador_vez, cartas_vez, mao
+        )))
+    
     def _propor_truco(self, jogador_proponente: Jogador,
-                      jogador_resposta: Jogador, valor: Ponto):
+                      jogador_resposta: Jogador, valor: Ponto, mao: Mao):
         """
         Gerencia o processo de propor e responder a pedidos de truco.
         
@@ -229,21 +412,86 @@ class Jogo:
             jogador_proponente (Jogador): Jogador que propõe o truco.
             jogador_resposta (Jogador): Jogador que responde ao pedido.
             valor (Ponto): Valor atual dos pontos da mão.
+            mao (Mao): A mão atual do jogo.
             
         Returns:
             tuple ou None: Uma tupla com (resposta, valor_atualizado, quem_correu) 
                           se houver pedido de truco, ou None caso contrário.
         """
-        if self.interface.pergunta_truco(jogador_proponente, valor.proximo()):
+        pediu = yield from self._pergunta(Decisao(
+            TipoDecisao.PEDIR_TRUCO, jogador_proponente, [False, True], mao,
+            valor.proximo()
+        ))
+        if pediu:
+            mao.apostas.append((jogador_proponente.id, valor.proximo(), None,
+                                len(mao.vencedor_jogadas)))
+            if self.instrumentacao is not None:
+                self.instrumentacao.pedidos[valor.proximo().valor] += 1
             
-            resposta, valor, quem_correu = self.interface.resposta_ao_truco(
-                jogador_proponente, jogador_resposta, valor
+            resposta, valor, quem_correu = yield from self._resposta_ao_truco(
+                jogador_proponente, jogador_resposta, valor, mao
             )
             return resposta, valor, quem_correu
 
         else:
             return None
 
+    def _resposta_ao_truco(self, jogador_proponente: Jogador,
+                           jogador_resposta: Jogador, valor: Ponto, mao: Mao):
+        """
+        Obtém a resposta a um pedido de truco.
+        
+        Os aumentos são tratados em sequência: a cada aumento, os papéis de
+        quem pede e de quem responde se invertem e a aposta sobe um nível,
+        até que alguém aceite ou corra.
+        
+        Args:
+            jogador_proponente (Jogador): Jogador que propôs o truco.
+            jogador_resposta (Jogador): Jogador que responderá ao pedido.
+            valor (Ponto): Valor atual dos pontos da mão.
+            mao (Mao): A mão atual do jogo.
+            
+        Returns:
+            tuple: Uma tupla contendo (resposta, valor_atualizado, id_de_quem_correu).
+        """
+        while True:
+            opcoes = [TipoRespostaTruco.ACEITAR, TipoRespostaTruco.CORRER]
+            if valor.proximo().proximo() is not None:
+                opcoes.append(TipoRespostaTruco.AUMENTAR)
+            resposta = yield from self._pergunta(Decisao(
+                TipoDecisao.RESPONDER_TRUCO, jogador_resposta, opcoes, mao,
+                valor, jogador_proponente
+            ))
+            mao.apostas.append((jogador_resposta.id, valor.proximo(), resposta,
+                                len(mao.vencedor_jogadas)))
+            if self.instrumentacao is not None:
+                self._conta_resposta(resposta, valor)
+            if resposta != TipoRespostaTruco.AUMENTAR:
+                break
+            jogador_proponente, jogador_resposta = (jogador_resposta,
+                                                    jogador_proponente)
+            valor = valor.proximo()
+        
+        if resposta == TipoRespostaTruco.ACEITAR:
+            return resposta, valor.proximo(), None
+        return resposta, valor, jogador_resposta.id
+
+    def _conta_resposta(self, resposta: TipoRespostaTruco, valor: Ponto):
+        """
+        Contabiliza uma resposta a um pedido de truco na instrumentação.
+        
+        Args:
+            resposta (TipoRespostaTruco): A resposta dada.
+            valor (Ponto): Valor da mão antes do pedido respondido.
+        """
+        if resposta == TipoRespostaTruco.ACEITAR:
+            self.instrumentacao.aceites += 1
+        elif resposta == TipoRespostaTruco.CORRER:
+            self.instrumentacao.corridas += 1
+        else:
+            self.instrumentacao.aumentos += 1
+            self.instrumentacao.pedidos[valor.proximo().proximo().valor] += 1
+
     def _vez(self, jogador_vez: Jogador, cartas_vez: list, 
              jogador_espera: Jogador, mao: Mao):
         """
@@ -267,15 +515,18 @@ class Jogo:
         quem_correu = None
         valor = None
         escolha = None
+        mao.vez = jogador_vez.id
         
-        # Mostra as cartas para jogadores humanos
-        if jogador_vez.tipo == TipoJogador.HUMANO:
+        # Mostra as cartas para jogadores humanos, a não ser às cegas
+        if jogador_vez.tipo == TipoJogador.HUMANO and not mao.as_cegas:
             self.interface.mostra_mao(jogador_vez, mao)
         
-        # Verifica se pode propor truco (se não atingiu valor máximo)
-        if not mao.mao_vale_queda():
-            proposta = self._propor_truco(jogador_vez, jogador_espera,
-                                          mao.pontos)
+        # Verifica se pode propor truco (se é permitido e a mão não atingiu
+        # o valor máximo)
+        if mao.truco_permitido and not mao.mao_vale_queda():
+            proposta = yield from self._propor_truco(jogador_vez,
+                                                     jogador_espera,
+                                                     mao.pontos, mao)
         
             if proposta is not None:
                 resposta, valor, quem_correu = proposta
@@ -287,10 +538,16 @@ class Jogo:
         
             # Se ninguém correu, escolhe uma carta
             if not alguem_correu:      
-                escolha = self.interface.escolhe_carta(jogador_vez, cartas_vez)
+                escolha = yield from self._escolhe_carta(jogador_vez,
+                                                         cartas_vez, mao)
         
         else:
-            # Se já atingiu valor máximo, apenas escolhe uma carta
-            escolha = self.interface.escolhe_carta(jogador_vez, cartas_vez)
+            # Se não se pode pedir truco, apenas escolhe uma carta
+            escolha = yield from self._escolhe_carta(jogador_vez, cartas_vez,
+                                                     mao)
+        
+        # A carta de quem abre a jogada fica visível para o outro jogador
+        if escolha is not None and mao.carta_na_mesa is None:
+            mao.carta_na_mesa = cartas_vez[escolha]
         
         return escolha, mao, alguem_correu, quem_correu, valor
\ No newline at end of file
@@ -1,6 +1,9 @@
 from .ponto import Ponto, TipoPontos
 from .jogada import Jogada, Vencedor
 
+# Jogada não guarda estado, então uma única instância atende todas as mãos
+_JOGADA = Jogada()
+
 class Mao:
     """
     Representa uma mão (rodada) de jogo no truco.
@@ -8,12 +11,30 @@ class Mao:
     Esta classe gerencia as cartas de cada jogador, o vencedor de cada jogada,
     a pontuação da mão atual e determina quando a mão terminou.
     
+    Os lances que alteram a mão (`quem_ganhou_jogada` e `aumenta_pontos`) são
+    reversíveis: `desfaz` desfaz o último deles exatamente, devolvendo as
+    cartas às posições originais. Uma busca pode assim explorar os lances a
+    partir de uma única mão, sem copiá-la. As vitórias de cada jogador são
+    contadas a cada lance, de modo que `mao_acabou`, `conta_vitorias` e
+    `quem_ganhou_a_mao` não percorrem a lista de jogadas.
+    
     Atributos:
         cartas_A (list): Lista de cartas do jogador A.
         cartas_B (list): Lista de cartas do jogador B.
-        vencedor_jogadas (list): Lista de vencedores de cada jogada da mão.
+        vencedor_jogadas (tuple): Vencedores de cada jogada da mão, somente
+            para leitura. É alterada apenas por `adiciona_vencedor`, pelos
+            lances ou por atribuição de uma nova sequência.
         pontos (Ponto): Pontuação da mão atual.
         vencedor (Vencedor): Armazena quem venceu a mão completa.
+        cartas_jogadas (list): Pares (carta de A, carta de B) das jogadas disputadas.
+        carta_na_mesa (Carta): Carta jogada por quem abre a jogada atual, ou None.
+        vez (Vencedor): Jogador da vez na jogada atual.
+        cartas_distribuidas (tuple): Cartas recebidas por A e por B no início da mão.
+        apostas (list): Pedidos e respostas de truco da mão, como tuplas
+            (id do jogador, Ponto pedido, resposta ou None para pedido, jogada).
+        vira (Carta): Vira da mão, ou None quando as manilhas são fixas.
+        truco_permitido (bool): Se os jogadores podem pedir truco nesta mão.
+        as_cegas (bool): Se as cartas são jogadas às cegas (mão de ferro).
     """
     
     def __init__(self):
@@ -22,9 +43,20 @@ class Mao:
         """
         self.cartas_A = []
         self.cartas_B = []
-        self.vencedor_jogadas = []
+        self._vencedor_jogadas = ()
+        self._vitorias_A = 0
+        self._vitorias_B = 0
+        self._desfazer = []
         self.pontos = Ponto()
         self.vencedor = None
+        self.cartas_jogadas = []
+        self.carta_na_mesa = None
+        self.vez = None
+        self.cartas_distribuidas = ((), ())
+        self.apostas = []
+        self.vira = None
+        self.truco_permitido = True
+        self.as_cegas = False
 
     def coleta_cartas(self, baralho):
         """
@@ -34,13 +66,50 @@ class Mao:
             baralho: Objeto baralho que possui método para distribuição de cartas.
         """
         self.cartas_A, self.cartas_B = baralho.distribui_cartas()
+        self.cartas_distribuidas = (tuple(self.cartas_A), tuple(self.cartas_B))
+        self.vira = getattr(baralho, "vira", None)
+
+    @property
+    def vencedor_jogadas(self) -> tuple:
+        """
+        Vencedores de cada jogada da mão.
+        
+        É uma tupla, e não uma lista, para que ninguém a altere sem passar
+        pelos lances, o que deixaria as vitórias contadas desatualizadas.
+        """
+        return self._vencedor_jogadas
+
+    @vencedor_jogadas.setter
+    def vencedor_jogadas(self, vencedores):
+        """
+        Substitui os vencedores e recontabiliza as vitórias.
+        
+        Args:
+            vencedores (list ou tuple): Vencedores de cada jogada.
+        """
+        self._vencedor_jogadas = tuple(vencedores)
+        self._vitorias_A = self._vencedor_jogadas.count(Vencedor.A)
+        self._vitorias_B = self._vencedor_jogadas.count(Vencedor.B)
+
+    def adiciona_vencedor(self, vencedor: Vencedor):
+        """
+        Registra o vencedor de mais uma jogada, sem mexer nas cartas.
+        
+        Args:
+            vencedor (Vencedor): Vencedor da jogada.
+        """
+        self._vencedor_jogadas += (vencedor,)
+        if vencedor is Vencedor.A:
+            self._vitorias_A += 1
+        elif vencedor is Vencedor.B:
+            self._vitorias_B += 1
 
     def quem_ganhou_jogada(self, escolha_A: int, escolha_B: int) -> Vencedor:
         """
         Determina o vencedor de uma jogada individual.
         
         Retira as cartas escolhidas das mãos dos jogadores, compara-as
-        e registra o resultado.
+        e registra o resultado. O lance pode ser desfeito com `desfaz`.
         
         Args:
             escolha_A (int): Índice da carta escolhida pelo jogador A.
@@ -51,11 +120,40 @@ class Mao:
         """
         A = self.cartas_A.pop(escolha_A)
         B = self.cartas_B.pop(escolha_B)
-        jogada = Jogada()
-        vencedor = jogada.quem_ganhou(A, B)
-        self.vencedor_jogadas.append(vencedor)
+        vencedor = _JOGADA.quem_ganhou(A, B)
+        self._desfazer.append((escolha_A, escolha_B, self.carta_na_mesa))
+        self.adiciona_vencedor(vencedor)
+        self.cartas_jogadas.append((A, B))
+        self.carta_na_mesa = None
         return vencedor
 
+    def desfaz(self):
+        """
+        Desfaz o último lance: uma jogada ou um aumento da aposta.
+        
+        As cartas voltam às posições de onde saíram, e o vencedor da jogada,
+        a carta na mesa e o valor da mão voltam ao que eram antes do lance.
+        
+        Raises:
+            IndexError: Se não houver lance a desfazer.
+        """
+        if not self._desfazer:
+            raise IndexError("Não há lance a desfazer.")
+        lance = self._desfazer.pop()
+        if isinstance(lance, Ponto):
+            self.pontos = lance
+            return
+        escolha_A, escolha_B, self.carta_na_mesa = lance
+        A, B = self.cartas_jogadas.pop()
+        self.cartas_A.insert(escolha_A, A)
+        self.cartas_B.insert(escolha_B, B)
+        vencedor = self._vencedor_jogadas[-1]
+        self._vencedor_jogadas = self._vencedor_jogadas[:-1]
+        if vencedor is Vencedor.A:
+            self._vitorias_A -= 1
+        elif vencedor is Vencedor.B:
+            self._vitorias_B -= 1
+
     def mao_acabou(self) -> bool:
         """
         Verifica se a mão (rodada) atual terminou.
@@ -68,17 +166,14 @@ class Mao:
         Returns:
             bool: True se a mão terminou, False caso contrário.
         """
-        if len(self.vencedor_jogadas) <= 1:
+        num_jogadas = len(self._vencedor_jogadas)
+        if num_jogadas <= 1:
             return False
-        elif len(self.vencedor_jogadas) == 2:
-            vitorias_A, vitorias_B = self.conta_vitorias()
-            if vitorias_A == 2 or vitorias_B == 2:
-                return True
-            elif (self.vencedor_jogadas[0] == Vencedor.Nenhum 
-                  or self.vencedor_jogadas[1] == Vencedor.Nenhum):
-                return True
-            else:
-                return False
+        elif num_jogadas == 2:
+            # Com duas jogadas, a mão acaba se alguém venceu as duas ou se
+            # houve empate em alguma delas (menos de duas vitórias no total)
+            return (self._vitorias_A == 2 or self._vitorias_B == 2
+                    or self._vitorias_A + self._vitorias_B < 2)
         else:
             return True
 
@@ -89,9 +184,7 @@ class Mao:
         Returns:
             tuple[int, int]: Uma tupla com o número de vitórias do jogador A e do jogador B.
         """
-        contador_A = self.vencedor_jogadas.count(Vencedor.A)
-        contador_B = self.vencedor_jogadas.count(Vencedor.B)
-        return contador_A, contador_B
+        return self._vitorias_A, self._vitorias_B
 
     def quem_ganhou_a_mao(self) -> Vencedor:
         """
@@ -100,11 +193,9 @@ class Mao:
         Returns:
             Vencedor: Enum indicando qual jogador venceu a mão, ou Nenhum em caso de empate.
         """
-        contador_A = self.vencedor_jogadas.count(Vencedor.A)
-        contador_B = self.vencedor_jogadas.count(Vencedor.B)
-        if contador_A > contador_B:
+        if self._vitorias_A > self._vitorias_B:
             return Vencedor.A
-        elif contador_B > contador_A:
+        elif self._vitorias_B > self._vitorias_A:
             return Vencedor.B
         else:
             return Vencedor.Nenhum
@@ -125,14 +216,17 @@ class Mao:
         Returns:
             bool: True se a mão vale queda, False caso contrário.
         """
-        return self.pontos == Ponto(TipoPontos.Queda)
+        return self.pontos.valor is TipoPontos.Queda
 
     def aumenta_pontos(self, valor: Ponto = None) -> None:
         """
         Aumenta o valor da pontuação da mão atual.
         
+        O lance pode ser desfeito com `desfaz`.
+        
         Args:
             valor (Ponto, opcional): Valor específico para atualização. 
                 Se não for fornecido, aumenta para o próximo nível.
         """
+        self._desfazer.append(self.pontos)
         self.pontos = valor if valor else self.pontos.proximo()
\ No newline at end of file
@@ -0,0 +1,478 @@
+import math
+import random
+import time
+import numpy as np
+from .baralho import Baralho
+from .carta import Carta
+from .cfr import NIVEL, NIVEL_QUEDA, PONTOS_VITORIA, RESPOSTAS, VALORES_NIVEL
+from .estrategia import Estrategia
+from .interface import TipoRespostaTruco
+from .jogada import Vencedor
+from .jogador import Jogador
+from .mao import Mao
+from .ponto import Ponto
+from .resolvedor import _tabela_fim_de_mao
+
+# Fases de uma vez: decidir se pede, responder a um pedido, jogar uma carta
+APOSTA = 0
+RESPOSTA = 1
+CARTA = 2
+
+_A = Vencedor.A.value
+_B = Vencedor.B.value
+_NENHUM = Vencedor.Nenhum.value
+
+# Valor da mão para A (1, 0 ou -1) por histórico, ou None se não acabou
+_FIM_DE_MAO = _tabela_fim_de_mao()
+
+
+class _Estado:
+    """
+    Estado de uma mão com apostas, com as cartas representadas por valores.
+
+    As regras seguem `Jogo._vez` e `Jogo._resposta_ao_truco`: na sua vez,
+    enquanto a mão não vale queda, o jogador decide se pede aumento; o
+    pedido é aceito, recusado (correr) ou aumentado, com os papéis trocados
+    a cada aumento; depois o jogador da vez joga uma carta. Se o truco não
+    é permitido na mão (mão de 10), ninguém pede aumento. As posições são
+    0 para o jogador A e 1 para o jogador B.
+
+    Atributos:
+        maos (list): Valores das cartas de cada jogador, em ordem crescente.
+        historico (list): Códigos de Vencedor das jogadas disputadas.
+        abre (int): Posição de quem abre a jogada atual.
+        mesa (int ou None): Valor da carta jogada por quem abre.
+        nivel (int): Nível da aposta na escada de TipoPontos.
+        fase (int): APOSTA, RESPOSTA ou CARTA.
+        vez (int): Posição do jogador da vez.
+        proponente (int): Posição de quem fez o último pedido.
+        proposto (int): Nível pedido no último pedido.
+        truco_permitido (bool): Se os jogadores podem pedir aumento.
+    """
+
+    __slots__ = ("maos", "historico", "abre", "mesa", "nivel", "fase", "vez",
+                 "proponente", "proposto", "truco_permitido")
+
+    def copia(self) -> "_Estado":
+        """
+        Retorna uma cópia independente do estado.
+
+        Returns:
+            _Estado: A cópia.
+        """
+        estado = _Estado()
+        estado.maos = [list(self.maos[0]), list(self.maos[1])]
+        estado.historico = list(self.historico)
+        estado.abre = self.abre
+        estado.mesa = self.mesa
+        estado.nivel = self.nivel
+        estado.fase = self.fase
+        estado.vez = self.vez
+        estado.proponente = self.proponente
+        estado.proposto = self.proposto
+        estado.truco_permitido = self.truco_permitido
+        return estado
+
+    def jogador(self) -> int:
+        """
+        Retorna a posição do jogador que decide no estado.
+
+        Returns:
+            int: 0 para A, 1 para B.
+        """
+        if self.fase == RESPOSTA:
+            return 1 - self.proponente
+        return self.vez
+
+    def acoes(self) -> tuple:
+        """
+        Retorna as ações permitidas no estado.
+
+        Em APOSTA, 0 é não pedir e 1 é pedir; em RESPOSTA, as ações são os
+        índices de RESPOSTAS; em CARTA, os valores distintos das cartas do
+        jogador da vez.
+
+        Returns:
+            tuple: As ações permitidas.
+        """
+        if self.fase == APOSTA:
+            return (0, 1)
+        if self.fase == RESPOSTA:
+            return (0, 1, 2) if self.proposto < NIVEL_QUEDA else (0, 1)
+        return tuple(sorted(set(self.maos[self.vez])))
+
+    def chave(self) -> tuple:
+        """
+        Retorna o conjunto de informação do jogador que decide.
+
+        O conjunto reúne o que o jogador sabe: suas cartas, o histórico, a
+        carta na mesa e a situação da aposta. As cartas do adversário ficam
+        de fora.
+
+        Returns:
+            tuple: Chave do conjunto de informação.
+        """
+        jogador = self.jogador()
+        return (jogador, tuple(self.maos[jogador]), tuple(self.historico),
+                self.abre, self.mesa, self.nivel, self.fase, self.proposto)
+
+    def aplica(self, acao: int):
+        """
+        Aplica uma ação ao estado.
+
+        Args:
+            acao (int): Uma das ações de `acoes()`.
+
+        Returns:
+            tuple[int, int] ou None: Posição do ganhador e pontos da mão, se a
+                mão acabou; None caso contrário.
+        """
+        if self.fase == APOSTA:
+            if acao == 1:
+                self.fase = RESPOSTA
+                self.proponente = self.vez
+                self.proposto = self.nivel + 1
+            else:
+                self.fase = CARTA
+            return None
+
+        if self.fase == RESPOSTA:
+            if acao == 0:
+                self.nivel = self.proposto
+                self.fase = CARTA
+            elif acao == 1:
+                return self.proponente, VALORES_NIVEL[self.proposto - 1]
+            else:
+                self.proponente = 1 - self.proponente
+                self.proposto += 1
+            return None
+
+        self.maos[self.vez].remove(acao)
+        proxima_fase = (APOSTA if self.truco_permitido
+                        and self.nivel < NIVEL_QUEDA else CARTA)
+        if self.mesa is None:
+            self.mesa = acao
+            self.vez = 1 - self.vez
+            self.fase = proxima_fase
+            return None
+
+        carta_A, carta_B = ((self.mesa, acao) if self.abre == 0
+                            else (acao, self.mesa))
+        if carta_A > carta_B:
+            codigo = _A
+        elif carta_B > carta_A:
+            codigo = _B
+        else:
+            codigo = _NENHUM
+        self.historico.append(codigo)
+        fim = _FIM_DE_MAO[tuple(self.historico)]
+        if fim is not None:
+            # Empate dá os pontos a B, como em Jogo.comecar
+            return (0 if fim == 1 else 1), VALORES_NIVEL[self.nivel]
+
+        if codigo != _NENHUM:
+            self.abre = codigo - 1
+        self.vez = self.abre
+        self.mesa = None
+        self.fase = proxima_fase
+        return None
+
+
+class EstrategiaMCTS(Estrategia):
+    """
+    Estratégia por busca em árvore Monte Carlo sobre conjuntos de informação.
+
+    Usada por jogadores do tipo TipoJogador.MCTS, tanto na escolha de cartas
+    quanto nas decisões de truco. A cada iteração, as cartas do adversário
+    são sorteadas entre as que o jogador não viu (determinização), e a mão é
+    jogada até o fim: nós conhecidos são escolhidos por UCB1 e o restante da
+    mão é jogado ao acaso. Cada nó é o conjunto de informação do jogador que
+    decide nele, de modo que a estatística de um nó junta todas as
+    determinizações que o jogador não consegue distinguir. O resultado é o
+    ganho de pontos, limitado ao que falta para o ganhador chegar a 12.
+    Com manilha variável, as cartas valem o que valem sob a vira da mão, e
+    a vira, que o jogador vê, não é sorteada para o adversário.
+
+    Cada decisão tem um orçamento de iterações e/ou de tempo de relógio; ao
+    esgotar qualquer um deles, a busca para e devolve a ação mais visitada
+    até então. A árvore é mantida entre as decisões de uma mesma Mao e
+    descartada quando uma nova mão começa.
+
+    Cada jogador deve ter sua própria instância, pois a árvore é construída
+    com as cartas do jogador.
+
+    Atributos:
+        iteracoes (int ou None): Máximo de iterações por decisão.
+        tempo (float ou None): Máximo de segundos por decisão.
+        exploracao (float): Constante de exploração do UCB1.
+        baralho (Baralho): Baralho de onde as cartas do adversário são sorteadas.
+        ultima_busca (int): Iterações realizadas na última decisão.
+
+    Métodos:
+        escolhe_carta(jogador, adversario, mao, cartas): Escolhe a carta a jogar.
+        pergunta_truco(jogador, adversario, mao, proposto): Decide se pede truco.
+        responde_truco(jogador, adversario, mao, proposto): Responde a um pedido.
+    """
+
+    def __init__(self, iteracoes: int = 1000, tempo: float = None,
+                 exploracao: float = 0.1, baralho: Baralho = None,
+                 rng: np.random.Generator = None):
+        """
+        Inicializa uma nova instância da classe EstrategiaMCTS.
+
+        Args:
+            iteracoes (int, opcional): Máximo de iterações por decisão, ou None
+                para limitar só pelo tempo. Padrão é 1000.
+            tempo (float, opcional): Máximo de segundos por decisão, ou None
+                para limitar só pelas iterações.
+            exploracao (float, opcional): Constante de exploração do UCB1.
+                Padrão é 0.1, na escala de ganhos divididos por 12.
+            baralho (Baralho, opcional): Baralho do jogo.
+            rng (numpy.random.Generator, opcional): Gerador que semeia os
+                sorteios da busca.
+
+        Raises:
+            ValueError: Se nenhum orçamento for fornecido.
+        """
+        if iteracoes is None and tempo is None:
+            raise ValueError("A busca precisa de um limite de iterações "
+                             "ou de tempo.")
+        self.iteracoes = iteracoes
+        self.tempo = tempo
+        self.exploracao = exploracao
+        self.baralho = baralho if baralho is not None else Baralho()
+        rng = rng if rng is not None else np.random.default_rng()
+        self._aleatorio = random.Random(int(rng.integers(2**63)))
+        self._mao = None
+        self._arvore = {}
+        self.ultima_busca = 0
+
+    def escolhe_carta(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                      cartas: list[Carta]) -> int:
+        """
+        Escolhe a carta a jogar.
+
+        Args:
+            jogador (Jogador): O jogador da vez.
+            adversario (Jogador): O outro jogador.
+            mao (Mao): A mão em andamento.
+            cartas (list[Carta]): Cartas disponíveis para escolha.
+
+        Returns:
+            int: Índice da carta escolhida na lista.
+        """
+        valor = self._decide(jogador, adversario, mao, CARTA, mao.pontos)
+        for indice, carta in enumerate(cartas):
+            if carta.valor == valor:
+                return indice
+
+    def pergunta_truco(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                       proposto: Ponto) -> bool:
+        """
+        Decide se o jogador pede aumento da aposta.
+
+        Args:
+            jogador (Jogador): O jogador da vez.
+            adversario (Jogador): O outro jogador.
+            mao (Mao): A mão em andamento.
+            proposto (Ponto): O valor que seria pedido.
+
+        Returns:
+            bool: True para pedir, False caso contrário.
+        """
+        return self._decide(jogador, adversario, mao, APOSTA, proposto) == 1
+
+    def responde_truco(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                       proposto: Ponto) -> TipoRespostaTruco:
+        """
+        Responde a um pedido de aumento da aposta.
+
+        Args:
+            jogador (Jogador): O jogador que responde.
+            adversario (Jogador): O jogador que pediu.
+            mao (Mao): A mão em andamento.
+            proposto (Ponto): O valor pedido.
+
+        Returns:
+            TipoRespostaTruco: A resposta escolhida.
+        """
+        return RESPOSTAS[self._decide(jogador, adversario, mao, RESPOSTA,
+                                      proposto)]
+
+    def _decide(self, jogador: Jogador, adversario: Jogador, mao: Mao,
+                fase: int, valor: Ponto) -> int:
+        """
+        Monta o estado da decisão a partir da mão e executa a busca.
+
+        Args:
+            jogador (Jogador): O jogador que decide.
+            adversario (Jogador): O outro jogador.
+            mao (Mao): A mão em andamento.
+            fase (int): APOSTA, RESPOSTA ou CARTA.
+            valor (Ponto): Valor que seria pedido (APOSTA), valor pedido
+                (RESPOSTA) ou valor atual da mão (CARTA).
+
+        Returns:
+            int: A ação escolhida.
+        """
+        if mao is not self._mao:
+            self._mao = mao
+            self._arvore = {}
+
+        eu = 0 if jogador.id == Vencedor.A else 1
+        minhas = list(mao.cartas_A if eu == 0 else mao.cartas_B)
+        vez = eu if mao.vez is None else (0 if mao.vez == Vencedor.A else 1)
+        mesa = mao.carta_na_mesa
+        abre = vez if mesa is None else 1 - vez
+
+        # Cartas que o jogador viu: as suas, as já jogadas, a da mesa e a
+        # vira; o nome das manilhas muda com a vira, o índice não
+        vistas = {carta.indice for carta in minhas}
+        for carta_A, carta_B in mao.cartas_jogadas:
+            vistas.add(carta_A.indice)
+            vistas.add(carta_B.indice)
+        if mesa is not None:
+            vistas.add(mesa.indice)
+            if abre == eu:
+                minhas.remove(mesa)
+        if mao.vira is not None:
+            vistas.add(mao.vira.indice)
+        desconhecidas = [carta.valor
+                         for carta in self.baralho.cartas_da_vira(mao.vira)
+                         if carta.indice not in vistas]
+        num_adversario = (3 - len(mao.vencedor_jogadas)
+                          - (mesa is not None and abre != eu))
+
+        raiz = _Estado()
+        raiz.maos = [[], []]
+        raiz.maos[eu] = sorted(carta.valor for carta in minhas)
+        raiz.historico = [vencedor.value for vencedor in mao.vencedor_jogadas]
+        raiz.abre = abre
+        raiz.mesa = None if mesa is None else mesa.valor
+        raiz.vez = vez
+        raiz.fase = fase
+        raiz.nivel = NIVEL[mao.pontos.valor]
+        raiz.proponente = None
+        raiz.proposto = None
+        raiz.truco_permitido = mao.truco_permitido
+        if fase == APOSTA:
+            raiz.nivel = NIVEL[valor.valor] - 1
+        elif fase == RESPOSTA:
+            raiz.proponente = 1 - eu
+            raiz.proposto = NIVEL[valor.valor]
+
+        pontos = [0, 0]
+        pontos[eu] = min(jogador.pontos, PONTOS_VITORIA - 1)
+        pontos[1 - eu] = min(adversario.pontos, PONTOS_VITORIA - 1)
+        return self._busca(raiz, desconhecidas, num_adversario, pontos)
+
+    def _busca(self, raiz: _Estado, desconhecidas: list[int],
+               num_adversario: int, pontos: list[int]) -> int:
+        """
+        Executa a busca a partir de um estado até esgotar o orçamento.
+
+        Args:
+            raiz (_Estado): Estado da decisão, sem as cartas do adversário.
+            desconhecidas (list[int]): Valores das cartas que o jogador não viu.
+            num_adversario (int): Número de cartas na mão do adversário.
+            pontos (list[int]): Pontos de cada jogador no jogo.
+
+        Returns:
+            int: A ação mais visitada na raiz.
+        """
+        aleatorio = self._aleatorio
+        arvore = self._arvore
+        adversario = 1 - raiz.jogador()
+        chave_raiz = raiz.chave()
+        inicio = time.perf_counter()
+        iteracao = 0
+
+        while ((self.iteracoes is None or iteracao < self.iteracoes)
+               and (self.tempo is None
+                    or time.perf_counter() - inicio < self.tempo)):
+            estado = raiz.copia()
+            estado.maos[adversario] = sorted(
+                aleatorio.sample(desconhecidas, num_adversario))
+
+            # Seleção e expansão de um nó novo; depois, jogo ao acaso
+            caminho = []
+            expandiu = False
+            resultado = None
+            while resultado is None:
+                acoes = estado.acoes()
+                if expandiu:
+                    acao = aleatorio.choice(acoes)
+                else:
+                    chave = estado.chave()
+                    no = arvore.get(chave)
+                    if no is None:
+                        no = arvore[chave] = [0, {}]
+                        expandiu = True
+                    acao = self._seleciona(no, acoes)
+                    caminho.append((no, acao, estado.jogador()))
+                resultado = estado.aplica(acao)
+
+            ganhador, valor = resultado
+            ganho = min(valor, PONTOS_VITORIA - pontos[ganhador]) / PONTOS_VITORIA
+            for no, acao, jogador in caminho:
+                no[0] += 1
+                filho = no[1].get(acao)
+                if filho is None:
+                    filho = no[1][acao] = [0, 0.]
+                filho[0] += 1
+                filho[1] += ganho if jogador == ganhador else -ganho
+            iteracao += 1
+
+        self.ultima_busca = iteracao
+        acoes = raiz.acoes()
+        no = arvore.get(chave_raiz)
+        if no is None or not no[1]:
+            return aleatorio.choice(acoes)
+        return max(acoes, key=lambda acao: no[1].get(acao, (0,))[0])
+
+    def _seleciona(self, no: list, acoes: tuple) -> int:
+        """
+        Escolhe a ação de um nó por UCB1, visitando antes as ações novas.
+
+        Args:
+            no (list): Visitas do nó e estatísticas [visitas, soma] por ação.
+            acoes (tuple): Ações permitidas no nó.
+
+        Returns:
+            int: A ação escolhida.
+        """
+        filhos = no[1]
+        novas = [acao for acao in acoes if acao not in filhos]
+        if novas:
+            return self._aleatorio.choice(novas)
+        log_visitas = math.log(no[0])
+        melhor = None
+        melhor_valor = -math.inf
+        for acao in acoes:
+            visitas, soma = filhos[acao]
+            valor = (soma / visitas
+                     + self.exploracao * math.sqrt(log_visitas / visitas))
+            if valor > melhor_valor:
+                melhor = acao
+                melhor_valor = valor
+        return melhor
+
+
+if __name__ == "__main__":
+    from .interface import InterfaceSilenciosa
+    from .jogador import TipoJogador
+    from .jogo import Jogo
+
+    rng = np.random.default_rng()
+    baralho = Baralho(rng=rng)
+    vitorias = 0
+    num_jogos = 20
+    for _ in range(num_jogos):
+        jogador_mcts = Jogador("MCTS", TipoJogador.MCTS,
+                               EstrategiaMCTS(tempo=0.01, iteracoes=None,
+                                              baralho=baralho, rng=rng))
+        jogador_maquina = Jogador("Máquina", TipoJogador.MAQUINA)
+        jogo = Jogo(InterfaceSilenciosa(rng), rng)
+        vencedor = jogo.comecar(jogador_mcts, jogador_maquina, baralho)
+        vitorias += vencedor is jogador_mcts
+    print(f"MCTS venceu {vitorias} de {num_jogos} jogos contra a máquina")
@@ -3,7 +3,7 @@ from enum import Enum
 class TipoPontos(Enum):
     """
     Enumera os tipos de pontuação possíveis no jogo de truco.
-    
+
     Valores:
         Comum (1): Pontuação para uma mão normal (1 ponto).
         Truco (3): Pontuação após pedido de truco (3 pontos).
@@ -17,100 +17,172 @@ class TipoPontos(Enum):
     Nove = 9
     Queda = 12
 
+# Próximo nível de cada tipo de pontuação (Queda é o último)
+_PROXIMO = {
+    TipoPontos.Comum: TipoPontos.Truco,
+    TipoPontos.Truco: TipoPontos.Seis,
+    TipoPontos.Seis: TipoPontos.Nove,
+    TipoPontos.Nove: TipoPontos.Queda,
+    TipoPontos.Queda: None,
+}
+
+# Nome de cada tipo de pontuação, usado nas mensagens do jogo
+_ROTULOS = {
+    TipoPontos.Comum: "comum",
+    TipoPontos.Truco: "truco",
+    TipoPontos.Seis: "seis",
+    TipoPontos.Nove: "nove",
+    TipoPontos.Queda: "queda",
+}
+
 class Ponto:
     """
     Representa a pontuação em uma mão do jogo de truco.
-    
-    Esta classe gerencia os valores de pontos em uma mão e oferece métodos
-    para aumentar ou verificar a próxima pontuação possível.
-    
+
+    Existe uma única instância imutável de Ponto para cada TipoPontos:
+    `Ponto(TipoPontos.Truco)` sempre devolve o mesmo objeto. O próximo nível,
+    o nome e o valor numérico de cada instância são calculados uma única vez,
+    de modo que avançar na escada de apostas não cria objetos.
+
     Atributos:
         valor (TipoPontos): O tipo atual da pontuação.
-        
+
     Métodos:
-        __init__(valor): Inicializa uma instância da classe Ponto.
+        __new__(valor): Retorna a instância única para o tipo de pontuação.
         proximo(): Retorna o próximo nível de pontuação possível.
-        aumenta(): Aumenta o nível de pontuação para o próximo valor.
+        aumenta(): Obsoleto; levanta AttributeError, use proximo().
         retorna_valor(): Retorna o valor numérico da pontuação atual.
         __str__(): Retorna uma representação em string do nível de pontuação.
     """
-    
-    def __init__(self, valor=TipoPontos.Comum):
+
+    __slots__ = ("valor", "_proximo", "_rotulo", "_numero")
+
+    # Instância única de cada tipo de pontuação
+    _internados = {}
+
+    def __new__(cls, valor=TipoPontos.Comum):
         """
-        Inicializa uma nova instância da classe Ponto.
-        
+        Retorna a instância única para o tipo de pontuação.
+
         Args:
-            valor (TipoPontos, opcional): O tipo inicial de pontuação. 
+            valor (TipoPontos, opcional): O tipo de pontuação.
                                           Padrão é TipoPontos.Comum.
+
+        Returns:
+            Ponto: A instância correspondente ao tipo.
+        """
+        return cls._internados[valor]
+
+    def __setattr__(self, nome, valor):
+        """
+        Impede a alteração de um Ponto.
+
+        Raises:
+            AttributeError: Sempre, pois Ponto é imutável.
+        """
+        raise AttributeError("Ponto é imutável.")
+
+    def __reduce__(self):
+        """
+        Permite serializar o Ponto, recuperando a instância única ao carregar.
+
+        Returns:
+            tuple: A classe e o tipo de pontuação.
+        """
+        return (Ponto, (self.valor,))
+
+    def __copy__(self):
+        """
+        Retorna o próprio Ponto, já que ele é imutável.
         """
-        self.valor = valor
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        Retorna o próprio Ponto, já que ele é imutável.
+        """
+        return self
 
     def proximo(self):
         """
         Retorna o próximo nível de pontuação possível sem modificar o atual.
-        
+
         Returns:
-            Ponto: Um novo objeto Ponto com o próximo nível de pontuação.
-        """
-        if self.valor == TipoPontos.Comum:
-            return Ponto(TipoPontos.Truco)
-        elif self.valor == TipoPontos.Truco:
-            return Ponto(TipoPontos.Seis)
-        elif self.valor == TipoPontos.Seis:
-            return Ponto(TipoPontos.Nove)
-        elif self.valor == TipoPontos.Nove:
-            return Ponto(TipoPontos.Queda)
-        
+            Ponto: O Ponto do próximo nível, ou None se o atual for queda.
+        """
+        return self._proximo
+
     def aumenta(self):
         """
-        Aumenta o nível de pontuação para o próximo valor.
-        
-        Modifica o valor do próprio objeto para o próximo nível de pontuação.
+        Aumentava o nível de pontuação no próprio objeto.
+
+        Como Ponto é imutável, não há como aumentar o nível no lugar, e
+        ignorar o erro perderia os pontos em silêncio: use
+        `pontos = pontos.proximo()`.
+
+        Raises:
+            AttributeError: Sempre, pois Ponto é imutável.
         """
-        if self.valor == TipoPontos.Comum:
-            self.valor = TipoPontos.Truco
-        elif self.valor == TipoPontos.Truco:
-            self.valor = TipoPontos.Seis
-        elif self.valor == TipoPontos.Seis:
-            self.valor = TipoPontos.Nove
-        elif self.valor == TipoPontos.Nove:
-            self.valor = TipoPontos.Queda
+        raise AttributeError("Ponto é imutável: use "
+                             "`pontos = pontos.proximo()`.")
 
     def retorna_valor(self):
         """
         Retorna o valor numérico da pontuação atual.
-        
+
         Returns:
             int: O valor numérico associado ao nível de pontuação atual.
         """
-        return self.valor.value
+        return self._numero
 
     def __str__(self):
         """
         Retorna uma representação em string do nível de pontuação.
-        
+
         Returns:
             str: Nome do nível de pontuação atual em texto.
         """
-        if self.valor == TipoPontos.Comum:
-            return "comum"
-        elif self.valor == TipoPontos.Truco:
-            return "truco"
-        elif self.valor == TipoPontos.Seis:
-            return "seis"
-        elif self.valor == TipoPontos.Nove:
-            return "nove"
-        elif self.valor == TipoPontos.Queda:
-            return "queda"
+        return self._rotulo
+
+    def __repr__(self):
+        """
+        Retorna uma representação detalhada do Ponto para depuração.
+
+        Returns:
+            str: Uma string no formato "Ponto(nome)".
+        """
+        return f"Ponto({self._rotulo})"
 
     def __eq__(self, outro) -> bool:
         """
         Compara se o valor atual é igual a outro valor.
-        
+
         Args:
             outro (Ponto): O outro valor a ser comparado.
-            
+
         Returns:
             bool: True se os valores forem iguais, False caso contrário.
         """
-        return self.valor.value == outro.valor.value
\ No newline at end of file
+        return self.valor is outro.valor
+
+    def __hash__(self) -> int:
+        """
+        Retorna o hash do tipo de pontuação, coerente com `__eq__`.
+
+        Returns:
+            int: O hash do Ponto.
+        """
+        return hash(self.valor)
+
+# Cria as instâncias únicas e liga cada uma ao próximo nível
+for _tipo in TipoPontos:
+    _ponto = object.__new__(Ponto)
+    object.__setattr__(_ponto, "valor", _tipo)
+    object.__setattr__(_ponto, "_rotulo", _ROTULOS[_tipo])
+    object.__setattr__(_ponto, "_numero", _tipo.value)
+    Ponto._internados[_tipo] = _ponto
+for _tipo, _ponto in Ponto._internados.items():
+    _seguinte = _PROXIMO[_tipo]
+    object.__setattr__(_ponto, "_proximo",
+                       Ponto._internados[_seguinte] if _seguinte else None)
+del _tipo, _ponto, _seguinte
@@ -0,0 +1,448 @@
+import os
+import struct
+import numpy as np
+from .baralho import Baralho
+from .interface import TipoRespostaTruco
+from .jogada import Vencedor
+from .jogador import Jogador, TipoJogador
+from .mao import Mao
+from .ponto import Ponto, TipoPontos
+
+# Cabeçalho do arquivo: assinatura, versão do formato e tamanho do registro
+MAGICA = b"TRUCOLOG"
+VERSAO = 1
+_CABECALHO = struct.Struct("<8sHH4x")
+TAMANHO_CABECALHO = _CABECALHO.size
+
+# Máximo de eventos de aposta (pedidos e respostas) registrados por mão
+MAX_APOSTAS = 8
+
+# Marca as cartas e jogadas que não chegaram a ser jogadas
+NAO_JOGADA = 255
+
+# Tipos de evento de aposta. Um aumento é registrado como um pedido, feito
+# por quem respondia, no nível seguinte.
+PEDIDO = 1
+ACEITE = 2
+CORRIDA = 3
+
+# Um registro por mão, com layout fixo e sem alinhamento
+DTYPE_REGISTRO = np.dtype([
+    ("jogo", "<u4"),
+    ("quem_abre", "u1"),
+    ("cartas", "u1", (2, 3)),
+    ("jogadas", "u1", (3, 2)),
+    ("vencedores", "u1", (3,)),
+    ("apostas", "u1", (MAX_APOSTAS,)),
+    ("ponto", "u1"),
+    ("quem_correu", "u1"),
+    ("vencedor", "u1"),
+    ("pontos", "u1", (2,)),
+])
+TAMANHO_REGISTRO = DTYPE_REGISTRO.itemsize
+
+_NIVEIS = tuple(TipoPontos)
+_NIVEL = {tipo: nivel for nivel, tipo in enumerate(_NIVEIS)}
+
+# Tipo do evento e deslocamento de nível para cada resposta (None é um pedido)
+_EVENTO = {
+    None: (PEDIDO, 0),
+    TipoRespostaTruco.ACEITAR: (ACEITE, 0),
+    TipoRespostaTruco.CORRER: (CORRIDA, 0),
+    TipoRespostaTruco.AUMENTAR: (PEDIDO, 1),
+}
+
+
+def codifica_aposta(tipo: int, jogador: Vencedor, nivel: int,
+                    rodada: int) -> int:
+    """
+    Codifica um evento de aposta em um byte.
+
+    Os bits 0-1 guardam o tipo do evento, o bit 2 o jogador (A ou B), os
+    bits 3-5 o nível da aposta em `TipoPontos` e os bits 6-7 a jogada da mão
+    em que o evento ocorreu.
+
+    Args:
+        tipo (int): PEDIDO, ACEITE ou CORRIDA.
+        jogador (Vencedor): Quem pediu ou respondeu.
+        nivel (int): Índice em `TipoPontos` do valor pedido.
+        rodada (int): Número de jogadas já concluídas na mão.
+
+    Returns:
+        int: O evento codificado.
+    """
+    return tipo | (jogador.value - 1) << 2 | nivel << 3 | rodada << 6
+
+
+def decodifica_aposta(byte: int) -> tuple:
+    """
+    Decodifica um evento de aposta gerado por `codifica_aposta`.
+
+    Args:
+        byte (int): O evento codificado.
+
+    Returns:
+        tuple: (tipo, jogador, nivel, rodada).
+    """
+    byte = int(byte)
+    return (byte & 3, Vencedor((byte >> 2 & 1) + 1), byte >> 3 & 7,
+            byte >> 6)
+
+
+def _le_cabecalho(arquivo) -> None:
+    """
+    Lê e valida o cabeçalho de um arquivo de registros.
+
+    Args:
+        arquivo: Arquivo binário aberto no início.
+
+    Raises:
+        ValueError: Se o arquivo não for um registro de partidas compatível.
+    """
+    dados = arquivo.read(TAMANHO_CABECALHO)
+    if len(dados) < TAMANHO_CABECALHO:
+        raise ValueError("Arquivo de registros sem cabeçalho.")
+    magica, versao, tamanho = _CABECALHO.unpack(dados)
+    if magica != MAGICA:
+        raise ValueError("Arquivo não é um registro de partidas de truco.")
+    if versao != VERSAO or tamanho != TAMANHO_REGISTRO:
+        raise ValueError(f"Versão de registro não suportada: {versao}.")
+
+
+class GravadorPartidas:
+    """
+    Grava as mãos jogadas em um arquivo binário compacto, só por acréscimo.
+
+    Cada mão ocupa um registro de tamanho fixo (`DTYPE_REGISTRO`) com as
+    cartas distribuídas, as cartas jogadas, os vencedores das jogadas, os
+    pedidos e respostas de truco e o placar ao fim da mão. Os registros são
+    acumulados em memória e escritos em blocos, de modo que o custo por mão
+    no `Jogo` é o de empacotar alguns bytes. As cartas são gravadas pelo seu
+    índice no baralho (`Carta.indice`).
+
+    Atributos:
+        caminho (str): Caminho do arquivo de registros.
+        tamanho_buffer (int): Bytes acumulados antes de cada escrita.
+        num_registros (int): Número de mãos já gravadas no arquivo.
+
+    Métodos:
+        nova_partida(): Reserva o identificador de um novo jogo.
+        registra_mao(partida, mao, quem_abre, quem_correu, ponto, jogador_A, jogador_B):
+            Acrescenta o registro de uma mão encerrada.
+        descarrega(): Escreve no arquivo os registros pendentes.
+        fecha(): Descarrega os registros e fecha o arquivo.
+    """
+
+    def __init__(self, caminho: str, tamanho_buffer: int = 1 << 16):
+        """
+        Abre (ou cria) um arquivo de registros para acréscimo.
+
+        Se o arquivo já existir, seu cabeçalho é validado, um eventual
+        registro incompleto no final é descartado e os identificadores de
+        jogo continuam a partir do último registro.
+
+        Args:
+            caminho (str): Caminho do arquivo de registros.
+            tamanho_buffer (int, opcional): Bytes acumulados antes de cada
+                escrita. Padrão é 64 KiB.
+        """
+        self.caminho = caminho
+        self.tamanho_buffer = tamanho_buffer
+        self._buffer = bytearray()
+        self._proxima_partida = 0
+
+        tamanho = os.path.getsize(caminho) if os.path.exists(caminho) else 0
+        if tamanho:
+            with open(caminho, "rb") as arquivo:
+                _le_cabecalho(arquivo)
+                self.num_registros = ((tamanho - TAMANHO_CABECALHO)
+                                      // TAMANHO_REGISTRO)
+                if self.num_registros:
+                    arquivo.seek(TAMANHO_CABECALHO
+                                 + (self.num_registros - 1) * TAMANHO_REGISTRO)
+                    ultimo = int.from_bytes(arquivo.read(4), "little")
+                    self._proxima_partida = ultimo + 1
+            os.truncate(caminho, TAMANHO_CABECALHO
+                        + self.num_registros * TAMANHO_REGISTRO)
+            self._arquivo = open(caminho, "ab")
+        else:
+            self.num_registros = 0
+            self._arquivo = open(caminho, "ab")
+            self._arquivo.write(_CABECALHO.pack(MAGICA, VERSAO,
+                                                TAMANHO_REGISTRO))
+
+    def nova_partida(self) -> int:
+        """
+        Reserva o identificador de um novo jogo.
+
+        Returns:
+            int: Identificador do jogo, usado em `registra_mao`.
+        """
+        partida = self._proxima_partida
+        self._proxima_partida += 1
+        return partida
+
+    def registra_mao(self, partida: int, mao: Mao, quem_abre: Vencedor,
+                     quem_correu: Vencedor, ponto: Ponto, jogador_A: Jogador,
+                     jogador_B: Jogador):
+        """
+        Acrescenta o registro de uma mão encerrada.
+
+        Args:
+            partida (int): Identificador do jogo, de `nova_partida`.
+            mao (Mao): A mão encerrada.
+            quem_abre (Vencedor): Quem abriu a primeira jogada da mão.
+            quem_correu (Vencedor): Quem correu, ou None se ninguém correu.
+            ponto (Ponto): Pontos atribuídos ao vencedor da mão.
+            jogador_A (Jogador): Jogador A, já com o placar atualizado.
+            jogador_B (Jogador): Jogador B, já com o placar atualizado.
+        """
+        cartas_A, cartas_B = mao.cartas_distribuidas
+        campos = [quem_abre.value]
+        campos += [carta.indice for carta in cartas_A]
+        campos += [carta.indice for carta in cartas_B]
+
+        for carta_A, carta_B in mao.cartas_jogadas:
+            campos.append(carta_A.indice)
+            campos.append(carta_B.indice)
+        campos += [NAO_JOGADA] * (6 - 2 * len(mao.cartas_jogadas))
+
+        campos += [vencedor.value for vencedor in mao.vencedor_jogadas]
+        campos += [NAO_JOGADA] * (3 - len(mao.vencedor_jogadas))
+
+        for jogador, pedido, resposta, rodada in mao.apostas:
+            tipo, aumento = _EVENTO[resposta]
+            campos.append(codifica_aposta(tipo, jogador,
+                                          _NIVEL[pedido.valor] + aumento,
+                                          rodada))
+        campos += [0] * (MAX_APOSTAS - len(mao.apostas))
+
+        if quem_correu is not None:
+            vencedor = Vencedor.A if quem_correu == Vencedor.B else Vencedor.B
+        elif mao.quem_ganhou_a_mao() == Vencedor.A:
+            vencedor = Vencedor.A
+        else:
+            vencedor = Vencedor.B
+        campos.append(ponto.retorna_valor())
+        campos.append(quem_correu.value if quem_correu is not None else 0)
+        campos.append(vencedor.value)
+        campos.append(jogador_A.pontos)
+        campos.append(jogador_B.pontos)
+
+        self._buffer += partida.to_bytes(4, "little")
+        self._buffer += bytes(campos)
+        self.num_registros += 1
+        if len(self._buffer) >= self.tamanho_buffer:
+            self.descarrega()
+
+    def descarrega(self):
+        """
+        Escreve no arquivo os registros pendentes.
+        """
+        if self._buffer:
+            self._arquivo.write(self._buffer)
+            self._arquivo.flush()
+            self._buffer.clear()
+
+    def fecha(self):
+        """
+        Descarrega os registros pendentes e fecha o arquivo.
+        """
+        if not self._arquivo.closed:
+            self.descarrega()
+            self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fecha()
+
+
+def le_registros(caminho: str) -> np.ndarray:
+    """
+    Lê todos os registros de um arquivo de partidas.
+
+    Um registro incompleto no final do arquivo (por exemplo, de uma gravação
+    interrompida) é ignorado.
+
+    Args:
+        caminho (str): Caminho do arquivo de registros.
+
+    Returns:
+        numpy.ndarray: Vetor estruturado com dtype `DTYPE_REGISTRO`.
+    """
+    with open(caminho, "rb") as arquivo:
+        _le_cabecalho(arquivo)
+        num_registros = ((os.path.getsize(caminho) - TAMANHO_CABECALHO)
+                         // TAMANHO_REGISTRO)
+        return np.fromfile(arquivo, dtype=DTYPE_REGISTRO, count=num_registros)
+
+
+class ReprodutorPartidas:
+    """
+    Reconstrói mãos a partir dos registros e audita os resultados gravados.
+
+    A reprodução refaz a mão com as regras de `Mao`: as cartas distribuídas,
+    as apostas e as jogadas, cujo vencedor é recalculado por
+    `Mao.quem_ganhou_jogada`. A auditoria compara o que foi recalculado com
+    o que foi gravado.
+
+    Atributos:
+        baralho (Baralho): Baralho que define os identificadores das cartas.
+
+    Métodos:
+        reproduz(registro): Reconstrói a mão e os jogadores de um registro.
+        audita(caminho): Verifica a consistência de um arquivo de registros.
+    """
+
+    def __init__(self, baralho: Baralho = None):
+        """
+        Inicializa uma nova instância da classe ReprodutorPartidas.
+
+        Args:
+            baralho (Baralho, opcional): Baralho usado na gravação. Padrão é o
+                baralho do arquivo CSV padrão.
+        """
+        self.baralho = baralho if baralho is not None else Baralho()
+
+    def reproduz(self, registro) -> tuple:
+        """
+        Reconstrói a mão e os jogadores de um registro.
+
+        Args:
+            registro (numpy.void): Um elemento de `le_registros`.
+
+        Returns:
+            tuple: (mao, jogador_A, jogador_B), com a mão jogada até o fim e
+                os jogadores com o placar gravado ao fim da mão.
+        """
+        cartas = self.baralho.cartas_por_id
+        mao = Mao()
+        mao.cartas_A = [cartas[i] for i in registro["cartas"][0]]
+        mao.cartas_B = [cartas[i] for i in registro["cartas"][1]]
+        mao.cartas_distribuidas = (tuple(mao.cartas_A), tuple(mao.cartas_B))
+
+        pendente = False
+        for byte in registro["apostas"]:
+            if byte == 0:
+                break
+            tipo, jogador, nivel, rodada = decodifica_aposta(byte)
+            if tipo == PEDIDO and pendente:
+                # Pedido sobre pedido: quem respondia aumentou a aposta
+                mao.apostas.append((jogador, Ponto(_NIVEIS[nivel - 1]),
+                                    TipoRespostaTruco.AUMENTAR, rodada))
+            elif tipo == PEDIDO:
+                mao.apostas.append((jogador, Ponto(_NIVEIS[nivel]), None,
+                                    rodada))
+            elif tipo == ACEITE:
+                mao.apostas.append((jogador, Ponto(_NIVEIS[nivel]),
+                                    TipoRespostaTruco.ACEITAR, rodada))
+                mao.aumenta_pontos(Ponto(_NIVEIS[nivel]))
+            else:
+                mao.apostas.append((jogador, Ponto(_NIVEIS[nivel]),
+                                    TipoRespostaTruco.CORRER, rodada))
+            pendente = tipo == PEDIDO
+
+        for carta_A, carta_B in registro["jogadas"]:
+            if carta_A == NAO_JOGADA:
+                break
+            carta_A, carta_B = cartas[carta_A], cartas[carta_B]
+            indice_A = next(i for i, carta in enumerate(mao.cartas_A)
+                            if carta is carta_A)
+            indice_B = next(i for i, carta in enumerate(mao.cartas_B)
+                            if carta is carta_B)
+            mao.quem_ganhou_jogada(indice_A, indice_B)
+
+        jogador_A = Jogador("A", TipoJogador.MAQUINA)
+        jogador_B = Jogador("B", TipoJogador.MAQUINA)
+        jogador_A.adicionar_id(Vencedor.A)
+        jogador_B.adicionar_id(Vencedor.B)
+        jogador_A.pontos = int(registro["pontos"][0])
+        jogador_B.pontos = int(registro["pontos"][1])
+        return mao, jogador_A, jogador_B
+
+    def audita(self, caminho: str) -> list[str]:
+        """
+        Verifica a consistência de um arquivo de registros.
+
+        Para cada mão, confere o vencedor de cada jogada, o vencedor e o valor
+        da mão (ou o valor anterior ao último pedido, se alguém correu) e se o
+        placar gravado é o placar anterior do mesmo jogo somado a esse valor.
+
+        Args:
+            caminho (str): Caminho do arquivo de registros.
+
+        Returns:
+            list[str]: Descrição de cada inconsistência encontrada; vazia se
+                o arquivo estiver consistente.
+        """
+        erros = []
+        placares = {}
+        for posicao, registro in enumerate(le_registros(caminho)):
+            mao, jogador_A, jogador_B = self.reproduz(registro)
+            jogo = int(registro["jogo"])
+            prefixo = f"registro {posicao} (jogo {jogo})"
+
+            gravados = [int(v) for v in registro["vencedores"]
+                        if v != NAO_JOGADA]
+            refeitos = [v.value for v in mao.vencedor_jogadas]
+            if gravados != refeitos:
+                erros.append(f"{prefixo}: vencedores das jogadas {gravados}, "
+                             f"esperado {refeitos}")
+
+            quem_correu = int(registro["quem_correu"])
+            if quem_correu:
+                if not mao.apostas or \
+                        mao.apostas[-1][2] != TipoRespostaTruco.CORRER or \
+                        mao.apostas[-1][0].value != quem_correu:
+                    erros.append(f"{prefixo}: corrida sem pedido pendente")
+                    continue
+                vencedor = 3 - quem_correu
+                recusado = _NIVEL[mao.apostas[-1][1].valor]
+                ponto = Ponto(_NIVEIS[recusado - 1]).retorna_valor()
+            else:
+                if not mao.mao_acabou():
+                    erros.append(f"{prefixo}: mão gravada antes do fim")
+                    continue
+                vencedor = (Vencedor.A.value
+                            if mao.quem_ganhou_a_mao() == Vencedor.A
+                            else Vencedor.B.value)
+                ponto = mao.quanto_vale_a_mao().retorna_valor()
+
+            if int(registro["vencedor"]) != vencedor:
+                erros.append(f"{prefixo}: vencedor {int(registro['vencedor'])}, "
+                             f"esperado {vencedor}")
+            if int(registro["ponto"]) != ponto:
+                erros.append(f"{prefixo}: valor {int(registro['ponto'])}, "
+                             f"esperado {ponto}")
+
+            anterior = placares.get(jogo, (0, 0))
+            esperado = (anterior[0] + ponto * (vencedor == Vencedor.A.value),
+                        anterior[1] + ponto * (vencedor == Vencedor.B.value))
+            gravado = (jogador_A.pontos, jogador_B.pontos)
+            if gravado != esperado:
+                erros.append(f"{prefixo}: placar {gravado}, esperado {esperado}")
+            placares[jogo] = gravado
+        return erros
+
+
+if __name__ == "__main__":
+    import tempfile
+    from .simulador import Simulador
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        Simulador(num_processos=1, semente=0,
+                  diretorio_registros=diretorio).executa(1000)
+        caminho = os.path.join(diretorio, "lote_00000.trlog")
+        registros = le_registros(caminho)
+        print(f"{len(registros)} mãos em {os.path.getsize(caminho)} bytes "
+              f"({TAMANHO_REGISTRO} bytes por mão)")
+        jogada = registros[registros["jogadas"][:, 0, 0] != NAO_JOGADA][0]
+        mao, jogador_A, jogador_B = ReprodutorPartidas().reproduz(jogada)
+        jogadas = ", ".join(f"{carta_A} x {carta_B}"
+                            for carta_A, carta_B in mao.cartas_jogadas)
+        print(f"mão {jogadas} | vale {mao.quanto_vale_a_mao()} | "
+              f"placar {jogador_A.pontos} x {jogador_B.pontos}")
+        erros = ReprodutorPartidas().audita(caminho)
+        print(f"auditoria: {len(erros)} inconsistências")
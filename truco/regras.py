@@ -0,0 +1,223 @@
+import enum
+from .carta import Carta
+
+# Postos das cartas, da mais fraca para a mais forte, fora as manilhas
+ORDEM_POSTOS = ("4", "5", "6", "7", "Rainha", "Valete", "Rei", "Ás", "2", "3")
+
+# Naipes das manilhas, da mais fraca para a mais forte
+ORDEM_NAIPES = ("Ouros", "Espadas", "Copas", "Paus")
+
+# Nomes das manilhas fixas de `cartas.csv`
+_APELIDOS = {"Zap": "4 Paus", "Espadilha": "Ás Espadas"}
+
+# Valor da manilha mais fraca; as demais seguem a ordem dos naipes
+_VALOR_MANILHA = len(ORDEM_POSTOS) + 1
+
+
+def posto_e_naipe(nome: str) -> tuple[str, str]:
+    """
+    Separa o posto e o naipe do nome de uma carta.
+
+    Os nomes das manilhas fixas ("Zap", "Espadilha") são traduzidos para a
+    carta que representam.
+
+    Args:
+        nome (str): Nome da carta, como em `cartas.csv` (ex.: "Rei Copas").
+
+    Returns:
+        tuple[str, str]: O posto e o naipe da carta.
+
+    Raises:
+        ValueError: Se o nome não corresponder a uma carta conhecida.
+    """
+    posto, _, naipe = _APELIDOS.get(nome, nome).rpartition(" ")
+    if posto not in ORDEM_POSTOS or naipe not in ORDEM_NAIPES:
+        raise ValueError(f"Carta desconhecida: {nome!r}.")
+    return posto, naipe
+
+
+class TipoMao(enum.Enum):
+    """
+    Enumera os tipos de mão definidos pelo placar.
+
+    Valores:
+        Normal (0): Mão comum.
+        MaoDe10 (1): Um dos jogadores está na mão de 10.
+        MaoDeFerro (2): Os dois jogadores estão na mão de 10.
+    """
+    Normal = 0
+    MaoDe10 = 1
+    MaoDeFerro = 2
+
+
+class Regras:
+    """
+    Conjunto de regras de um jogo de truco.
+
+    As regras padrão são as do truco mineiro de `cartas.csv`, com manilhas
+    fixas. Com manilha variável (truco paulista), uma carta virada após a
+    distribuição, a vira, define as manilhas: as quatro cartas do posto
+    seguinte ao da vira, ordenadas pelo naipe (Ouros, Espadas, Copas e
+    Paus). As demais cartas valem só pelo posto.
+
+    Cada conjunto de regras é compilado uma única vez por baralho em uma
+    tabela de cartas por vira: para cada vira, uma tupla com a `Carta` de
+    cada identificador, com o valor que ela tem sob essa vira. As cartas são
+    internadas e criadas só na compilação, então distribuir uma mão é
+    indexar a tabela, e `Jogada.quem_ganhou` e as estratégias, que comparam
+    `Carta.valor`, não precisam saber qual é a vira.
+
+    Atributos:
+        nome (str): Nome do conjunto de regras.
+        manilha_variavel (bool): Se as manilhas são definidas pela vira.
+        mao_de_10 (bool): Se vale a mão de 10: quando só um jogador tem
+            `pontos_mao_de_10` pontos ou mais, a mão vale um truco e não se
+            pode pedir truco.
+        mao_de_ferro (bool): Se vale a mão de ferro: quando os dois
+            jogadores estão na mão de 10, as cartas são jogadas às cegas, na
+            ordem em que foram recebidas, também valendo um truco.
+        pontos_mao_de_10 (int): Pontuação a partir da qual um jogador está
+            na mão de 10.
+
+    Métodos:
+        compila(cartas): Retorna a tabela de cartas por vira de um baralho.
+        tipo_de_mao(pontos_A, pontos_B): Retorna o tipo da próxima mão.
+    """
+
+    def __init__(self, nome: str = "mineiro", manilha_variavel: bool = False,
+                 mao_de_10: bool = False, mao_de_ferro: bool = False,
+                 pontos_mao_de_10: int = 10):
+        """
+        Inicializa uma nova instância da classe Regras.
+
+        Args:
+            nome (str, opcional): Nome do conjunto de regras.
+            manilha_variavel (bool, opcional): Manilhas definidas pela vira.
+            mao_de_10 (bool, opcional): Aplica a mão de 10.
+            mao_de_ferro (bool, opcional): Aplica a mão de ferro; só tem
+                efeito com a mão de 10.
+            pontos_mao_de_10 (int, opcional): Pontuação da mão de 10. Padrão
+                é 10.
+        """
+        self.nome = nome
+        self.manilha_variavel = manilha_variavel
+        self.mao_de_10 = mao_de_10
+        self.mao_de_ferro = mao_de_ferro
+        self.pontos_mao_de_10 = pontos_mao_de_10
+        self._tabelas = {}
+
+    def compila(self, cartas: tuple) -> tuple:
+        """
+        Retorna a tabela de cartas por vira de um baralho.
+
+        A tabela é calculada na primeira chamada para cada baralho e
+        guardada nas regras.
+
+        Args:
+            cartas (tuple[Carta]): As cartas do baralho, por identificador
+                (`Baralho.cartas_por_id`, como lidas do arquivo).
+
+        Returns:
+            tuple[tuple[Carta]]: Com manilha variável, a linha `vira` contém
+                a carta de cada identificador sob a vira de identificador
+                `vira`. Com manilhas fixas, uma única linha com as próprias
+                cartas.
+
+        Raises:
+            ValueError: Se, com manilha variável, alguma carta não for
+                reconhecida.
+        """
+        em_cache = self._tabelas.get(id(cartas))
+        if em_cache is not None and em_cache[0] is cartas:
+            return em_cache[1]
+        if not self.manilha_variavel:
+            tabela = (tuple(cartas),)
+        else:
+            postos_naipes = [posto_e_naipe(carta.nome) for carta in cartas]
+            tabela = tuple(self._cartas_da_vira(cartas, postos_naipes, posto)
+                           for posto, _ in postos_naipes)
+        self._tabelas[id(cartas)] = (cartas, tabela)
+        return tabela
+
+    @staticmethod
+    def _cartas_da_vira(cartas: tuple, postos_naipes: list,
+                        posto_vira: str) -> tuple:
+        """
+        Cria as cartas de um baralho com os valores sob uma vira.
+
+        Args:
+            cartas (tuple[Carta]): As cartas do baralho, por identificador.
+            postos_naipes (list[tuple[str, str]]): Posto e naipe de cada carta.
+            posto_vira (str): Posto da vira.
+
+        Returns:
+            tuple[Carta]: A carta de cada identificador sob a vira.
+        """
+        manilha = ORDEM_POSTOS[(ORDEM_POSTOS.index(posto_vira) + 1)
+                               % len(ORDEM_POSTOS)]
+        linha = []
+        for carta, (posto, naipe) in zip(cartas, postos_naipes):
+            if posto == manilha:
+                valor = _VALOR_MANILHA + ORDEM_NAIPES.index(naipe)
+            else:
+                valor = ORDEM_POSTOS.index(posto) + 1
+            linha.append(Carta(f"{posto} {naipe}", valor, carta.indice))
+        return tuple(linha)
+
+    def tipo_de_mao(self, pontos_A: int, pontos_B: int) -> TipoMao:
+        """
+        Retorna o tipo da próxima mão, de acordo com o placar.
+
+        Args:
+            pontos_A (int): Pontos do jogador A.
+            pontos_B (int): Pontos do jogador B.
+
+        Returns:
+            TipoMao: O tipo da mão.
+        """
+        if not self.mao_de_10:
+            return TipoMao.Normal
+        na_mao_de_10 = ((pontos_A >= self.pontos_mao_de_10)
+                        + (pontos_B >= self.pontos_mao_de_10))
+        if na_mao_de_10 == 2 and self.mao_de_ferro:
+            return TipoMao.MaoDeFerro
+        return TipoMao.MaoDe10 if na_mao_de_10 else TipoMao.Normal
+
+    def __getstate__(self) -> dict:
+        """
+        Retorna o estado a serializar, sem as tabelas compiladas.
+
+        Returns:
+            dict: Os atributos das regras.
+        """
+        estado = self.__dict__.copy()
+        estado["_tabelas"] = {}
+        return estado
+
+    def __repr__(self):
+        """
+        Retorna uma representação detalhada das regras para depuração.
+
+        Returns:
+            str: Representação das regras.
+        """
+        return f"Regras({self.nome!r})"
+
+
+# Conjuntos de regras prontos
+MINEIRO = Regras("mineiro")
+MINEIRO_MAO_DE_10 = Regras("mineiro com mão de 10", mao_de_10=True,
+                           mao_de_ferro=True)
+PAULISTA = Regras("paulista", manilha_variavel=True, mao_de_10=True,
+                  mao_de_ferro=True)
+
+
+if __name__ == "__main__":
+    from .baralho import Baralho
+
+    baralho = Baralho()
+    tabela = PAULISTA.compila(baralho.cartas_por_id)
+    for vira in (baralho.nomes.index("3 Copas"), baralho.nomes.index("Zap")):
+        cartas = sorted(tabela[vira], key=lambda carta: -carta.valor)
+        print(f"vira {tabela[vira][vira]}: manilhas",
+              ", ".join(str(carta) for carta in cartas[:4]))
@@ -0,0 +1,219 @@
+from itertools import product
+from .carta import Carta
+from .jogada import Vencedor
+from .mao import Mao
+
+_A = Vencedor.A.value
+_B = Vencedor.B.value
+_NENHUM = Vencedor.Nenhum.value
+
+# Valor de cada resultado da mão para o jogador A
+_PAYOFF = {_A: 1, _NENHUM: 0, _B: -1}
+_RESULTADO = {1: Vencedor.A, 0: Vencedor.Nenhum, -1: Vencedor.B}
+
+
+def _tabela_fim_de_mao() -> dict:
+    """
+    Calcula, para cada histórico de jogadas, se a mão acabou e quem venceu.
+
+    As regras são as de `Mao.mao_acabou` e `Mao.quem_ganhou_a_mao`.
+
+    Returns:
+        dict: Mapeia a tupla de códigos de Vencedor das jogadas para o valor
+            da mão para A (1, 0 ou -1), ou None se a mão não acabou.
+    """
+    tabela = {}
+    for tamanho in range(4):
+        for historico in product(Vencedor, repeat=tamanho):
+            mao = Mao()
+            mao.vencedor_jogadas = list(historico)
+            chave = tuple(v.value for v in historico)
+            if mao.mao_acabou():
+                tabela[chave] = _PAYOFF[mao.quem_ganhou_a_mao().value]
+            else:
+                tabela[chave] = None
+    return tabela
+
+
+def _empacota(valores: tuple) -> int:
+    """
+    Empacota uma mão ordenada de valores em um inteiro, 5 bits por carta.
+
+    Args:
+        valores (tuple): Valores das cartas, em ordem crescente.
+
+    Returns:
+        int: A mão empacotada.
+    """
+    codigo = 0
+    for valor in valores:
+        codigo = (codigo << 5) | valor
+    return codigo
+
+
+class Resolvedor:
+    """
+    Resolve o jogo de cartas de uma mão com informação perfeita.
+
+    Conhecendo as cartas dos dois jogadores, as jogadas já disputadas e quem
+    abre, o resolvedor faz uma busca minimax sobre as cartas restantes e
+    devolve a melhor carta para o jogador da vez e o resultado garantido com
+    jogo ótimo dos dois lados. Apostas não são consideradas.
+
+    Como só o valor das cartas importa, o estado é reduzido aos valores
+    ordenados das mãos e empacotado em um inteiro, usado como chave de uma
+    tabela de transposição compartilhada por todas as consultas. Os
+    movimentos são ordenados pelo valor da carta, da maior para a menor, e a
+    busca para assim que encontra o melhor resultado possível. Depois da
+    primeira consulta de um estado, as seguintes custam uma busca em
+    dicionário.
+
+    Atributos:
+        tabela (dict): Tabela de transposição, do estado empacotado para o
+            par (valor para A, valor da melhor carta).
+
+    Métodos:
+        resolve(cartas_A, cartas_B, vencedor_jogadas, quem_abre, carta_na_mesa):
+            Retorna a melhor carta do jogador da vez e o resultado garantido.
+        resolve_mao(mao, quem_abre, carta_na_mesa): O mesmo, a partir de uma Mao.
+    """
+
+    _fim_de_mao = _tabela_fim_de_mao()
+
+    def __init__(self):
+        """
+        Inicializa uma nova instância da classe Resolvedor.
+        """
+        self.tabela = {}
+
+    def resolve(self, cartas_A: list[Carta], cartas_B: list[Carta],
+                vencedor_jogadas: list[Vencedor], quem_abre: Vencedor,
+                carta_na_mesa: Carta = None) -> tuple[int, Vencedor]:
+        """
+        Retorna a melhor carta do jogador da vez e o resultado garantido.
+
+        O jogador da vez é quem abre a jogada atual, ou o outro se quem abre
+        já jogou `carta_na_mesa`.
+
+        Args:
+            cartas_A (list[Carta]): Cartas na mão do jogador A.
+            cartas_B (list[Carta]): Cartas na mão do jogador B.
+            vencedor_jogadas (list[Vencedor]): Vencedores das jogadas já
+                disputadas na mão.
+            quem_abre (Vencedor): Jogador que abre a jogada atual.
+            carta_na_mesa (Carta, opcional): Carta já jogada por quem abre.
+
+        Returns:
+            tuple[int, Vencedor]: Índice da melhor carta na mão do jogador da
+                vez e o vencedor da mão com jogo ótimo.
+        """
+        abre = quem_abre.value
+        mesa = 0 if carta_na_mesa is None else carta_na_mesa.valor
+        valor, melhor = self._resolve(
+            tuple(sorted([carta.valor for carta in cartas_A])),
+            tuple(sorted([carta.valor for carta in cartas_B])),
+            tuple([vencedor.value for vencedor in vencedor_jogadas]),
+            abre, mesa)
+
+        vez = abre if mesa == 0 else _A + _B - abre
+        cartas = cartas_A if vez == _A else cartas_B
+        for indice, carta in enumerate(cartas):
+            if carta.valor == melhor:
+                return indice, _RESULTADO[valor]
+
+    def resolve_mao(self, mao: Mao, quem_abre: Vencedor,
+                    carta_na_mesa: Carta = None) -> tuple[int, Vencedor]:
+        """
+        Retorna a melhor carta do jogador da vez em uma Mao.
+
+        Args:
+            mao (Mao): A mão em andamento.
+            quem_abre (Vencedor): Jogador que abre a jogada atual.
+            carta_na_mesa (Carta, opcional): Carta já jogada por quem abre.
+
+        Returns:
+            tuple[int, Vencedor]: Índice da melhor carta na mão do jogador da
+                vez e o vencedor da mão com jogo ótimo.
+        """
+        return self.resolve(mao.cartas_A, mao.cartas_B, mao.vencedor_jogadas,
+                            quem_abre, carta_na_mesa)
+
+    def _resolve(self, mao_A: tuple, mao_B: tuple, historico: tuple,
+                 abre: int, mesa: int) -> tuple[int, int]:
+        """
+        Busca minimax com tabela de transposição sobre valores de cartas.
+
+        Args:
+            mao_A (tuple): Valores das cartas de A, em ordem crescente.
+            mao_B (tuple): Valores das cartas de B, em ordem crescente.
+            historico (tuple): Códigos de Vencedor das jogadas disputadas.
+            abre (int): Código de Vencedor de quem abre a jogada atual.
+            mesa (int): Valor da carta jogada por quem abre, ou 0.
+
+        Returns:
+            tuple[int, int]: Valor da mão para A (1, 0 ou -1) e valor da
+                melhor carta do jogador da vez.
+        """
+        historico_codigo = 1
+        for vencedor in historico:
+            historico_codigo = (historico_codigo << 2) | vencedor
+        chave = ((((_empacota(mao_A) << 15 | _empacota(mao_B)) << 8
+                   | historico_codigo) << 2 | abre) << 5 | mesa)
+        resultado = self.tabela.get(chave)
+        if resultado is not None:
+            return resultado
+
+        vez_A = (abre == _A) == (mesa == 0)
+        mao = mao_A if vez_A else mao_B
+        alvo = 1 if vez_A else -1
+        melhor_valor = None
+        melhor_carta = None
+
+        # Cartas de mesmo valor são equivalentes; as maiores primeiro
+        anterior = None
+        for posicao in range(len(mao) - 1, -1, -1):
+            carta = mao[posicao]
+            if carta == anterior:
+                continue
+            anterior = carta
+            restante = mao[:posicao] + mao[posicao + 1:]
+            novo_A, novo_B = (restante, mao_B) if vez_A else (mao_A, restante)
+
+            if mesa == 0:
+                valor = self._resolve(novo_A, novo_B, historico, abre, carta)[0]
+            else:
+                carta_A, carta_B = (carta, mesa) if vez_A else (mesa, carta)
+                if carta_A > carta_B:
+                    vencedor = _A
+                elif carta_B > carta_A:
+                    vencedor = _B
+                else:
+                    vencedor = _NENHUM
+                novo_historico = historico + (vencedor,)
+                valor = self._fim_de_mao[novo_historico]
+                if valor is None:
+                    proximo = abre if vencedor == _NENHUM else vencedor
+                    valor = self._resolve(novo_A, novo_B, novo_historico,
+                                          proximo, 0)[0]
+
+            if melhor_valor is None or valor * alvo > melhor_valor * alvo:
+                melhor_valor = valor
+                melhor_carta = carta
+                if valor == alvo:
+                    break
+
+        resultado = (melhor_valor, melhor_carta)
+        self.tabela[chave] = resultado
+        return resultado
+
+
+if __name__ == "__main__":
+    from .baralho import Baralho
+
+    resolvedor = Resolvedor()
+    cartas_A, cartas_B = Baralho().distribui_cartas()
+    indice, vencedor = resolvedor.resolve(cartas_A, cartas_B, [], Vencedor.A)
+    print("Jogador A:", [carta.nome for carta in cartas_A])
+    print("Jogador B:", [carta.nome for carta in cartas_B])
+    print(f"Melhor carta para A: {cartas_A[indice].nome}; "
+          f"resultado com jogo ótimo: {vencedor.name}")
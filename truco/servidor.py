@@ -0,0 +1,660 @@
+import asyncio
+import json
+import sys
+import time
+import numpy as np
+from .baralho import Baralho, ARQUIVO_CARTAS
+from .carta import Carta
+from .decisao import Decisao, TipoDecisao
+from .interface import InterfaceSilenciosa, TipoRespostaTruco
+from .jogada import Vencedor
+from .jogador import Jogador, TipoJogador
+from .jogo import Jogo
+from .mao import Mao
+from .ponto import Ponto
+
+# Nome de cada resposta ao truco no protocolo
+_NOMES_RESPOSTA = {
+    TipoRespostaTruco.ACEITAR: "aceitar",
+    TipoRespostaTruco.CORRER: "correr",
+    TipoRespostaTruco.AUMENTAR: "aumentar",
+}
+_RESPOSTAS_POR_NOME = {nome: tipo for tipo, nome in _NOMES_RESPOSTA.items()}
+
+# Tamanho máximo de uma linha do protocolo, em bytes
+LIMITE_LINHA = 4096
+
+
+class InterfaceMesa(InterfaceSilenciosa):
+    """
+    Interface de uma mesa do servidor.
+
+    Decide pelos jogadores máquina como a `InterfaceSilenciosa` e, em vez de
+    descartar as mensagens do jogo, guarda-as para que a mesa as envie aos
+    seus lugares entre uma decisão e outra.
+
+    Atributos:
+        mensagens (list): Pares (destinatário, mensagem) ainda não enviados;
+            o destinatário é o id (Vencedor) de um jogador, ou None para os dois.
+    """
+
+    def __init__(self, rng: np.random.Generator = None):
+        """
+        Inicializa uma nova instância da classe InterfaceMesa.
+
+        Args:
+            rng (numpy.random.Generator, opcional): Gerador usado nas decisões
+                dos jogadores máquina.
+        """
+        super().__init__(rng)
+        self.mensagens = []
+        self._quem_abre = None
+
+    def informa_quem_abre(self, jogador: Jogador):
+        """
+        Registra quem abre a mão que vai começar.
+
+        Args:
+            jogador (Jogador): O jogador que abre a mão.
+        """
+        super().informa_quem_abre(jogador)
+        self._quem_abre = jogador
+
+    def informa_nova_mao(self, mao: Mao, jogador_A: Jogador, jogador_B: Jogador):
+        """
+        Registra a mão que começa e envia a cada jogador as suas cartas.
+
+        Args:
+            mao (Mao): A mão recém-distribuída.
+            jogador_A (Jogador): Primeiro jogador.
+            jogador_B (Jogador): Segundo jogador.
+        """
+        super().informa_nova_mao(mao, jogador_A, jogador_B)
+        for jogador, cartas in ((jogador_A, mao.cartas_A),
+                                (jogador_B, mao.cartas_B)):
+            self.mensagens.append((jogador.id, {
+                "tipo": "mao", "cartas": [carta.nome for carta in cartas],
+                "abre": self._quem_abre.nome}))
+
+    def informa_placar_mao(self, jogador_A: Jogador, jogador_B: Jogador,
+                           mao: Mao):
+        """
+        Envia as cartas e o vencedor da jogada que acabou de ser disputada.
+
+        Args:
+            jogador_A (Jogador): Primeiro jogador.
+            jogador_B (Jogador): Segundo jogador.
+            mao (Mao): A mão atual.
+        """
+        carta_A, carta_B = mao.cartas_jogadas[-1]
+        self.mensagens.append((None, {
+            "tipo": "jogada", "cartas": [carta_A.nome, carta_B.nome],
+            "vencedor": mao.vencedor_jogadas[-1].name}))
+
+    def informa_placar_jogo(self, jogador_A: Jogador, jogador_B: Jogador):
+        """
+        Envia o placar do jogo.
+
+        Args:
+            jogador_A (Jogador): Primeiro jogador.
+            jogador_B (Jogador): Segundo jogador.
+        """
+        self.mensagens.append((None, {"tipo": "placar", "A": jogador_A.pontos,
+                                      "B": jogador_B.pontos}))
+
+    def mostra_vencedor(self, jogador: Jogador):
+        """
+        Envia o vencedor do jogo.
+
+        Args:
+            jogador (Jogador): O jogador vencedor.
+        """
+        self.mensagens.append((None, {"tipo": "fim", "vencedor": jogador.nome}))
+
+
+class AssentoMaquina:
+    """
+    Lugar de um jogador máquina em uma mesa do servidor.
+
+    As decisões são tomadas na hora, sem esperar, pela `InterfaceMesa`
+    da mesa, de modo que jogadores com estratégia (CFR, MCTS) também podem
+    ocupar o lugar.
+
+    Atributos:
+        jogador (Jogador): O jogador sentado no lugar.
+        interface (InterfaceMesa): Interface que decide pelo jogador.
+    """
+
+    def __init__(self, jogador: Jogador, interface: InterfaceMesa):
+        """
+        Inicializa uma nova instância da classe AssentoMaquina.
+
+        Args:
+            jogador (Jogador): O jogador máquina.
+            interface (InterfaceMesa): Interface da mesa.
+        """
+        self.jogador = jogador
+        self.interface = interface
+
+    async def informa(self, mensagem: dict):
+        """
+        Descarta uma mensagem destinada ao jogador.
+
+        Args:
+            mensagem (dict): A mensagem.
+        """
+        pass
+
+    async def decide(self, decisao: Decisao):
+        """
+        Toma uma decisão do jogo na hora, pela interface da mesa.
+
+        Args:
+            decisao (Decisao): A decisão a ser tomada.
+
+        Returns:
+            A resposta à decisão, como em `Interface.decide`.
+        """
+        return self.interface.decide(decisao)
+
+
+class AssentoRemoto:
+    """
+    Lugar de um jogador humano conectado ao servidor por um socket.
+
+    As mensagens são objetos JSON, um por linha. Cada decisão é pedida com
+    uma mensagem cujo `tipo` é `escolhe_carta`, `pergunta_truco` ou
+    `responde_truco`, e aguardada até o limite de tempo; respostas inválidas
+    recebem uma mensagem de `erro` e a pergunta é repetida.
+
+    Atributos:
+        jogador (Jogador): O jogador sentado no lugar.
+        tempo_resposta (float): Segundos de espera por cada resposta.
+    """
+
+    def __init__(self, jogador: Jogador, leitor: asyncio.StreamReader,
+                 escritor: asyncio.StreamWriter, tempo_resposta: float):
+        """
+        Inicializa uma nova instância da classe AssentoRemoto.
+
+        Args:
+            jogador (Jogador): O jogador humano.
+            leitor (asyncio.StreamReader): Entrada da conexão.
+            escritor (asyncio.StreamWriter): Saída da conexão.
+            tempo_resposta (float): Segundos de espera por cada resposta.
+        """
+        self.jogador = jogador
+        self.tempo_resposta = tempo_resposta
+        self._leitor = leitor
+        self._escritor = escritor
+
+    async def informa(self, mensagem: dict):
+        """
+        Envia uma mensagem ao cliente.
+
+        Args:
+            mensagem (dict): A mensagem.
+        """
+        self._escritor.write(json.dumps(mensagem).encode() + b"\n")
+        await self._escritor.drain()
+
+    async def _pergunta(self, mensagem: dict, valida):
+        """
+        Envia uma pergunta e aguarda uma resposta válida.
+
+        Args:
+            mensagem (dict): A pergunta.
+            valida (callable): Recebe a resposta decodificada e devolve a
+                decisão, ou lança ValueError se a resposta for inválida.
+
+        Returns:
+            A decisão devolvida por `valida`.
+
+        Raises:
+            ConnectionError: Se o cliente desconectar ou enviar uma linha
+                maior que LIMITE_LINHA, o que é tratado como abandono.
+            asyncio.TimeoutError: Se o cliente não responder a tempo.
+        """
+        await self.informa(mensagem)
+        while True:
+            try:
+                linha = await asyncio.wait_for(self._leitor.readline(),
+                                               self.tempo_resposta)
+            except ValueError as erro:
+                raise ConnectionError(f"{self.jogador.nome} enviou uma linha "
+                                      f"maior que {LIMITE_LINHA} bytes."
+                                      ) from erro
+            if not linha:
+                raise ConnectionError(f"{self.jogador.nome} desconectou.")
+            try:
+                return valida(json.loads(linha))
+            except (ValueError, KeyError, TypeError) as erro:
+                await self.informa({"tipo": "erro", "mensagem": str(erro)})
+
+    async def decide(self, decisao: Decisao):
+        """
+        Pede ao cliente a resposta a uma decisão do jogo.
+
+        Args:
+            decisao (Decisao): A decisão a ser tomada.
+
+        Returns:
+            A resposta do cliente, como em `Interface.decide`.
+        """
+        if decisao.tipo == TipoDecisao.CARTA:
+            return await self.escolhe_carta(decisao.mao, decisao.opcoes)
+        elif decisao.tipo == TipoDecisao.PEDIR_TRUCO:
+            return await self.pergunta_truco(decisao.mao, decisao.valor)
+        return await self.responde_truco(decisao.proponente, decisao.mao,
+                                         decisao.valor)
+
+    async def escolhe_carta(self, mao: Mao, cartas: list[Carta]) -> int:
+        """
+        Pede ao cliente que escolha uma carta.
+
+        Args:
+            mao (Mao): A mão em andamento.
+            cartas (list[Carta]): Cartas disponíveis para escolha.
+
+        Returns:
+            int: Índice da carta escolhida na lista.
+        """
+        def valida(resposta):
+            escolha = resposta["carta"]
+            if type(escolha) is not int or not 0 <= escolha < len(cartas):
+                raise ValueError("Escolha inválida.")
+            return escolha
+
+        mesa = mao.carta_na_mesa
+        return await self._pergunta({
+            "tipo": "escolhe_carta",
+            "cartas": [carta.nome for carta in cartas],
+            "mesa": None if mesa is None else mesa.nome,
+        }, valida)
+
+    async def pergunta_truco(self, mao: Mao, proposto: Ponto) -> bool:
+        """
+        Pergunta ao cliente se deseja pedir aumento da aposta.
+
+        Args:
+            mao (Mao): A mão em andamento.
+            proposto (Ponto): O valor que seria pedido.
+
+        Returns:
+            bool: True para pedir, False caso contrário.
+        """
+        def valida(resposta):
+            if type(resposta["pedir"]) is not bool:
+                raise ValueError("O campo 'pedir' deve ser booleano.")
+            return resposta["pedir"]
+
+        return await self._pergunta({"tipo": "pergunta_truco",
+                                     "valor": str(proposto)}, valida)
+
+    async def responde_truco(self, proponente: Jogador, mao: Mao,
+                             valor: Ponto) -> TipoRespostaTruco:
+        """
+        Pede ao cliente uma resposta a um pedido de aumento da aposta.
+
+        Args:
+            proponente (Jogador): O jogador que pediu.
+            mao (Mao): A mão em andamento.
+            valor (Ponto): O valor da aposta antes do pedido.
+
+        Returns:
+            TipoRespostaTruco: A resposta do cliente.
+        """
+        proposto = valor.proximo()
+        opcoes = ["aceitar", "correr"]
+        if proposto.proximo() is not None:
+            opcoes.append("aumentar")
+
+        def valida(resposta):
+            if resposta["resposta"] not in opcoes:
+                raise ValueError(f"Resposta deve ser uma de {opcoes}.")
+            return _RESPOSTAS_POR_NOME[resposta["resposta"]]
+
+        return await self._pergunta({"tipo": "responde_truco",
+                                     "jogador": proponente.nome,
+                                     "valor": str(proposto),
+                                     "opcoes": opcoes}, valida)
+
+
+class ServidorTruco:
+    """
+    Servidor asyncio que hospeda muitas partidas simultâneas.
+
+    Cada mesa é uma corrotina que conduz os passos de `Jogo.passos`: os
+    lugares remotos aguardam as jogadas dos clientes conectados e os lugares
+    de máquina respondem na hora. Um mesmo processo atende milhares de
+    mesas, cada uma com apenas o seu jogo, seus jogadores e uma
+    `InterfaceMesa`; o baralho é compartilhado.
+
+    O cliente se conecta e envia `{"tipo": "entrar", "nome": ...,
+    "adversario": "maquina" | "humano"}`. Contra a máquina, a partida começa
+    na hora; contra um humano, o cliente espera o próximo que pedir o mesmo.
+    Durante a partida o servidor envia as mensagens `inicio`, `mao`, `mesa`,
+    `resposta`, `jogada`, `placar` e `fim`, além das perguntas de
+    `AssentoRemoto`. Se um cliente desconectar ou não responder a tempo, a
+    mesa é encerrada e o adversário recebe `abandono`.
+
+    Atributos:
+        host (str): Endereço de escuta.
+        porta (int): Porta de escuta (a porta real, após `inicia`).
+        max_mesas (int): Número máximo de mesas simultâneas.
+        tempo_resposta (float): Segundos de espera por cada resposta.
+        mesas_ativas (int): Número de mesas em andamento.
+        partidas_concluidas (int): Número de partidas terminadas.
+        registro (GravadorPartidas): Gravador compartilhado pelas mesas, ou None.
+
+    Métodos:
+        inicia(): Abre o socket de escuta.
+        encerra(): Fecha o socket de escuta.
+        serve(): Atende conexões até ser cancelado.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", porta: int = 0,
+                 max_mesas: int = 10000, tempo_resposta: float = 60.,
+                 arquivo_csv: str = ARQUIVO_CARTAS, semente: int = None,
+                 registro=None):
+        """
+        Inicializa uma nova instância da classe ServidorTruco.
+
+        Args:
+            host (str, opcional): Endereço de escuta. Padrão é localhost.
+            porta (int, opcional): Porta de escuta; 0 escolhe uma porta livre.
+            max_mesas (int, opcional): Mesas simultâneas. Padrão é 10000.
+            tempo_resposta (float, opcional): Segundos de espera por cada
+                resposta de um cliente. Padrão é 60.
+            arquivo_csv (str, opcional): Caminho para o arquivo CSV das cartas.
+            semente (int, opcional): Semente do gerador das partidas.
+            registro (GravadorPartidas, opcional): Gravador que recebe as
+                mãos de todas as mesas. As mesas rodam em um único laço de
+                eventos, então o gravador não precisa de trava.
+        """
+        self.host = host
+        self.porta = porta
+        self.max_mesas = max_mesas
+        self.tempo_resposta = tempo_resposta
+        self.rng = np.random.default_rng(semente)
+        self.baralho = Baralho(arquivo_csv, rng=self.rng)
+        self.mesas_ativas = 0
+        self.partidas_concluidas = 0
+        self.registro = registro
+        self._vagas = None
+        self._espera = None
+        self._servidor = None
+
+    async def inicia(self):
+        """
+        Abre o socket de escuta.
+        """
+        self._vagas = asyncio.Semaphore(self.max_mesas)
+        self._servidor = await asyncio.start_server(
+            self._atende, self.host, self.porta, limit=LIMITE_LINHA)
+        self.porta = self._servidor.sockets[0].getsockname()[1]
+
+    async def encerra(self):
+        """
+        Fecha o socket de escuta.
+        """
+        self._servidor.close()
+        await self._servidor.wait_closed()
+
+    async def serve(self):
+        """
+        Atende conexões até ser cancelado.
+        """
+        if self._servidor is None:
+            await self.inicia()
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def _atende(self, leitor: asyncio.StreamReader,
+                      escritor: asyncio.StreamWriter):
+        """
+        Atende uma conexão: recebe o pedido de entrada e joga a partida.
+
+        Args:
+            leitor (asyncio.StreamReader): Entrada da conexão.
+            escritor (asyncio.StreamWriter): Saída da conexão.
+        """
+        try:
+            linha = await asyncio.wait_for(leitor.readline(),
+                                           self.tempo_resposta)
+            pedido = json.loads(linha)
+            if pedido.get("tipo") != "entrar":
+                raise ValueError("A primeira mensagem deve ser 'entrar'.")
+            assento = AssentoRemoto(Jogador(str(pedido.get("nome", "Jogador"))),
+                                    leitor, escritor, self.tempo_resposta)
+
+            # Descarta quem espera, mas já desconectou
+            espera = self._espera
+            if espera is not None and (espera[2].done()
+                                       or espera[0]._escritor.is_closing()):
+                espera = self._espera = None
+
+            if pedido.get("adversario", "maquina") == "maquina":
+                await self._joga(assento, None)
+            elif espera is None:
+                # Enquanto espera, vigia a conexão para perceber se o
+                # cliente desconectar (ou enviar algo fora de hora)
+                terminou = asyncio.get_running_loop().create_future()
+                vigia = asyncio.ensure_future(leitor.read(1))
+                self._espera = (assento, terminou, vigia)
+                await assento.informa({"tipo": "aguarde"})
+                await asyncio.wait((terminou, vigia),
+                                   return_when=asyncio.FIRST_COMPLETED)
+                if vigia.cancelled():
+                    # Pareado: a vigia foi cancelada por quem chegou
+                    await terminou
+                else:
+                    vigia.cancel()
+            else:
+                outro, terminou, vigia = espera
+                self._espera = None
+                # Só um leitor por vez: a vigia termina antes da partida
+                vigia.cancel()
+                await asyncio.wait((vigia,))
+                try:
+                    await self._joga(outro, assento)
+                finally:
+                    terminou.set_result(None)
+        except (ValueError, TypeError, AttributeError):
+            escritor.write(json.dumps({"tipo": "erro", "mensagem":
+                                       "Pedido de entrada inválido."}).encode()
+                           + b"\n")
+        except (ConnectionError, asyncio.TimeoutError,
+                asyncio.IncompleteReadError):
+            pass
+        finally:
+            if self._espera is not None and self._espera[0]._escritor is escritor:
+                self._espera = None
+            escritor.close()
+
+    async def _joga(self, assento_A: AssentoRemoto, assento_B: AssentoRemoto):
+        """
+        Ocupa uma vaga de mesa e joga uma partida, tratando abandonos.
+
+        Args:
+            assento_A (AssentoRemoto): Primeiro lugar.
+            assento_B (AssentoRemoto ou None): Segundo lugar; None para um
+                jogador máquina.
+        """
+        jogo = Jogo(InterfaceMesa(self.rng), self.rng, self.registro)
+        if assento_B is None:
+            assento_B = AssentoMaquina(Jogador("Máquina", TipoJogador.MAQUINA),
+                                       jogo.interface)
+        async with self._vagas:
+            self.mesas_ativas += 1
+            try:
+                await self._partida(assento_A, assento_B, jogo)
+                self.partidas_concluidas += 1
+            except (ConnectionError, asyncio.TimeoutError,
+                    asyncio.IncompleteReadError):
+                for assento in (assento_A, assento_B):
+                    try:
+                        await assento.informa({"tipo": "abandono"})
+                    except ConnectionError:
+                        pass
+            finally:
+                self.mesas_ativas -= 1
+
+    async def _partida(self, assento_A, assento_B, jogo: Jogo) -> Jogador:
+        """
+        Joga uma partida completa entre dois lugares.
+
+        Conduz o gerador de `Jogo.passos`, aguardando cada decisão do lugar
+        correspondente e enviando as mensagens guardadas pela interface da
+        mesa.
+
+        Args:
+            assento_A: Lugar do jogador A.
+            assento_B: Lugar do jogador B.
+            jogo (Jogo): Jogo da mesa, com uma `InterfaceMesa`.
+
+        Returns:
+            Jogador: O jogador que venceu a partida.
+        """
+        jogador_A, jogador_B = assento_A.jogador, assento_B.jogador
+        assentos = {Vencedor.A: assento_A, Vencedor.B: assento_B}
+        await assento_A.informa({"tipo": "inicio", "voce": "A",
+                                 "adversario": jogador_B.nome})
+        await assento_B.informa({"tipo": "inicio", "voce": "B",
+                                 "adversario": jogador_A.nome})
+
+        passos = jogo.passos(jogador_A, jogador_B, self.baralho)
+        decisao = next(passos)
+        while True:
+            await self._entrega(jogo.interface, assentos)
+            mesa = decisao.mao.carta_na_mesa
+            resposta = await assentos[decisao.jogador.id].decide(decisao)
+            try:
+                proxima = passos.send(resposta)
+            except StopIteration as fim:
+                proxima = None
+                vencedor = fim.value
+
+            # Anuncia as decisões que os dois lugares precisam conhecer
+            if decisao.tipo == TipoDecisao.RESPONDER_TRUCO:
+                await self._informa_todos(assentos, {
+                    "tipo": "resposta", "jogador": decisao.jogador.nome,
+                    "valor": str(decisao.valor.proximo()),
+                    "resposta": _NOMES_RESPOSTA[resposta]})
+            elif (decisao.tipo == TipoDecisao.CARTA and mesa is None
+                  and decisao.mao.carta_na_mesa is not None):
+                for iden, assento in assentos.items():
+                    if iden != decisao.jogador.id:
+                        await assento.informa({
+                            "tipo": "mesa",
+                            "carta": decisao.mao.carta_na_mesa.nome})
+
+            if proxima is None:
+                await self._entrega(jogo.interface, assentos)
+                return vencedor
+            decisao = proxima
+
+    async def _entrega(self, interface: InterfaceMesa, assentos: dict):
+        """
+        Envia aos lugares as mensagens guardadas pela interface da mesa.
+
+        Args:
+            interface (InterfaceMesa): Interface da mesa.
+            assentos (dict): Lugares da mesa, por Vencedor.
+        """
+        mensagens, interface.mensagens = interface.mensagens, []
+        for destino, mensagem in mensagens:
+            if destino is None:
+                await self._informa_todos(assentos, mensagem)
+            else:
+                await assentos[destino].informa(mensagem)
+
+    async def _informa_todos(self, assentos: dict, mensagem: dict):
+        """
+        Envia uma mensagem aos dois lugares da mesa.
+
+        Args:
+            assentos (dict): Lugares da mesa, por Vencedor.
+            mensagem (dict): A mensagem.
+        """
+        for assento in assentos.values():
+            await assento.informa(mensagem)
+
+
+async def cliente_robo(host: str, porta: int, nome: str = "Robô",
+                       adversario: str = "maquina",
+                       rng: np.random.Generator = None) -> dict:
+    """
+    Cliente que joga uma partida no servidor com decisões aleatórias.
+
+    Faz as mesmas escolhas que um jogador máquina de `Interface` e serve para
+    testar o servidor em localhost no lugar de um cliente humano.
+
+    Args:
+        host (str): Endereço do servidor.
+        porta (int): Porta do servidor.
+        nome (str, opcional): Nome do jogador.
+        adversario (str, opcional): "maquina" ou "humano".
+        rng (numpy.random.Generator, opcional): Gerador das decisões.
+
+    Returns:
+        dict: A última mensagem recebida (`fim`, `abandono` ou `erro`).
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    leitor, escritor = await asyncio.open_connection(host, porta,
+                                                     limit=LIMITE_LINHA)
+    escritor.write(json.dumps({"tipo": "entrar", "nome": nome,
+                               "adversario": adversario}).encode() + b"\n")
+    try:
+        while True:
+            linha = await leitor.readline()
+            if not linha:
+                return {"tipo": "abandono"}
+            mensagem = json.loads(linha)
+            tipo = mensagem["tipo"]
+            if tipo == "escolhe_carta":
+                resposta = {"carta": int(rng.integers(len(mensagem["cartas"])))}
+            elif tipo == "pergunta_truco":
+                resposta = {"pedir": bool(rng.random() < .5)}
+            elif tipo == "responde_truco":
+                opcoes = mensagem["opcoes"]
+                resposta = {"resposta": opcoes[rng.integers(len(opcoes))]}
+            elif tipo in ("fim", "abandono", "erro"):
+                return mensagem
+            else:
+                continue
+            escritor.write(json.dumps(resposta).encode() + b"\n")
+            await escritor.drain()
+    finally:
+        escritor.close()
+
+
+async def _demonstracao(num_robos: int):
+    """
+    Sobe um servidor em localhost e joga partidas simultâneas com robôs.
+
+    Args:
+        num_robos (int): Número de clientes robô contra a máquina.
+    """
+    servidor = ServidorTruco()
+    await servidor.inicia()
+    inicio = time.perf_counter()
+    resultados = await asyncio.gather(*[
+        cliente_robo(servidor.host, servidor.porta, f"Robô {i}")
+        for i in range(num_robos)
+    ])
+    duracao = time.perf_counter() - inicio
+    await servidor.encerra()
+    vitorias = sum(resultado.get("vencedor", "").startswith("Robô")
+                   for resultado in resultados)
+    print(f"{servidor.partidas_concluidas} partidas em {duracao:.2f} s; "
+          f"robôs venceram {vitorias}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--robos":
+        asyncio.run(_demonstracao(int(sys.argv[2])))
+    else:
+        porta = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+        print(f"Servidor de truco em 127.0.0.1:{porta}")
+        asyncio.run(ServidorTruco(porta=porta).serve())
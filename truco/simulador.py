@@ -0,0 +1,303 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+import numpy as np
+from .baralho import Baralho, ARQUIVO_CARTAS
+from .equipes import JogoEquipes
+from .interface import InterfaceSilenciosa
+from .jogada import Vencedor
+from .jogador import Jogador, TipoJogador
+from .jogo import Jogo
+from .ponto import TipoPontos
+from .registro import GravadorPartidas
+
+# Maior pontuação possível ao fim de um jogo (11 pontos mais uma queda)
+MAX_PONTOS = 2 * TipoPontos.Queda.value
+
+# Maior número possível de mãos em um jogo (cada mão vale ao menos 1 ponto)
+MAX_MAOS = MAX_PONTOS
+
+
+class ResultadoSimulacao:
+    """
+    Agrega os resultados de um conjunto de jogos simulados.
+
+    Atributos:
+        num_jogos (int): Número de jogos simulados.
+        vitorias (numpy.ndarray): Vitórias de cada posição (A, B); em jogos
+            entre equipes, de cada equipe.
+        pontos (numpy.ndarray): Distribuição da pontuação final de cada posição,
+            com formato (2, MAX_PONTOS), onde pontos[i, p] conta os jogos em que
+            a posição i terminou com p pontos.
+        maos (numpy.ndarray): Distribuição do número de mãos por jogo, onde
+            maos[n] conta os jogos que duraram n mãos.
+        oportunidades_truco (int): Vezes em que um jogador pôde pedir truco.
+        pedidos_truco (int): Vezes em que um jogador pediu truco.
+        respostas_truco (int): Número de respostas a pedidos de truco.
+        aceites (int): Respostas que aceitaram o pedido.
+        corridas (int): Respostas em que o jogador correu.
+        aumentos (int): Respostas que aumentaram a aposta.
+
+    Métodos:
+        combina(outro): Soma os resultados de outra simulação a este.
+        media_maos(): Retorna o número médio de mãos por jogo.
+        taxa_pedido(): Retorna a fração de oportunidades em que houve pedido de truco.
+        taxa_aceite(): Retorna a fração de respostas que aceitaram o truco.
+        taxa_corrida(): Retorna a fração de respostas em que o jogador correu.
+        taxa_aumento(): Retorna a fração de respostas que aumentaram a aposta.
+    """
+
+    def __init__(self):
+        """
+        Inicializa um resultado vazio.
+        """
+        self.num_jogos = 0
+        self.vitorias = np.zeros(2, dtype=np.int64)
+        self.pontos = np.zeros((2, MAX_PONTOS), dtype=np.int64)
+        self.maos = np.zeros(MAX_MAOS, dtype=np.int64)
+        self.oportunidades_truco = 0
+        self.pedidos_truco = 0
+        self.respostas_truco = 0
+        self.aceites = 0
+        self.corridas = 0
+        self.aumentos = 0
+
+    def combina(self, outro: "ResultadoSimulacao") -> "ResultadoSimulacao":
+        """
+        Soma os resultados de outra simulação a este.
+
+        Args:
+            outro (ResultadoSimulacao): Resultado a ser somado.
+
+        Returns:
+            ResultadoSimulacao: O próprio objeto, já atualizado.
+        """
+        self.num_jogos += outro.num_jogos
+        self.vitorias += outro.vitorias
+        self.pontos += outro.pontos
+        self.maos += outro.maos
+        self.oportunidades_truco += outro.oportunidades_truco
+        self.pedidos_truco += outro.pedidos_truco
+        self.respostas_truco += outro.respostas_truco
+        self.aceites += outro.aceites
+        self.corridas += outro.corridas
+        self.aumentos += outro.aumentos
+        return self
+
+    def media_maos(self) -> float:
+        """
+        Retorna o número médio de mãos por jogo.
+
+        Returns:
+            float: Média de mãos por jogo.
+        """
+        return float(np.arange(MAX_MAOS) @ self.maos) / max(self.num_jogos, 1)
+
+    def taxa_pedido(self) -> float:
+        """
+        Retorna a fração de oportunidades em que houve pedido de truco.
+
+        Returns:
+            float: Taxa de pedidos de truco.
+        """
+        return self.pedidos_truco / max(self.oportunidades_truco, 1)
+
+    def taxa_aceite(self) -> float:
+        """
+        Retorna a fração de respostas que aceitaram o truco.
+
+        Returns:
+            float: Taxa de aceite.
+        """
+        return self.aceites / max(self.respostas_truco, 1)
+
+    def taxa_corrida(self) -> float:
+        """
+        Retorna a fração de respostas em que o jogador correu.
+
+        Returns:
+            float: Taxa de corrida.
+        """
+        return self.corridas / max(self.respostas_truco, 1)
+
+    def taxa_aumento(self) -> float:
+        """
+        Retorna a fração de respostas que aumentaram a aposta.
+
+        Returns:
+            float: Taxa de aumento.
+        """
+        return self.aumentos / max(self.respostas_truco, 1)
+
+    def __str__(self) -> str:
+        """
+        Retorna um resumo legível dos resultados.
+
+        Returns:
+            str: Resumo da simulação.
+        """
+        return (f"{self.num_jogos} jogos | "
+                f"vitórias A: {self.vitorias[0]}, B: {self.vitorias[1]} | "
+                f"mãos por jogo: {self.media_maos():.2f} | "
+                f"truco: pedido {self.taxa_pedido():.3f}, "
+                f"aceite {self.taxa_aceite():.3f}, "
+                f"corrida {self.taxa_corrida():.3f}, "
+                f"aumento {self.taxa_aumento():.3f}")
+
+
+def _simula_lote(arquivo_csv: str, semente: np.random.SeedSequence,
+                 num_jogos: int, caminho_registro: str = None,
+                 num_lugares: int = 2) -> ResultadoSimulacao:
+    """
+    Joga uma sequência de jogos entre máquinas em um único processo.
+
+    Args:
+        arquivo_csv (str): Caminho para o arquivo CSV das cartas.
+        semente (numpy.random.SeedSequence): Semente do fluxo aleatório do lote.
+        num_jogos (int): Número de jogos a simular.
+        caminho_registro (str, opcional): Arquivo onde gravar o registro
+            binário das mãos do lote. Se não for fornecido, nada é gravado.
+        num_lugares (int, opcional): Lugares por mesa. Com mais de dois, os
+            jogos são entre equipes (`JogoEquipes`), sem registro.
+
+    Returns:
+        ResultadoSimulacao: Resultados agregados do lote.
+    """
+    rng = np.random.default_rng(semente)
+    baralho = Baralho(arquivo_csv, rng)
+    interface = InterfaceSilenciosa(rng)
+    registro = None
+    if caminho_registro is not None:
+        registro = GravadorPartidas(caminho_registro)
+    jogador_A = Jogador("A", TipoJogador.MAQUINA)
+    jogador_B = Jogador("B", TipoJogador.MAQUINA)
+    if num_lugares == 2:
+        jogo = Jogo(interface, rng, registro)
+    else:
+        jogo = JogoEquipes(interface, rng)
+        jogadores = [jogador_A, jogador_B] + [
+            Jogador("AB"[lugar % 2], TipoJogador.MAQUINA)
+            for lugar in range(2, num_lugares)]
+    resultado = ResultadoSimulacao()
+
+    for _ in range(num_jogos):
+        maos_antes = interface.maos
+        if num_lugares == 2:
+            vencedor = jogo.comecar(jogador_A, jogador_B, baralho)
+        else:
+            vencedor = jogo.comecar(jogadores, baralho)
+
+        if vencedor.id == Vencedor.A:
+            resultado.vitorias[0] += 1
+        else:
+            resultado.vitorias[1] += 1
+        resultado.pontos[0, jogador_A.pontos] += 1
+        resultado.pontos[1, jogador_B.pontos] += 1
+        resultado.maos[interface.maos - maos_antes] += 1
+
+    if registro is not None:
+        registro.fecha()
+    resultado.num_jogos = num_jogos
+    resultado.oportunidades_truco = interface.oportunidades_truco
+    resultado.pedidos_truco = interface.pedidos_truco
+    resultado.respostas_truco = interface.respostas_truco
+    resultado.aceites = interface.aceites
+    resultado.corridas = interface.corridas
+    resultado.aumentos = interface.aumentos
+    return resultado
+
+
+class Simulador:
+    """
+    Executa muitos jogos completos entre máquinas, sem entrada nem saída.
+
+    Os jogos são divididos em lotes de tamanho fixo, cada um com seu próprio
+    fluxo aleatório derivado da semente, e os lotes são distribuídos entre
+    processos. Com a mesma semente e o mesmo tamanho de lote, o resultado
+    não depende do número de processos.
+
+    Atributos:
+        arquivo_csv (str): Caminho para o arquivo CSV das cartas.
+        num_processos (int): Número de processos usados na simulação.
+        semente (int ou None): Semente da simulação.
+        tamanho_lote (int): Número de jogos por lote.
+        diretorio_registros (str ou None): Diretório onde cada lote grava o
+            registro binário de suas mãos.
+        num_lugares (int): Lugares por mesa: 2, ou 4 e 6 para jogos entre
+            equipes.
+
+    Métodos:
+        executa(num_jogos): Simula os jogos e retorna os resultados agregados.
+    """
+
+    def __init__(self, arquivo_csv: str = ARQUIVO_CARTAS,
+                 num_processos: int = None, semente: int = None,
+                 tamanho_lote: int = 1000, diretorio_registros: str = None,
+                 num_lugares: int = 2):
+        """
+        Inicializa uma nova instância da classe Simulador.
+
+        Args:
+            arquivo_csv (str, opcional): Caminho para o arquivo CSV das cartas.
+            num_processos (int, opcional): Número de processos. Padrão é o
+                número de CPUs da máquina.
+            semente (int, opcional): Semente da simulação. Se não for
+                fornecida, cada execução usa uma semente diferente.
+            tamanho_lote (int, opcional): Número de jogos por lote. Padrão é 1000.
+            diretorio_registros (str, opcional): Diretório onde gravar um
+                arquivo de registro por lote (ver `truco.registro`). Se não
+                for fornecido, as partidas não são registradas.
+            num_lugares (int, opcional): Lugares por mesa. Padrão é 2.
+
+        Raises:
+            ValueError: Se houver diretório de registros em jogos entre
+                equipes, que o registro binário não descreve.
+        """
+        if num_lugares != 2 and diretorio_registros is not None:
+            raise ValueError("O registro binário só descreve jogos entre "
+                             "dois jogadores.")
+        self.arquivo_csv = arquivo_csv
+        self.num_processos = num_processos or os.cpu_count() or 1
+        self.semente = semente
+        self.tamanho_lote = tamanho_lote
+        self.diretorio_registros = diretorio_registros
+        self.num_lugares = num_lugares
+
+    def executa(self, num_jogos: int) -> ResultadoSimulacao:
+        """
+        Simula os jogos e retorna os resultados agregados.
+
+        Args:
+            num_jogos (int): Número total de jogos a simular.
+
+        Returns:
+            ResultadoSimulacao: Resultados agregados de todos os jogos.
+        """
+        tamanhos = [self.tamanho_lote] * (num_jogos // self.tamanho_lote)
+        if num_jogos % self.tamanho_lote:
+            tamanhos.append(num_jogos % self.tamanho_lote)
+        sementes = np.random.SeedSequence(self.semente).spawn(len(tamanhos))
+        arquivos = [self.arquivo_csv] * len(tamanhos)
+        registros = [None] * len(tamanhos)
+        lugares = [self.num_lugares] * len(tamanhos)
+        if self.diretorio_registros is not None:
+            os.makedirs(self.diretorio_registros, exist_ok=True)
+            registros = [os.path.join(self.diretorio_registros,
+                                      f"lote_{i:05d}.trlog")
+                         for i in range(len(tamanhos))]
+
+        resultado = ResultadoSimulacao()
+        if self.num_processos == 1:
+            for parcial in map(_simula_lote, arquivos, sementes, tamanhos,
+                               registros, lugares):
+                resultado.combina(parcial)
+        else:
+            with ProcessPoolExecutor(self.num_processos) as executor:
+                for parcial in executor.map(_simula_lote, arquivos, sementes,
+                                            tamanhos, registros, lugares):
+                    resultado.combina(parcial)
+        return resultado
+
+
+if __name__ == "__main__":
+    simulador = Simulador(semente=0)
+    print(simulador.executa(10000))
@@ -0,0 +1,335 @@
+from math import comb
+import os
+import sys
+import numpy as np
+from .baralho import Baralho
+from .carta import Carta
+from .equidade import CalculadoraEquidade
+
+# Formato de cada linha da tabela de força, indexada pelo índice canônico
+DTYPE_FORCA = np.dtype([
+    ("valores", "i1", (3,)),
+    ("combinacoes", "<u4"),
+    ("vitoria", "<f8"),
+    ("empate", "<f8"),
+    ("derrota", "<f8"),
+    ("forca", "<f8"),
+    ("percentil", "<f8"),
+])
+
+
+def _posto_multiconjunto(postos: np.ndarray) -> np.ndarray:
+    """
+    Calcula a posição de multiconjuntos ordenados de três postos.
+
+    Cada trinca a <= b <= c é levada à trinca estritamente crescente
+    (a, b+1, c+2), cuja posição no sistema numérico combinatório é
+    C(a, 1) + C(b+1, 2) + C(c+2, 3). A função é uma bijeção entre os
+    multiconjuntos de postos 0..R-1 e os inteiros 0..C(R+2, 3)-1.
+
+    Args:
+        postos (numpy.ndarray): Postos ordenados, com formato (..., 3).
+
+    Returns:
+        numpy.ndarray: Posição de cada multiconjunto.
+    """
+    a, b, c = postos[..., 0], postos[..., 1], postos[..., 2]
+    return a + (b + 1) * b // 2 + (c + 2) * (c + 1) * c // 6
+
+
+class IndiceMaos:
+    """
+    Associa cada mão de três cartas a um índice canônico denso.
+
+    Em `Jogada.quem_ganhou` só o valor das cartas importa, então mãos com os
+    mesmos valores são equivalentes. A forma canônica de uma mão é a trinca
+    ordenada dos postos dos seus valores; essa trinca é numerada pelo sistema
+    combinatório (um hash perfeito) e, como nem toda trinca existe no baralho,
+    uma tabela converte essa numeração em índices consecutivos.
+
+    O índice usa os valores das cartas lidos do arquivo, isto é, vale só
+    para manilhas fixas. Com manilha variável, os valores e a quantidade de
+    cartas de cada valor mudam com a vira, e uma mão que não exista no
+    baralho de manilhas fixas é recusada por `indice`.
+
+    Atributos:
+        baralho (Baralho): Baralho cujas mãos são indexadas.
+        valores_distintos (numpy.ndarray): Valores distintos das cartas, em
+            ordem crescente.
+        postos (numpy.ndarray): Posto do valor de cada carta, por identificador.
+        maos (numpy.ndarray): Valores das cartas de cada mão canônica.
+        combinacoes (numpy.ndarray): Número de mãos reais de cada mão canônica.
+        num_maos (int): Número de mãos canônicas.
+
+    Métodos:
+        canonica(cartas): Retorna a trinca ordenada de valores de uma mão.
+        indice(cartas): Retorna o índice canônico de uma mão.
+        indices(ids): Retorna os índices canônicos de várias mãos.
+    """
+
+    def __init__(self, baralho: Baralho = None):
+        """
+        Inicializa uma nova instância da classe IndiceMaos.
+
+        Args:
+            baralho (Baralho, opcional): Baralho cujas mãos serão indexadas.
+                Padrão é o baralho distribuído com o pacote.
+        """
+        self.baralho = baralho if baralho is not None else Baralho()
+        valores = np.array([carta.valor for carta
+                            in self.baralho.cartas_da_vira()], dtype=np.int8)
+        self.valores_distintos = np.unique(valores)
+        self.postos = np.searchsorted(self.valores_distintos, valores)
+        num_postos = len(self.valores_distintos)
+        disponiveis = np.bincount(self.postos, minlength=num_postos)
+
+        self._denso = np.full(comb(num_postos + 2, 3), -1, dtype=np.int32)
+        maos = []
+        combinacoes = []
+        for c in range(num_postos):
+            for b in range(c + 1):
+                for a in range(b + 1):
+                    repeticoes = np.bincount([a, b, c], minlength=num_postos)
+                    if (repeticoes > disponiveis).any():
+                        continue
+                    posto = int(_posto_multiconjunto(np.array([a, b, c])))
+                    self._denso[posto] = len(maos)
+                    maos.append(self.valores_distintos[[a, b, c]])
+                    combinacoes.append(np.prod([
+                        comb(int(n), int(k))
+                        for n, k in zip(disponiveis, repeticoes) if k
+                    ]))
+
+        self.maos = np.array(maos, dtype=np.int8)
+        self.combinacoes = np.array(combinacoes, dtype=np.uint32)
+        self.num_maos = len(maos)
+        self._posto_por_valor = {valor: posto for posto, valor
+                                 in enumerate(self.valores_distintos.tolist())}
+
+    def canonica(self, cartas: list[Carta]) -> tuple:
+        """
+        Retorna a forma canônica de uma mão.
+
+        Args:
+            cartas (list[Carta]): As três cartas da mão.
+
+        Returns:
+            tuple: Os valores das cartas em ordem crescente.
+        """
+        return tuple(sorted(carta.valor for carta in cartas))
+
+    def indice(self, cartas: list[Carta]) -> int:
+        """
+        Retorna o índice canônico de uma mão.
+
+        Args:
+            cartas (list[Carta]): As três cartas da mão.
+
+        Returns:
+            int: Índice da mão, entre 0 e num_maos - 1.
+
+        Raises:
+            ValueError: Se a mão não existir no baralho de manilhas fixas.
+        """
+        postos = [self._posto_por_valor.get(carta.valor) for carta in cartas]
+        indice = -1
+        if None not in postos:
+            a, b, c = sorted(postos)
+            indice = int(self._denso[a + (b + 1) * b // 2
+                                     + (c + 2) * (c + 1) * c // 6])
+        if indice < 0:
+            raise ValueError(f"A mão {list(cartas)} não existe no baralho de "
+                             f"manilhas fixas.")
+        return indice
+
+    def indices(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Retorna os índices canônicos de várias mãos de uma só vez.
+
+        Args:
+            ids (numpy.ndarray): Identificadores das cartas, com formato (..., 3).
+
+        Returns:
+            numpy.ndarray: Índice canônico de cada mão.
+        """
+        postos = np.sort(self.postos[ids], axis=-1)
+        return self._denso[_posto_multiconjunto(postos)]
+
+
+class TabelaForca:
+    """
+    Tabela da força de cada mão canônica, guardada em arquivo e mapeada em memória.
+
+    A tabela é construída uma única vez, em um passo explícito (por
+    `constroi` ou executando `python -m truco.tabelas`), e gravada em um
+    arquivo `.npy`; consultar uma tabela que não foi construída é um erro.
+    Ao ser consultada pela primeira vez, ela é mapeada em memória somente para
+    leitura, de modo que vários processos compartilham a mesma cópia
+    através do cache de páginas do sistema operacional. Ao ser serializada
+    para outro processo, só o caminho do arquivo é enviado.
+
+    A força de uma mão é a probabilidade de vitória mais metade da de empate,
+    calculada por `CalculadoraEquidade`, e o percentil é a fração das
+    mãos reais do baralho mais fracas que ela (contando metade das de mesma
+    força). Como `IndiceMaos`, a tabela vale só para manilhas fixas: com
+    manilha variável a força de uma mão depende da vira.
+
+    Atributos:
+        indice (IndiceMaos): Índice canônico das mãos.
+        caminho (str): Caminho do arquivo da tabela.
+
+    Métodos:
+        dados: Retorna a tabela, mapeando-a na primeira consulta.
+        forca(cartas): Retorna a força de uma mão.
+        percentil(cartas): Retorna o percentil da força de uma mão.
+        constroi(): Calcula a tabela e a grava no arquivo.
+    """
+
+    def __init__(self, baralho: Baralho = None, caminho: str = None):
+        """
+        Inicializa uma nova instância da classe TabelaForca.
+
+        Args:
+            baralho (Baralho, opcional): Baralho das mãos. Padrão é o baralho
+                distribuído com o pacote.
+            caminho (str, opcional): Caminho do arquivo da tabela. Padrão é o
+                arquivo CSV do baralho com o sufixo `_forca.npy`.
+        """
+        self.indice = IndiceMaos(baralho)
+        if caminho is None:
+            raiz, _ = os.path.splitext(self.indice.baralho.arquivo_csv)
+            caminho = raiz + "_forca.npy"
+        self.caminho = caminho
+        self._dados = None
+
+    def __getstate__(self) -> dict:
+        """
+        Retorna o estado para serialização, sem o mapeamento em memória.
+
+        Returns:
+            dict: Atributos do objeto, com a tabela descarregada.
+        """
+        estado = self.__dict__.copy()
+        estado["_dados"] = None
+        return estado
+
+    @property
+    def dados(self) -> np.ndarray:
+        """
+        Retorna a tabela, mapeando o arquivo em memória na primeira consulta.
+
+        Returns:
+            numpy.ndarray: Array estruturado com formato DTYPE_FORCA.
+
+        Raises:
+            FileNotFoundError: Se a tabela ainda não foi construída.
+            ValueError: Se o arquivo não corresponder ao baralho.
+        """
+        if self._dados is None:
+            construa = (f"construa-a com `python -m truco.tabelas "
+                        f"{self.caminho}` ou TabelaForca.constroi().")
+            if not os.path.exists(self.caminho):
+                raise FileNotFoundError(
+                    f"Tabela de força não encontrada em {self.caminho}; "
+                    + construa)
+            dados = np.load(self.caminho, mmap_mode="r")
+            if not self._corresponde(dados):
+                raise ValueError(
+                    f"A tabela de força em {self.caminho} não corresponde "
+                    f"ao baralho; " + construa)
+            self._dados = dados
+        return self._dados
+
+    def forca(self, cartas: list[Carta]) -> float:
+        """
+        Retorna a força de uma mão.
+
+        Args:
+            cartas (list[Carta]): As três cartas da mão.
+
+        Returns:
+            float: Probabilidade de vitória mais metade da de empate.
+        """
+        return float(self.dados["forca"][self.indice.indice(cartas)])
+
+    def percentil(self, cartas: list[Carta]) -> float:
+        """
+        Retorna o percentil da força de uma mão entre todas as mãos possíveis.
+
+        Args:
+            cartas (list[Carta]): As três cartas da mão.
+
+        Returns:
+            float: Percentil da mão, entre 0 e 1.
+        """
+        return float(self.dados["percentil"][self.indice.indice(cartas)])
+
+    def constroi(self) -> np.ndarray:
+        """
+        Calcula a tabela de força e a grava no arquivo.
+
+        O arquivo é escrito com outro nome e depois renomeado, de modo que
+        processos lendo a tabela nunca vejam um arquivo incompleto.
+
+        Returns:
+            numpy.ndarray: A tabela calculada.
+        """
+        indice = self.indice
+        calculadora = CalculadoraEquidade(indice.baralho)
+        cartas_por_valor = {}
+        for carta in indice.baralho.cartas_da_vira():
+            cartas_por_valor.setdefault(carta.valor, []).append(carta)
+
+        tabela = np.zeros(indice.num_maos, dtype=DTYPE_FORCA)
+        tabela["valores"] = indice.maos
+        tabela["combinacoes"] = indice.combinacoes
+        for i, valores in enumerate(indice.maos.tolist()):
+            usadas = {}
+            cartas = []
+            for valor in valores:
+                cartas.append(cartas_por_valor[valor][usadas.get(valor, 0)])
+                usadas[valor] = usadas.get(valor, 0) + 1
+            vitoria, empate, derrota = calculadora.calcula(cartas)
+            tabela["vitoria"][i] = vitoria
+            tabela["empate"][i] = empate
+            tabela["derrota"][i] = derrota
+        tabela["forca"] = tabela["vitoria"] + tabela["empate"] / 2
+
+        # Percentil ponderado pelo número de mãos reais de cada mão canônica
+        pesos = tabela["combinacoes"].astype(np.float64)
+        ordem = np.argsort(tabela["forca"], kind="stable")
+        forcas = tabela["forca"][ordem]
+        acumulado = np.concatenate(([0.], np.cumsum(pesos[ordem])))
+        inicio = np.searchsorted(forcas, forcas, side="left")
+        fim = np.searchsorted(forcas, forcas, side="right")
+        tabela["percentil"][ordem] = ((acumulado[inicio] + acumulado[fim]) / 2
+                                      / acumulado[-1])
+
+        temporario = f"{self.caminho}.{os.getpid()}.tmp"
+        with open(temporario, "wb") as arquivo:
+            np.save(arquivo, tabela)
+        os.replace(temporario, self.caminho)
+        self._dados = None
+        return tabela
+
+    def _corresponde(self, dados: np.ndarray) -> bool:
+        """
+        Verifica se uma tabela gravada corresponde ao baralho atual.
+
+        Args:
+            dados (numpy.ndarray): Tabela lida do arquivo.
+
+        Returns:
+            bool: True se as mãos e suas quantidades coincidirem.
+        """
+        return (dados.dtype == DTYPE_FORCA
+                and dados.shape == (self.indice.num_maos,)
+                and np.array_equal(dados["valores"], self.indice.maos)
+                and np.array_equal(dados["combinacoes"],
+                                   self.indice.combinacoes))
+
+
+if __name__ == "__main__":
+    tabela = TabelaForca(caminho=sys.argv[1] if len(sys.argv) > 1 else None)
+    dados = tabela.constroi()
+    print(f"{len(dados)} mãos canônicas gravadas em {tabela.caminho}")
@@ -0,0 +1,521 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import enum
+import math
+import os
+import numpy as np
+from .aleatorio import FonteAleatoria
+from .baralho import Baralho, ARQUIVO_CARTAS
+from .interface import InterfaceSilenciosa
+from .jogada import Vencedor
+from .jogador import Jogador, TipoJogador
+from .jogo import Jogo
+
+# Configurações de cada ciclo de quatro jogos: (X senta em A, X abre o jogo).
+# Alternar lugar e abertura anula as vantagens de posição (o empate dá os
+# pontos a B) e de quem abre.
+_CICLO = ((True, True), (False, True), (True, False), (False, False))
+
+# Ciclo do modo duplicado: cada par de jogos usa as mesmas cartas, com os
+# lugares trocados e o mesmo lugar abrindo, e os pares alternam quem abre.
+_CICLO_DUPLICATA = ((True, True), (False, False), (True, False), (False, True))
+
+# Converte diferença de log-força (base e) em Elo
+_ELO_POR_LOG = 400 / math.log(10)
+
+
+class Participante:
+    """
+    Um competidor registrado no torneio.
+
+    Atributos:
+        nome (str): Nome do participante.
+        tipo (TipoJogador): Tipo do jogador.
+        fabrica (callable): Cria a estratégia do jogador a partir de um
+            gerador (`fabrica(rng=...)`), ou None para tipos sem estratégia.
+            Deve poder ser serializada com pickle, como uma classe ou um
+            `functools.partial`, para ser enviada aos processos.
+
+    Métodos:
+        cria_jogador(rng): Cria um Jogador para uma sequência de jogos.
+    """
+
+    def __init__(self, nome: str, tipo: TipoJogador = TipoJogador.MAQUINA,
+                 fabrica=None):
+        """
+        Inicializa uma nova instância da classe Participante.
+
+        Args:
+            nome (str): Nome do participante.
+            tipo (TipoJogador, opcional): Tipo do jogador. Padrão é MAQUINA.
+            fabrica (callable, opcional): Cria a estratégia do jogador.
+        """
+        self.nome = nome
+        self.tipo = tipo
+        self.fabrica = fabrica
+
+    def cria_jogador(self, rng: np.random.Generator) -> Jogador:
+        """
+        Cria um Jogador para uma sequência de jogos.
+
+        Args:
+            rng (numpy.random.Generator): Gerador passado à estratégia.
+
+        Returns:
+            Jogador: O jogador, com uma estratégia nova se houver fábrica.
+        """
+        estrategia = self.fabrica(rng=rng) if self.fabrica is not None else None
+        return Jogador(self.nome, self.tipo, estrategia)
+
+
+def _joga_bloco(participante_X: Participante, participante_Y: Participante,
+                fonte: FonteAleatoria, inicio: int, num_jogos: int,
+                arquivo_csv: str, duplicata: bool = False) -> int:
+    """
+    Joga uma sequência de jogos entre dois participantes em um processo.
+
+    O lugar (A ou B) e quem abre o jogo seguem `_CICLO`, a partir da posição
+    `inicio` da sequência de jogos do confronto. No modo duplicado, seguem
+    `_CICLO_DUPLICATA`, e os dois jogos de cada par recebem as mesmas cartas,
+    mão a mão, e os mesmos sorteios da interface: o baralho e a interface de
+    cada par são recriados a partir dos mesmos fluxos da fonte.
+
+    Args:
+        participante_X (Participante): Primeiro participante.
+        participante_Y (Participante): Segundo participante.
+        fonte (FonteAleatoria): Fonte aleatória do bloco.
+        inicio (int): Número do primeiro jogo do bloco no confronto; par no
+            modo duplicado.
+        num_jogos (int): Número de jogos do bloco; par no modo duplicado.
+        arquivo_csv (str): Caminho para o arquivo CSV das cartas.
+        duplicata (bool, opcional): Joga no modo duplicado. Padrão é False.
+
+    Returns:
+        int: Número de vitórias de X.
+    """
+    rng = fonte.fluxo(0)
+    baralho = Baralho(arquivo_csv, rng)
+    jogo = Jogo(InterfaceSilenciosa(rng), rng)
+    jogador_X = participante_X.cria_jogador(fonte.fluxo(1))
+    jogador_Y = participante_Y.cria_jogador(fonte.fluxo(2))
+    ciclo = _CICLO_DUPLICATA if duplicata else _CICLO
+
+    vitorias = 0
+    for jogo_atual in range(inicio, inicio + num_jogos):
+        x_em_A, x_abre = ciclo[jogo_atual % len(ciclo)]
+        jogador_A, jogador_B = ((jogador_X, jogador_Y) if x_em_A
+                                else (jogador_Y, jogador_X))
+        quem_abre = Vencedor.A if x_em_A == x_abre else Vencedor.B
+        if duplicata:
+            par = jogo_atual // 2
+            baralho = Baralho(arquivo_csv, fonte.fluxo(3, par))
+            rng = fonte.fluxo(4, par)
+            jogo = Jogo(InterfaceSilenciosa(rng), rng)
+        vencedor = jogo.comecar(jogador_A, jogador_B, baralho, quem_abre)
+        vitorias += vencedor is jogador_X
+    return vitorias
+
+
+class ResultadoConfronto(enum.IntEnum):
+    """
+    Enumera as decisões de um confronto (i, j) do torneio.
+
+    Valores:
+        INCONCLUSIVO (0): Os testes ainda não decidiram.
+        I_MAIS_FORTE (1): i é mais forte que j.
+        J_MAIS_FORTE (-1): j é mais forte que i.
+        EQUIVALENTES (2): Nenhum dos dois é mais forte pela margem do teste.
+    """
+    INCONCLUSIVO = 0
+    I_MAIS_FORTE = 1
+    J_MAIS_FORTE = -1
+    EQUIVALENTES = 2
+
+
+class SPRT:
+    """
+    Teste sequencial da razão de probabilidades entre duas diferenças de Elo.
+
+    Como um jogo de truco sempre tem vencedor, cada jogo é um ensaio de
+    Bernoulli. O teste decide entre H0 (X está `elo0` pontos acima de Y) e
+    H1 (X está `elo1` pontos acima de Y) assim que a razão de log-verossimilhança
+    sai do intervalo definido pelos erros `alfa` e `beta`. O teste é
+    unilateral: aceitar H0 quer dizer que X não é `elo1` pontos mais forte,
+    não que Y seja mais forte. Para comparar dois jogadores sem saber qual
+    é o melhor, `Torneio` aplica o teste nos dois sentidos.
+
+    Atributos:
+        elo0 (float): Diferença de Elo sob H0.
+        elo1 (float): Diferença de Elo sob H1.
+        limite_inferior (float): Aceita H0 abaixo deste valor.
+        limite_superior (float): Aceita H1 acima deste valor.
+
+    Métodos:
+        llr(vitorias, derrotas): Razão de log-verossimilhança de H1 contra H0.
+        decide(vitorias, derrotas): Retorna 1 (H1), -1 (H0) ou 0 (indefinido).
+    """
+
+    def __init__(self, elo0: float = 0., elo1: float = 30.,
+                 alfa: float = 0.05, beta: float = 0.05):
+        """
+        Inicializa uma nova instância da classe SPRT.
+
+        Args:
+            elo0 (float, opcional): Diferença de Elo sob H0. Padrão é 0.
+            elo1 (float, opcional): Diferença de Elo sob H1. Padrão é 30.
+            alfa (float, opcional): Probabilidade de aceitar H1 sob H0.
+            beta (float, opcional): Probabilidade de aceitar H0 sob H1.
+        """
+        self.elo0 = elo0
+        self.elo1 = elo1
+        p0 = 1 / (1 + 10 ** (-elo0 / 400))
+        p1 = 1 / (1 + 10 ** (-elo1 / 400))
+        self._ganho_vitoria = math.log(p1 / p0)
+        self._ganho_derrota = math.log((1 - p1) / (1 - p0))
+        self.limite_inferior = math.log(beta / (1 - alfa))
+        self.limite_superior = math.log((1 - beta) / alfa)
+
+    def llr(self, vitorias: int, derrotas: int) -> float:
+        """
+        Retorna a razão de log-verossimilhança de H1 contra H0.
+
+        Args:
+            vitorias (int): Vitórias de X.
+            derrotas (int): Derrotas de X.
+
+        Returns:
+            float: A razão de log-verossimilhança.
+        """
+        return vitorias * self._ganho_vitoria + derrotas * self._ganho_derrota
+
+    def decide(self, vitorias: int, derrotas: int) -> int:
+        """
+        Verifica se o teste já é conclusivo.
+
+        Args:
+            vitorias (int): Vitórias de X.
+            derrotas (int): Derrotas de X.
+
+        Returns:
+            int: 1 se H1 foi aceita (X é `elo1` pontos mais forte), -1 se H0
+                foi aceita (X não é `elo1` pontos mais forte), 0 se ainda não
+                há decisão.
+        """
+        llr = self.llr(vitorias, derrotas)
+        if llr >= self.limite_superior:
+            return 1
+        if llr <= self.limite_inferior:
+            return -1
+        return 0
+
+
+class Torneio:
+    """
+    Torneio entre participantes, com rating Elo e parada antecipada.
+
+    Os confrontos são organizados em todos contra todos ou no sistema suíço.
+    Cada confronto é jogado em blocos de jogos distribuídos por um conjunto
+    de processos e termina quando o `SPRT` é conclusivo ou quando atinge
+    `max_jogos`. O teste é aplicado nos dois sentidos, "i é mais forte que
+    j" e "j é mais forte que i": o confronto é decidido quando um deles
+    aceita H1 ou quando os dois aceitam H0, e então os jogadores são
+    equivalentes. Com jogadores iguais, a chance de um deles ser apontado
+    como mais forte é de até duas vezes `alfa`. O lugar à mesa e quem abre o jogo alternam a cada jogo.
+    No modo duplicado, os jogos vêm em pares com as mesmas cartas e os
+    lugares trocados, o que anula boa parte da sorte na distribuição e
+    separa dois jogadores com menos jogos (o SPRT continua válido, pois a
+    variância dos pares é menor que a de jogos independentes). Ao
+    final, os ratings Elo são estimados pelo modelo de Bradley-Terry com
+    todos os resultados, com intervalos de confiança de 95%.
+
+    Atributos:
+        participantes (list[Participante]): Participantes registrados.
+        vitorias (numpy.ndarray): vitorias[i, j] conta as vitórias de i sobre j.
+        decisoes (dict): Decisão de cada confronto (i, j), com i < j, como
+            `ResultadoConfronto`.
+        sprt (SPRT): Teste usado na parada antecipada.
+        max_jogos (int): Máximo de jogos por confronto.
+        tamanho_bloco (int): Jogos por bloco enviado a um processo.
+        num_processos (int): Número de processos.
+        fonte (FonteAleatoria): Fonte dos fluxos aleatórios de cada bloco.
+        duplicata (bool): Se os jogos são duplicados.
+
+    Métodos:
+        registra(nome, tipo, fabrica): Registra um participante.
+        executa(formato, rodadas): Joga o torneio.
+        ratings(): Estima o Elo de cada participante.
+        classificacao(): Retorna a tabela de classificação.
+    """
+
+    def __init__(self, num_processos: int = None, semente: int = None,
+                 sprt: SPRT = None, max_jogos: int = 2000,
+                 tamanho_bloco: int = 40, arquivo_csv: str = ARQUIVO_CARTAS,
+                 duplicata: bool = False):
+        """
+        Inicializa uma nova instância da classe Torneio.
+
+        Args:
+            num_processos (int, opcional): Número de processos. Padrão é o
+                número de CPUs da máquina.
+            semente (int ou FonteAleatoria, opcional): Semente do torneio.
+                Sem semente, a entropia é sorteada e fica em `fonte`.
+            sprt (SPRT, opcional): Teste de parada, aplicado nos dois
+                sentidos. Padrão é SPRT() (0 contra 30 Elo, erros de 5%).
+            max_jogos (int, opcional): Máximo de jogos por confronto.
+            tamanho_bloco (int, opcional): Jogos por bloco; múltiplo de 4,
+                para que cada bloco complete ciclos de lugar e abertura.
+            arquivo_csv (str, opcional): Caminho para o arquivo CSV das cartas.
+            duplicata (bool, opcional): Joga em pares duplicados. Padrão é
+                False.
+
+        Raises:
+            ValueError: Se, no modo duplicado, `max_jogos` ou `tamanho_bloco`
+                não forem pares.
+        """
+        if duplicata and (max_jogos % 2 or tamanho_bloco % 2):
+            raise ValueError("No modo duplicado, max_jogos e tamanho_bloco "
+                             "devem ser pares.")
+        self.participantes = []
+        self.vitorias = np.zeros((0, 0), dtype=np.int64)
+        self.decisoes = {}
+        self._testes = {}
+        self.sprt = sprt if sprt is not None else SPRT()
+        self.max_jogos = max_jogos
+        self.tamanho_bloco = tamanho_bloco
+        self.num_processos = num_processos or os.cpu_count() or 1
+        self.fonte = (semente if isinstance(semente, FonteAleatoria)
+                      else FonteAleatoria(semente))
+        self.arquivo_csv = arquivo_csv
+        self.duplicata = duplicata
+
+    def registra(self, nome: str, tipo: TipoJogador = TipoJogador.MAQUINA,
+                 fabrica=None) -> Participante:
+        """
+        Registra um participante.
+
+        Args:
+            nome (str): Nome único do participante.
+            tipo (TipoJogador, opcional): Tipo do jogador. Padrão é MAQUINA.
+            fabrica (callable, opcional): Cria a estratégia do jogador; veja
+                `Participante`.
+
+        Returns:
+            Participante: O participante registrado.
+
+        Raises:
+            ValueError: Se já houver um participante com o mesmo nome.
+        """
+        if any(participante.nome == nome for participante in self.participantes):
+            raise ValueError(f"Já existe um participante chamado {nome}.")
+        participante = Participante(nome, tipo, fabrica)
+        self.participantes.append(participante)
+        vitorias = np.zeros((len(self.participantes),) * 2, dtype=np.int64)
+        vitorias[:-1, :-1] = self.vitorias
+        self.vitorias = vitorias
+        return participante
+
+    def executa(self, formato: str = "todos", rodadas: int = None) -> "Torneio":
+        """
+        Joga o torneio.
+
+        Args:
+            formato (str, opcional): "todos" (todos contra todos) ou "suico"
+                (a cada rodada, participantes de rating próximo se enfrentam,
+                sem repetir confrontos).
+            rodadas (int, opcional): Rodadas do sistema suíço. Padrão é
+                ceil(log2(número de participantes)).
+
+        Returns:
+            Torneio: O próprio torneio, com os resultados.
+
+        Raises:
+            ValueError: Se o formato for desconhecido ou houver menos de dois
+                participantes.
+        """
+        num = len(self.participantes)
+        if num < 2:
+            raise ValueError("O torneio precisa de ao menos dois participantes.")
+        with ProcessPoolExecutor(self.num_processos) as executor:
+            if formato == "todos":
+                self._joga_confrontos(executor, [(i, j) for i in range(num)
+                                                 for j in range(i + 1, num)])
+            elif formato == "suico":
+                rodadas = rodadas or max(1, math.ceil(math.log2(num)))
+                for _ in range(rodadas):
+                    confrontos = self._emparelha_suico()
+                    if not confrontos:
+                        break
+                    self._joga_confrontos(executor, confrontos)
+            else:
+                raise ValueError(f"Formato de torneio desconhecido: {formato}.")
+        return self
+
+    def _emparelha_suico(self) -> list:
+        """
+        Emparelha os participantes de rating próximo que ainda não se enfrentaram.
+
+        Returns:
+            list[tuple[int, int]]: Os confrontos (i, j) da rodada, com i < j.
+        """
+        elos = self.ratings()[0]
+        livres = sorted(range(len(self.participantes)), key=lambda i: -elos[i])
+        confrontos = []
+        while livres:
+            i = livres.pop(0)
+            for posicao, j in enumerate(livres):
+                if (min(i, j), max(i, j)) not in self.decisoes:
+                    confrontos.append((min(i, j), max(i, j)))
+                    livres.pop(posicao)
+                    break
+        return confrontos
+
+    def _joga_confrontos(self, executor: ProcessPoolExecutor, confrontos: list):
+        """
+        Joga os confrontos em blocos até que cada um seja decidido.
+
+        Mantém no máximo dois blocos por processo em andamento. Um confronto
+        deixa de receber blocos quando o SPRT é conclusivo ou ao atingir
+        `max_jogos`; blocos já enviados são contabilizados mesmo assim, de
+        modo que o número de jogos de um confronto decidido pode variar com a
+        ordem em que os blocos terminam.
+
+        Args:
+            executor (ProcessPoolExecutor): Processos que jogam os blocos.
+            confrontos (list[tuple[int, int]]): Os confrontos (i, j), com i < j.
+        """
+        enviados = {confronto: 0 for confronto in confrontos}
+        ativos = list(confrontos)
+        pendentes = {}
+        while ativos or pendentes:
+            while ativos and len(pendentes) < 2 * self.num_processos:
+                # Distribui os blocos entre os confrontos ativos, em rodízio
+                i, j = confronto = ativos.pop(0)
+                num_jogos = min(self.tamanho_bloco,
+                                self.max_jogos - enviados[confronto])
+                fonte = self.fonte.subfonte(i, j, enviados[confronto])
+                futuro = executor.submit(
+                    _joga_bloco, self.participantes[i], self.participantes[j],
+                    fonte, enviados[confronto], num_jogos, self.arquivo_csv,
+                    self.duplicata)
+                pendentes[futuro] = (confronto, num_jogos)
+                enviados[confronto] += num_jogos
+                if enviados[confronto] < self.max_jogos:
+                    ativos.append(confronto)
+
+            prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                (i, j), num_jogos = pendentes.pop(futuro)
+                vitorias = futuro.result()
+                self.vitorias[i, j] += vitorias
+                self.vitorias[j, i] += num_jogos - vitorias
+                decisao = self.decisoes[(i, j)] = self._decide(i, j)
+                if decisao and (i, j) in ativos:
+                    ativos.remove((i, j))
+
+    def _decide(self, i: int, j: int) -> ResultadoConfronto:
+        """
+        Atualiza os testes nos dois sentidos de um confronto e o decide.
+
+        Cada teste para na primeira decisão, que não muda com os blocos
+        que ainda chegarem.
+
+        Args:
+            i (int): Participante de menor índice.
+            j (int): Participante de maior índice.
+
+        Returns:
+            ResultadoConfronto: A decisão do confronto.
+        """
+        testes = self._testes.setdefault((i, j), [0, 0])
+        if not testes[0]:
+            testes[0] = self.sprt.decide(self.vitorias[i, j],
+                                         self.vitorias[j, i])
+        if not testes[1]:
+            testes[1] = self.sprt.decide(self.vitorias[j, i],
+                                         self.vitorias[i, j])
+        if testes[0] == 1:
+            return ResultadoConfronto.I_MAIS_FORTE
+        if testes[1] == 1:
+            return ResultadoConfronto.J_MAIS_FORTE
+        if testes == [-1, -1]:
+            return ResultadoConfronto.EQUIVALENTES
+        return ResultadoConfronto.INCONCLUSIVO
+
+    def ratings(self, iteracoes: int = 200) -> tuple:
+        """
+        Estima o Elo de cada participante pelo modelo de Bradley-Terry.
+
+        Cada confronto recebe meio jogo fictício de vitória e meio de derrota,
+        o que mantém a estimativa finita quando um lado vence todos os jogos.
+        A média dos ratings é zero.
+
+        Args:
+            iteracoes (int, opcional): Iterações do algoritmo MM. Padrão é 200.
+
+        Returns:
+            tuple: (elos, margens), dois numpy.ndarray com o Elo de cada
+                participante e a meia largura do intervalo de 95%.
+        """
+        jogos = self.vitorias + self.vitorias.T
+        jogaram = jogos > 0
+        vitorias = self.vitorias + 0.5 * jogaram
+        jogos = jogos + 1.0 * jogaram
+        forca = np.ones(len(self.participantes))
+        for _ in range(iteracoes):
+            denominador = (jogos / (forca[:, None] + forca[None, :])).sum(axis=1)
+            forca = np.where(denominador > 0,
+                             vitorias.sum(axis=1) / np.maximum(denominador,
+                                                               1e-300),
+                             forca)
+            forca /= np.exp(np.log(forca).mean())
+        log_forca = np.log(forca)
+
+        # Variância de cada log-força pela informação de Fisher
+        p = forca[:, None] / (forca[:, None] + forca[None, :])
+        informacao = (jogos * p * (1 - p)).sum(axis=1)
+        margens = np.where(informacao > 0,
+                           1.96 * _ELO_POR_LOG / np.sqrt(
+                               np.maximum(informacao, 1e-300)),
+                           np.inf)
+        return _ELO_POR_LOG * log_forca, margens
+
+    def classificacao(self) -> list:
+        """
+        Retorna a tabela de classificação, do maior para o menor Elo.
+
+        Returns:
+            list[tuple]: (nome, elo, margem, jogos) de cada participante.
+        """
+        elos, margens = self.ratings()
+        jogos = (self.vitorias + self.vitorias.T).sum(axis=1)
+        ordem = np.argsort(-elos)
+        return [(self.participantes[i].nome, float(elos[i]),
+                 float(margens[i]), int(jogos[i])) for i in ordem]
+
+
+if __name__ == "__main__":
+    import functools
+    import sys
+    from .mcts import EstrategiaMCTS
+
+    torneio = Torneio(semente=0, max_jogos=int(sys.argv[1])
+                      if len(sys.argv) > 1 else 400)
+    torneio.registra("aleatório")
+    torneio.registra("aleatório 2")
+    torneio.registra("mcts 50", TipoJogador.MCTS,
+                     functools.partial(EstrategiaMCTS, iteracoes=50))
+    torneio.executa()
+    for (i, j), decisao in torneio.decisoes.items():
+        nome_i = torneio.participantes[i].nome
+        nome_j = torneio.participantes[j].nome
+        jogos = torneio.vitorias[i, j] + torneio.vitorias[j, i]
+        resultado = {
+            ResultadoConfronto.I_MAIS_FORTE: f"{nome_i} é mais forte",
+            ResultadoConfronto.J_MAIS_FORTE: f"{nome_j} é mais forte",
+            ResultadoConfronto.EQUIVALENTES:
+                f"nenhum é {torneio.sprt.elo1:g} Elo mais forte",
+            ResultadoConfronto.INCONCLUSIVO: "inconclusivo",
+        }[decisao]
+        print(f"{nome_i} x {nome_j}: {torneio.vitorias[i, j]}-"
+              f"{torneio.vitorias[j, i]} em {jogos} jogos ({resultado})")
+    for nome, elo, margem, jogos in torneio.classificacao():
+        print(f"{nome:12s} {elo:+7.1f} ± {margem:5.1f}  ({jogos} jogos)")
@@ -0,0 +1,313 @@
+import numpy as np
+from .baralho import Baralho, ARQUIVO_CARTAS
+from .equipes import ORDEM_FALA
+from .jogada import Vencedor
+from .ponto import TipoPontos
+from .simulador import ResultadoSimulacao, MAX_MAOS
+
+# Valor de cada nível de aposta, na ordem da escada de TipoPontos
+VALORES_NIVEL = np.array([tipo.value for tipo in TipoPontos], dtype=np.int16)
+
+# Nível a partir do qual não se pode mais pedir truco
+NIVEL_QUEDA = len(TipoPontos) - 1
+
+# Pontuação que encerra o jogo
+PONTOS_VITORIA = TipoPontos.Queda.value
+
+_A = Vencedor.A.value
+_B = Vencedor.B.value
+_NENHUM = Vencedor.Nenhum.value
+
+
+class SimuladorVetorizado:
+    """
+    Simula muitos jogos entre máquinas em paralelo, usando arrays do NumPy.
+
+    Em vez de um objeto por jogo, o estado de K mesas é guardado em arrays
+    (estrutura de arrays) e todas as mesas avançam juntas, uma rodada por
+    iteração. As regras são as mesmas de `Jogo.comecar` com os jogadores
+    máquina de `Interface`:
+
+    * cada jogador, na sua vez, pede truco com probabilidade 1/2 se a mão
+      ainda não vale queda;
+    * quem responde aceita, corre ou aumenta com probabilidade 0,33, 0,33 e
+      0,34 (ou aceita e corre com 1/2 cada quando o pedido é de queda);
+    * a carta jogada é escolhida ao acaso entre as que restam na mão.
+
+    Como a escolha da carta não depende das cartas, jogar uma carta ao acaso
+    equivale a jogar as cartas na ordem (aleatória) em que foram distribuídas,
+    e é isso que o simulador faz. Assim como em `Jogo.comecar`, uma mão
+    empatada dá os pontos ao jogador B.
+
+    Quando um jogo termina, sua mesa recomeça com um novo jogo até que todos
+    os jogos pedidos tenham sido iniciados.
+
+    Com 4 ou 6 lugares, as mesas são de duplas ou trios, como em
+    `JogoEquipes`: a ordem de fala, o adversário que responde a cada pedido
+    e a equipe de cada lugar vêm das tabelas de `truco.equipes`, e a jogada
+    vai para a equipe da maior carta (empatando se as duas equipes a
+    jogaram). Cada mesa continua avançando uma rodada por iteração, então o
+    custo por mão cresce pouco com o número de lugares.
+
+    Atributos:
+        baralho (Baralho): Baralho usado nas distribuições.
+        num_mesas (int): Número de mesas simuladas simultaneamente.
+        num_lugares (int): Número de lugares em cada mesa.
+        rng (numpy.random.Generator): Gerador usado em todos os sorteios.
+
+    Métodos:
+        executa(num_jogos): Simula os jogos e retorna os resultados agregados.
+    """
+
+    def __init__(self, arquivo_csv: str = ARQUIVO_CARTAS,
+                 num_mesas: int = 4096, semente: int = None,
+                 num_lugares: int = 2):
+        """
+        Inicializa uma nova instância da classe SimuladorVetorizado.
+
+        Args:
+            arquivo_csv (str, opcional): Caminho para o arquivo CSV das cartas.
+            num_mesas (int, opcional): Número de mesas simuladas
+                simultaneamente. Padrão é 4096.
+            semente (int, opcional): Semente do gerador aleatório.
+            num_lugares (int, opcional): Lugares por mesa: 2, 4 ou 6. Padrão
+                é 2.
+
+        Raises:
+            ValueError: Se o número de lugares não for suportado.
+        """
+        if num_lugares not in ORDEM_FALA:
+            raise ValueError(f"Número de lugares não suportado: {num_lugares}.")
+        self.rng = np.random.default_rng(semente)
+        self.baralho = Baralho(arquivo_csv, self.rng)
+        self.num_mesas = num_mesas
+        self.num_lugares = num_lugares
+        # Tabelas de rodízio: ordem de fala a partir de cada lugar e equipe
+        # (0 para A, 1 para B) de cada lugar
+        self._ordem = np.array(ORDEM_FALA[num_lugares], dtype=np.int8)
+        self._equipe = np.arange(num_lugares, dtype=np.int8) % 2
+
+    def executa(self, num_jogos: int) -> ResultadoSimulacao:
+        """
+        Simula os jogos e retorna os resultados agregados.
+
+        Args:
+            num_jogos (int): Número total de jogos a simular.
+
+        Returns:
+            ResultadoSimulacao: Resultados agregados de todos os jogos.
+        """
+        self._resultado = ResultadoSimulacao()
+        self._aloca(min(self.num_mesas, num_jogos))
+        self._inicia_jogos(np.arange(self.ativo.size))
+        iniciados = self.ativo.size
+
+        while self.ativo.any():
+            self._nova_mao(np.flatnonzero(self.ativo & self.mao_acabou))
+
+            em_jogo = self.ativo.copy()
+            ordem = self._ordem[self.abre]
+            for posicao in range(self.num_lugares):
+                self._vez(em_jogo, ordem[:, posicao])
+            self._resolve_rodada(em_jogo, ordem)
+            self._pontua()
+
+            livres = np.flatnonzero(~self.ativo)[:num_jogos - iniciados]
+            if livres.size:
+                self._inicia_jogos(livres)
+                iniciados += livres.size
+
+        resultado = self._resultado
+        resultado.num_jogos = num_jogos
+        del self._resultado
+        return resultado
+
+    def _aloca(self, num_mesas: int):
+        """
+        Aloca os arrays de estado das mesas.
+
+        Args:
+            num_mesas (int): Número de mesas.
+        """
+        self.pontos = np.zeros((num_mesas, 2), dtype=np.int16)
+        self.maos = np.zeros(num_mesas, dtype=np.int16)
+        self.ativo = np.zeros(num_mesas, dtype=bool)
+        # Valores das cartas de cada jogador, na ordem em que serão jogadas
+        self.cartas = np.zeros((num_mesas, self.num_lugares, 3), dtype=np.int8)
+        # Vencedor de cada jogada da mão, com os códigos de Vencedor
+        self.vencedores = np.zeros((num_mesas, 3), dtype=np.int8)
+        self.rodada = np.zeros(num_mesas, dtype=np.int8)
+        self.nivel = np.zeros(num_mesas, dtype=np.int8)
+        # Lugar de quem abre a próxima jogada (com dois lugares, 0 para A e
+        # 1 para B)
+        self.abre = np.zeros(num_mesas, dtype=np.int8)
+        self.mao_acabou = np.zeros(num_mesas, dtype=bool)
+        # Equipe que recebe os pontos da mão encerrada e quantos pontos
+        self.ganhador = np.zeros(num_mesas, dtype=np.int8)
+        self.valor_mao = np.zeros(num_mesas, dtype=np.int16)
+
+    def _inicia_jogos(self, idx: np.ndarray):
+        """
+        Começa novos jogos nas mesas indicadas, sorteando quem abre.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas.
+        """
+        self.pontos[idx] = 0
+        self.maos[idx] = 0
+        self.ativo[idx] = True
+        self.mao_acabou[idx] = True
+        self.abre[idx] = self.rng.random(idx.size) * self.num_lugares
+
+    def _nova_mao(self, idx: np.ndarray):
+        """
+        Distribui as cartas de uma nova mão nas mesas indicadas.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas.
+        """
+        ids = self.baralho.distribui_lote(idx.size, num_maos=self.num_lugares)
+        self.cartas[idx] = self.baralho.valores[ids]
+        self.vencedores[idx] = _NENHUM
+        self.rodada[idx] = 0
+        self.nivel[idx] = 0
+        self.maos[idx] += 1
+        self.mao_acabou[idx] = False
+
+    def _encerra_mao(self, idx: np.ndarray, ganhador: np.ndarray,
+                     valor: np.ndarray, abre: np.ndarray):
+        """
+        Marca o fim da mão nas mesas indicadas.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas.
+            ganhador (numpy.ndarray): Equipe que recebe os pontos da mão.
+            valor (numpy.ndarray): Pontos da mão.
+            abre (numpy.ndarray): Lugar que abre a próxima mão.
+        """
+        self.mao_acabou[idx] = True
+        self.ganhador[idx] = ganhador
+        self.valor_mao[idx] = valor
+        self.abre[idx] = abre
+
+    def _vez(self, em_jogo: np.ndarray, jogador: np.ndarray):
+        """
+        Executa a vez de um jogador em cada mesa: o pedido de truco, se houver.
+
+        As mesas em que alguém correu são retiradas de `em_jogo`.
+
+        Args:
+            em_jogo (numpy.ndarray): Máscara das mesas com a mão em andamento.
+            jogador (numpy.ndarray): Lugar do jogador da vez em cada mesa.
+        """
+        idx = np.flatnonzero(em_jogo & (self.nivel < NIVEL_QUEDA))
+        self._resultado.oportunidades_truco += idx.size
+        idx = idx[self.rng.random(idx.size) < 0.5]
+        self._resultado.pedidos_truco += idx.size
+        self._negocia(idx, jogador[idx])
+        em_jogo &= ~self.mao_acabou
+
+    def _negocia(self, idx: np.ndarray, proponente: np.ndarray):
+        """
+        Resolve os pedidos de truco das mesas indicadas, com seus aumentos.
+
+        Args:
+            idx (numpy.ndarray): Índices das mesas com pedido de truco.
+            proponente (numpy.ndarray): Lugar de quem pediu em cada mesa.
+        """
+        resultado = self._resultado
+        proposto = self.nivel[idx] + 1
+        # Responde o adversário seguinte na ordem de fala
+        respondente = self._ordem[proponente, 1]
+
+        while idx.size:
+            resultado.respostas_truco += idx.size
+            sorteio = self.rng.random(idx.size)
+            queda = proposto == NIVEL_QUEDA
+            aceita = np.where(queda, sorteio < 0.5, sorteio < 0.33)
+            corre = ~aceita & (queda | (sorteio < 0.66))
+            aumenta = ~(aceita | corre)
+
+            self.nivel[idx[aceita]] = proposto[aceita]
+            resultado.aceites += np.count_nonzero(aceita)
+
+            # Quem pediu recebe o valor anterior ao pedido e abre a próxima mão
+            self._encerra_mao(idx[corre], self._equipe[proponente[corre]],
+                              VALORES_NIVEL[proposto[corre] - 1],
+                              proponente[corre])
+            resultado.corridas += np.count_nonzero(corre)
+
+            idx = idx[aumenta]
+            proposto = proposto[aumenta] + 1
+            proponente, respondente = (respondente[aumenta],
+                                       proponente[aumenta])
+            resultado.aumentos += idx.size
+
+    def _resolve_rodada(self, em_jogo: np.ndarray, ordem: np.ndarray):
+        """
+        Compara as cartas jogadas e encerra as mãos que terminaram.
+
+        A jogada vai para a equipe da maior carta, ou empata se as duas
+        equipes a jogaram; quem jogou primeiro a maior carta abre a próxima.
+
+        Args:
+            em_jogo (numpy.ndarray): Máscara das mesas em que todas as cartas
+                foram jogadas.
+            ordem (numpy.ndarray): Ordem de fala da rodada em cada mesa.
+        """
+        idx = np.flatnonzero(em_jogo)
+        rodada = self.rodada[idx]
+        cartas = self.cartas[idx, :, rodada]
+        maiores = cartas == cartas.max(axis=1, keepdims=True)
+        maior_A = maiores[:, 0::2].any(axis=1)
+        maior_B = maiores[:, 1::2].any(axis=1)
+        vencedor = np.where(maior_A & maior_B, _NENHUM,
+                            np.where(maior_A, _A, _B))
+        self.vencedores[idx, rodada] = vencedor
+        ordem = ordem[idx]
+        primeiro = np.take_along_axis(maiores, ordem, axis=1).argmax(axis=1)
+        self.abre[idx] = np.where(vencedor == _NENHUM, self.abre[idx],
+                                  ordem[np.arange(idx.size), primeiro])
+        rodada += 1
+        self.rodada[idx] = rodada
+
+        # Mesmas regras de Mao.mao_acabou
+        vencedores = self.vencedores[idx]
+        vitorias_A = np.count_nonzero(vencedores == _A, axis=1)
+        vitorias_B = np.count_nonzero(vencedores == _B, axis=1)
+        acabou = (rodada >= 3) | ((rodada == 2) & (
+            (vitorias_A == 2) | (vitorias_B == 2)
+            | (vencedores[:, 0] == _NENHUM) | (vencedores[:, 1] == _NENHUM)))
+
+        # Empate dá os pontos a B, como em Jogo.comecar
+        fim = idx[acabou]
+        ganhador = np.where(vitorias_A[acabou] > vitorias_B[acabou], 0, 1)
+        self._encerra_mao(fim, ganhador, VALORES_NIVEL[self.nivel[fim]],
+                          self.abre[fim])
+
+    def _pontua(self):
+        """
+        Atribui os pontos das mãos encerradas e finaliza os jogos decididos.
+        """
+        fim = np.flatnonzero(self.ativo & self.mao_acabou)
+        self.pontos[fim, self.ganhador[fim]] += self.valor_mao[fim]
+
+        pontos = self.pontos[fim]
+        fim = fim[(pontos >= PONTOS_VITORIA).any(axis=1)]
+        if not fim.size:
+            return
+
+        resultado = self._resultado
+        pontos = self.pontos[fim]
+        vencedor = (pontos[:, 1] > pontos[:, 0]).astype(np.intp)
+        resultado.vitorias += np.bincount(vencedor, minlength=2)
+        for posicao in range(2):
+            resultado.pontos[posicao] += np.bincount(
+                pontos[:, posicao], minlength=resultado.pontos.shape[1])
+        resultado.maos += np.bincount(self.maos[fim], minlength=MAX_MAOS)
+        self.ativo[fim] = False
+
+
+if __name__ == "__main__":
+    simulador = SimuladorVetorizado(semente=0)
+    print(simulador.executa(100000))